@@ -0,0 +1,54 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+"""
+Benchmark do simulador de combate (utils/combat_sim): party de fichas
+sintéticas contra um NPC, variando o número de iterações.
+Uso: python -m benchmarks.bench_combat_sim
+"""
+
+import time
+from utils import combat_sim
+
+def _sheet(hp: int, defesa: str, ataque: dict) -> dict:
+    return {
+        "atributos": {"Força": "16"},
+        "informacoes_basicas": {"sistema_rpg": "dnd"},
+        "informacoes_combate": {"vida_atual": hp, "vida_maxima": hp, "defesa": defesa},
+        "ataques": [ataque],
+    }
+
+def main():
+    party = [
+        combat_sim.combatant_from_sheet(_sheet(44, "18", {"nome": "Espada", "teste_de_acerto": "d20+MOD", "dano": "1d8+2", "margem_critico": 19}), "Guerreiro"),
+        combat_sim.combatant_from_sheet(_sheet(33, "15", {"nome": "Adagas", "teste_de_acerto": "2#d20+5", "dano": "1d4+3d6"}), "Ladino"),
+        combat_sim.combatant_from_sheet(_sheet(27, "12", {"nome": "Raio", "teste_de_acerto": "d20+6", "dano": "2d10"}), "Mago"),
+        combat_sim.combatant_from_sheet(_sheet(38, "16", {"nome": "Maça", "teste_de_acerto": "d20+4", "dano": "1d6+1d8"}), "Clérigo"),
+    ]
+    enemy = combat_sim.combatant_from_sheet(_sheet(178, "17", {"nome": "Mordida", "teste_de_acerto": "3#d20+10", "dano": "2d10+6"}), "Dragão Jovem")
+    print(f"{'iterações':>10} {'tempo (ms)':>11} {'vitória':>8} {'DPR':>7} {'rodadas':>8}")
+    for iterations in (1000, 10000, 100000):
+        start = time.perf_counter()
+        report = combat_sim.simulate(party, enemy, iterations, seed=1)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{iterations:>10} {elapsed:>11.1f} {report['vitoria']:>8.1%} "
+              f"{report['dpr_party']['media']:>7.2f} {report['rodadas_para_derrubar']['media']:>8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+"""
+Microbenchmark do caminho rápido de dados (utils/fast_dice) contra o d20.
+Uso: python -m benchmarks.bench_dice [repetições]
+"""
+
+import sys
+import time
+import d20
+from utils import dice_cache
+from utils.fast_dice import FastDice
+from utils.pool_dice import PoolDice, HAS_NUMPY
+
+EXPRESSIONS = ["1d20", "2d20kh1", "8d6", "4d6kh3", "4d6pl1", "20d6", "100d10kh10"]
+POOL_EXPRESSIONS = ["500d6", "1000d10kh10", "10000d6", "100000d10>=6"]
+
+def timeit(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def main(repeat: int = 5000):
+    print(f"{'expressão':<12} {'d20.roll (µs)':>14} {'AST (µs)':>10} {'rápido (µs)':>12} {'ganho':>7}")
+    for expr in EXPRESSIONS:
+        node = dice_cache.parse(expr)
+        fast = FastDice.parse(expr)
+        t_str = timeit(lambda: str(d20.roll(expr, allow_comments=True)), repeat)
+        t_ast = timeit(lambda: str(dice_cache.roll_parsed(node)), repeat)
+        t_fast = timeit(lambda: str(fast.roll()), repeat)
+        print(f"{expr:<12} {t_str:>14.1f} {t_ast:>10.1f} {t_fast:>12.1f} {t_str / t_fast:>6.1f}x")
+
+    print(f"\n{'pool':<14} {'python (µs)':>12} {'numpy (µs)':>12}")
+    for expr in POOL_EXPRESSIONS:
+        pool = PoolDice.parse(expr)
+        n = max(1, repeat // 100)
+        t_py = timeit(pool._roll_python, n)
+        t_np = f"{timeit(pool._roll_numpy, n):>12.1f}" if HAS_NUMPY else f"{'-':>12}"
+        print(f"{expr:<14} {t_py:>12.1f} {t_np}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
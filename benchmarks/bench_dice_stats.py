@@ -0,0 +1,46 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+"""
+Microbenchmark do motor de distribuições exatas (utils/dice_stats): primeira
+consulta (convolução) contra consultas repetidas (memoizadas).
+Uso: python -m benchmarks.bench_dice_stats
+"""
+
+import time
+from utils import dice_stats
+
+EXPRESSIONS = ["1d20+7", "2d20kh1+7", "4d6kh3", "8d6+4", "20d6", "100d10kh10", "200d6"]
+
+def main():
+    print(f"{'expressão':<12} {'fria (ms)':>10} {'memo (µs)':>10} {'média':>9} {'p90':>6}")
+    for expr in EXPRESSIONS:
+        dice_stats.dice_pmf.cache_clear()
+        dice_stats.expression_distribution.cache_clear()
+        start = time.perf_counter()
+        dist = dice_stats.expression_distribution(expr)
+        cold = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        for _ in range(1000):
+            dice_stats.expression_distribution(expr)
+        warm = (time.perf_counter() - start) * 1000
+        print(f"{expr:<12} {cold:>10.2f} {warm:>10.2f} {dist.mean():>9.2f} {dist.percentile(90):>6}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+"""
+Benchmark do fluxo contado (utils/dice_stream) contra o Mersenne Twister
+global (random.choices), em dados por segundo, para dados avulsos e lotes.
+Uso: python -m benchmarks.bench_dice_stream [iterações]
+"""
+
+import sys
+import time
+import random
+from utils.dice_stream import DiceStream
+
+def rate(fn, iterations: int, dice: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations * dice / (time.perf_counter() - start)
+
+def main(iterations: int = 2000):
+    stream = DiceStream(b"benchmark-seed!!", 1)
+    faces = range(1, 21)
+    for count in (1, 4, 100, 1000, 100000):
+        reps = max(1, iterations * 100 // count)
+        mt = rate(lambda: random.choices(faces, k=count), reps, count)
+        counted = rate(lambda: stream.draw("").dice(count, 20), reps, count)
+        print(f"{count:>7}d20  MT {mt:>14,.0f} dados/s   fluxo {counted:>14,.0f} dados/s  ({counted / mt:.1f}x)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,86 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+"""
+Benchmark do i18n.t com catálogo plano pré-compilado contra a busca antiga
+(split + caminhada no dict aninhado + str.format), em chamadas por segundo.
+Uso: python -m benchmarks.bench_i18n [iterações]
+"""
+
+import re
+import sys
+import time
+import random
+from utils import i18n
+
+def legacy_get(bundle: dict, dot_key: str):
+    cur = bundle
+    ok = True
+    for part in dot_key.split("."):
+        if isinstance(cur, dict) and part in cur:
+            cur = cur[part]
+        else:
+            ok = False
+            break
+    if ok:
+        return cur
+    return bundle.get(dot_key)
+
+def legacy_t(key: str, locale: str | None = None, **kwargs) -> str:
+    loc = i18n._normalize(locale)
+    text = legacy_get(i18n._load_bundle(loc), key)
+    if text is None and loc != i18n.DEFAULT_LOCALE:
+        text = legacy_get(i18n._load_bundle(i18n.DEFAULT_LOCALE), key)
+    if text is None:
+        text = key
+    if isinstance(text, str) and kwargs:
+        try:
+            text = text.format(**kwargs)
+        except Exception:
+            pass
+    return text
+
+def workload(size: int = 20000) -> list[tuple[str, str, dict]]:
+    rng = random.Random(7)
+    bundle = i18n._load_bundle(i18n.DEFAULT_LOCALE)
+    calls = []
+    for key in rng.choices(sorted(bundle), k=size):
+        names = re.findall(r"\{(\w+)\}", bundle[key])
+        calls.append((key, rng.choice(["pt", "en", "en-US"]), {n: 12 for n in names}))
+    return calls
+
+def rate(fn, calls: list, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for key, loc, kwargs in calls:
+            fn(key, loc, **kwargs)
+    return iterations * len(calls) / (time.perf_counter() - start)
+
+def main(iterations: int = 10):
+    calls = workload()
+    i18n.t("warmup", "pt")
+    formatted = sum(1 for _, _, kw in calls if kw)
+    old = rate(legacy_t, calls, iterations)
+    new = rate(i18n.t, calls, iterations)
+    print(f"{len(calls)} chaves sorteadas ({formatted} com campos)")
+    print(f"{'busca antiga':<16} {old:>12,.0f} chamadas/s")
+    print(f"{'catálogo plano':<16} {new:>12,.0f} chamadas/s  ({new / old:.1f}x)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,65 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+"""
+Benchmark do índice de busca de NPCs (autocomplete de /ver_npc e /rolar_npc).
+Uso: python -m benchmarks.bench_npc_search [quantidade]
+"""
+
+import sys
+import time
+import random
+from utils.npc_search import NameSearchIndex
+
+PREFIXES = ["Gob", "Orc", "Dra", "Lich", "Capitão", "Bandido", "Guarda", "Mago", "Sacerdote", "Lobo"]
+SUFFIXES = ["lin", "ar", "gão", "the Grey", "do Norte", "Sombrio", "Vermelho", "Ancião"]
+QUERIES = ["", "g", "go", "gob", "capi", "norte", "sombr", "drgao", "mago v", "xyz", "lobo anci"]
+
+def make_names(count: int) -> list[str]:
+    rng = random.Random(42)
+    return [f"{rng.choice(PREFIXES)}{rng.choice(SUFFIXES)} {i}" for i in range(count)]
+
+def linear_scan(names: list[str], query: str, limit: int = 25) -> list[str]:
+    query = query.lower()
+    out = []
+    for n in names:
+        if not query or query in n.lower():
+            out.append(n)
+            if len(out) >= limit:
+                break
+    return out
+
+def timeit(fn, repeat: int = 200) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def main(count: int = 10_000):
+    names = make_names(count)
+    start = time.perf_counter()
+    index = NameSearchIndex(names)
+    print(f"build: {count} nomes em {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"{'consulta':<12} {'índice (µs)':>12} {'scan (µs)':>12} {'resultados':>10}")
+    for q in QUERIES:
+        t_index = timeit(lambda: index.search(q))
+        t_scan = timeit(lambda: linear_scan(names, q))
+        print(f"{q!r:<12} {t_index:>12.1f} {t_scan:>12.1f} {len(index.search(q)):>10}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
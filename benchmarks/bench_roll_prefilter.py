@@ -0,0 +1,70 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+"""
+Benchmark do pré-filtro da rolagem livre (utils/roll_prefilter) contra as três
+regex antigas do CoreCog.on_message, em mensagens por segundo.
+Uso: python -m benchmarks.bench_roll_prefilter [arquivo_de_log]
+Sem arquivo usa um corpus sintético (uma mensagem por linha no arquivo).
+"""
+
+import re
+import sys
+import time
+import random
+from utils.roll_prefilter import recognize
+
+CHATTER = [
+    "alguém vai jogar hoje?", "kkkkkk", "o mestre sumiu de novo", "bora marcar sábado",
+    "eu ataco o goblin com a espada", "quanto de vida o ogro tem?", "lol", "brb",
+    "meu personagem tem d20 de sorte nenhuma", "acho que a gente devia descansar",
+    "e aí, rola 2d6 aí pra mim", "I cast fireball at the door", "gg", "https://example.com/mapa.png",
+]
+ROLLS = ["1d20+5", "d20", "adv d20+3", "3# d20+4", "4d6kh3", "2d8+2", "dis: d20 + 2", "8d6", "(2d6+3)*2"]
+
+def legacy(content: str) -> bool:
+    content = content.strip()
+    looks_like_roll = bool(re.search(r'(^\s*\d+\s*#)|(\bd\d+)|(\d+d\d+)', content, flags=re.IGNORECASE))
+    adv_token = re.match(r'^\s*(adv|vantagem|advantage)\b', content, flags=re.IGNORECASE)
+    dis_token = re.match(r'^\s*(dis|desvantagem|disadvantage)\b', content, flags=re.IGNORECASE)
+    return bool(looks_like_roll or adv_token or dis_token)
+
+def synthetic_corpus(size: int = 50000, roll_ratio: float = 0.05) -> list[str]:
+    rng = random.Random(7)
+    return [rng.choice(ROLLS) if rng.random() < roll_ratio else rng.choice(CHATTER) for _ in range(size)]
+
+def rate(fn, corpus: list[str]) -> tuple[float, int]:
+    start = time.perf_counter()
+    hits = sum(1 for msg in corpus if fn(msg))
+    return len(corpus) / (time.perf_counter() - start), hits
+
+def main(path: str | None = None):
+    if path:
+        with open(path, encoding="utf-8") as f:
+            corpus = [line.rstrip("\n") for line in f if line.strip()]
+    else:
+        corpus = synthetic_corpus()
+    old_rate, old_hits = rate(legacy, corpus)
+    new_rate, new_hits = rate(recognize, corpus)
+    print(f"{len(corpus)} mensagens")
+    print(f"{'regex antigas':<16} {old_rate:>12,.0f} msg/s  {old_hits:>6} disparos")
+    print(f"{'pré-filtro':<16} {new_rate:>12,.0f} msg/s  {new_hits:>6} disparos")
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
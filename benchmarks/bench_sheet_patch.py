@@ -0,0 +1,80 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+"""
+Benchmark de gravações de um campo numa ficha grande: regravação completa do
+JSON contra patch no journal, em bytes escritos e tempo por gravação.
+Uso: python -m benchmarks.bench_sheet_patch [gravações]
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+from utils import sheet_patch
+from utils.storage_backends import JsonFileBackend
+
+def big_sheet() -> dict:
+    return {
+        "informacoes_basicas": {"nome": "Bench", "sistema_rpg": "dnd"},
+        "ataques": [{"nome": f"Ataque {i}", "dano": "2d6+3", "descricao": "x" * 120} for i in range(40)],
+        "magias": {str(n): [{"nome": f"Magia {n}.{i}", "descricao": "y" * 200} for i in range(12)] for n in range(10)},
+        "inventario": {f"categoria_{c}": [f"item {i}" for i in range(30)] for c in range(8)},
+        "pets": [{"nome": f"Pet {i}", "ficha": {"hp": 10, "notas": "z" * 300}} for i in range(5)],
+        "carga": {"atual": "0", "maxima": "100"},
+    }
+
+def journal_size(path: str) -> int:
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+def run(backend: JsonFileBackend, writes: int, patch: bool) -> tuple[int, float]:
+    key = "bench_patch" if patch else "bench_full"
+    data = big_sheet()
+    backend.save_player(key, data)
+    path = backend.player_path(key)
+    journal = backend.journal_path(path)
+    written = 0
+    start = time.perf_counter()
+    for i in range(writes):
+        value = {"atual": str(i), "maxima": "100"}
+        if patch:
+            before = journal_size(journal)
+            backend.patch_player(key, [sheet_patch.set_path("carga", value)], i + 1)
+            after = journal_size(journal)
+            # Journal encolheu: houve compactação, que regrava o JSON base.
+            written += after - before if after > before else os.path.getsize(path)
+        else:
+            data["carga"] = value
+            backend.save_player(key, data)
+            written += os.path.getsize(path)
+    return written, time.perf_counter() - start
+
+def main(writes: int = 200):
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = JsonFileBackend(os.path.join(tmp, "players"), os.path.join(tmp, "npcs"), os.path.join(tmp, "srv"))
+        full_bytes, full_s = run(backend, writes, patch=False)
+        patch_bytes, patch_s = run(backend, writes, patch=True)
+        size = len(json.dumps(big_sheet(), indent=4))
+        print(f"ficha de {size / 1024:.0f} KiB, {writes} gravações de um campo, compactação a cada {backend.compact_entries}")
+        print(f"{'ficha inteira':<14} {full_bytes / writes:>10,.0f} bytes/gravação  {full_s / writes * 1000:>7.2f} ms")
+        print(f"{'patch':<14} {patch_bytes / writes:>10,.0f} bytes/gravação  {patch_s / writes * 1000:>7.2f} ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
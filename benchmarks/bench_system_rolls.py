@@ -0,0 +1,51 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+"""
+Benchmark dos motores nativos de sistema (utils/system_rolls) contra a
+rolagem de d20 em string pelo dice_roller, em rolagens por segundo.
+Uso: python -m benchmarks.bench_system_rolls [iterações]
+"""
+
+import sys
+import time
+import random
+from utils.dice_roller import _evaluate
+from utils.system_rolls import VampiroEngine, CthulhuEngine, OrdemEngine
+
+def rate(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+def main(iterations: int = 50000):
+    rng = random.Random(7)
+    vampiro, cthulhu, ordem = VampiroEngine(), CthulhuEngine(), OrdemEngine()
+    cases = [
+        ("d20 string", lambda: _evaluate("1d20+5")),
+        ("vampiro 7 (2 fome)", lambda: vampiro.roll(7, 2, rng=rng)),
+        ("cthulhu 60 +1 bônus", lambda: cthulhu.roll(60, bonus_dice=1, rng=rng)),
+        ("ordem 3d20 +5", lambda: ordem.roll(3, 5, rng=rng)),
+    ]
+    for label, fn in cases:
+        print(f"{label:<22} {rate(fn, iterations):>12,.0f} rolagens/s")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -20,21 +20,10 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from utils.checks import is_app_owner
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
-from utils import mestre_utils
-
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
+from utils.storage import store
+from utils import roll_channels, dice_cost
 
 def localized_command(name_pt, desc_pt, name_en, desc_en):
     def decorator(func):
@@ -61,7 +50,7 @@ class AdminCog(commands.Cog):
             msg = _tr("admin.guild_only", loc, "❌ Este comando só pode ser usado em um servidor.")
             return await interaction.response.send_message(msg, ephemeral=True)
 
-        if mestre_utils.verificar_mestre(guild.name, interaction.user.id):
+        if await store.is_mestre(guild.id, interaction.user.id, guild.name):
             msg = _tr("admin.already_gm", loc, "✅ Você já é Mestre neste servidor.")
             return await interaction.response.send_message(msg, ephemeral=True)
 
@@ -100,7 +89,7 @@ class AdminCog(commands.Cog):
             return await interaction.response.send_message(msg, ephemeral=True)
 
         try:
-            mestre_utils.registrar_mestre(guild.name, interaction.user.id)
+            await store.add_mestre(guild.id, interaction.user.id, interaction.user.display_name, guild.name)
         except Exception:
             warn = _tr("admin.register.warn", loc,
                        "⚠️ Cargo atribuído, mas houve um problema ao registrar você como Mestre internamente.")
@@ -114,6 +103,78 @@ class AdminCog(commands.Cog):
                   created=created_txt)
         await interaction.response.send_message(msg, ephemeral=True)
 
+    @localized_command(
+        name_pt="canal_rolagem", desc_pt="Liga/desliga a rolagem livre (mensagens como 1d20+5) neste canal.",
+        name_en="roll_channel", desc_en="Toggle free-text rolls (messages like 1d20+5) in this channel."
+    )
+    @app_commands.describe(todos="Remove o filtro: rolagem livre em todos os canais / Remove the filter: free rolls everywhere")
+    @app_commands.guild_only()
+    @app_commands.default_permissions(manage_guild=True)
+    async def canal_rolagem(self, interaction: discord.Interaction, todos: bool = False):
+        loc = resolve_locale(interaction, fallback="pt")
+        guild: discord.Guild | None = interaction.guild
+
+        if guild is None:
+            msg = _tr("admin.guild_only", loc, "❌ Este comando só pode ser usado em um servidor.")
+            return await interaction.response.send_message(msg, ephemeral=True)
+
+        if todos:
+            await roll_channels.clear_channels(guild.id)
+            msg = _tr("admin.roll_channel.cleared", loc, "✅ Filtro removido: a rolagem livre funciona em todos os canais.")
+            return await interaction.response.send_message(msg, ephemeral=True)
+
+        channel = interaction.channel
+        enabled = await roll_channels.toggle_channel(guild.id, channel.id)
+        if enabled:
+            msg = _tr("admin.roll_channel.enabled", loc,
+                      "✅ Rolagem livre liberada em {channel}. Agora ela só funciona nos canais liberados.",
+                      channel=channel.mention)
+        elif await roll_channels.allowed_channels(guild.id) is None:
+            msg = _tr("admin.roll_channel.cleared", loc, "✅ Filtro removido: a rolagem livre funciona em todos os canais.")
+        else:
+            msg = _tr("admin.roll_channel.disabled", loc, "🚫 Rolagem livre desligada em {channel}.",
+                      channel=channel.mention)
+        await interaction.response.send_message(msg, ephemeral=True)
+
+    @localized_command(
+        name_pt="limites_dados", desc_pt="Mostra ou ajusta os limites de custo das rolagens neste servidor.",
+        name_en="dice_limits", desc_en="Show or tighten the dice cost limits on this server."
+    )
+    @app_commands.describe(
+        dados="Máximo de dados por rolagem / Max dice per roll",
+        lados="Maior dado permitido / Largest die allowed",
+        profundidade="Máximo de parênteses aninhados / Max nested parentheses",
+        termos="Máximo de termos / Max terms",
+        padrao="Volta aos limites padrão / Reset to the default limits",
+    )
+    @app_commands.guild_only()
+    @app_commands.default_permissions(manage_guild=True)
+    async def limites_dados(self, interaction: discord.Interaction,
+                            dados: app_commands.Range[int, 1] | None = None,
+                            lados: app_commands.Range[int, 2] | None = None,
+                            profundidade: app_commands.Range[int, 1] | None = None,
+                            termos: app_commands.Range[int, 1] | None = None,
+                            padrao: bool = False):
+        loc = resolve_locale(interaction, fallback="pt")
+        guild: discord.Guild | None = interaction.guild
+
+        if guild is None:
+            msg = _tr("admin.guild_only", loc, "❌ Este comando só pode ser usado em um servidor.")
+            return await interaction.response.send_message(msg, ephemeral=True)
+
+        values = {"max_dice": dados, "max_sides": lados, "max_depth": profundidade, "max_terms": termos}
+        if padrao:
+            limits = await dice_cost.set_guild_limits(guild.id, None)
+        elif any(v is not None for v in values.values()):
+            limits = await dice_cost.set_guild_limits(guild.id, values)
+        else:
+            limits = await dice_cost.limits_for(guild.id)
+
+        msg = _tr("admin.dice_limits.current", loc,
+                  "🎲 Limites de rolagem: até **{dice}** dados, d**{sides}**, **{depth}** parênteses aninhados e **{terms}** termos.",
+                  dice=limits.max_dice, sides=limits.max_sides, depth=limits.max_depth, terms=limits.max_terms)
+        await interaction.response.send_message(msg, ephemeral=True)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(AdminCog(bot))
@@ -16,27 +16,16 @@
 # from the software and are NOT covered by the AGPL. They remain the
 # exclusive property of the author.
 
-import re
 import discord
 from discord.ext import commands
 from discord import app_commands
-from utils import dice_roller
-from utils.i18n import t as t_raw
+from utils import dice_roller, roll_channels
+from utils.roll_prefilter import recognize
+from utils.dice_executor import DiceRejected
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 from view.rolling.dice_hub_view import DiceHubView
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
 
 def localized_command(name_pt, desc_pt, name_en, desc_en):
     def decorator(func):
@@ -85,53 +74,50 @@ class CoreCog(commands.Cog):
         view = DiceHubView(user=interaction.user, loc=loc)
         await interaction.response.send_message(content=title, view=view, ephemeral=True)
 
+    @localized_command(
+        name_pt="reproduzir_rolagem", desc_pt="Refaz uma rolagem a partir do ticket, para conferir o resultado.",
+        name_en="replay_roll", desc_en="Re-derive a roll from its ticket to audit the result."
+    )
+    @app_commands.describe(
+        ticket="Ticket mostrado no rodapé da rolagem / Ticket shown in the roll footer",
+        expressao="Expressão original, se o ticket for antigo / Original expression for old tickets",
+    )
+    async def reproduzir_rolagem(self, interaction: discord.Interaction, ticket: str, expressao: str | None = None):
+        loc = resolve_locale(interaction, fallback="pt")
+        guild_id = interaction.guild.id if interaction.guild else None
+        result = await dice_roller.replay_roll(ticket, expressao, guild_id=guild_id, locale=loc)
+        if result is None:
+            msg = _tr("roll.replay.not_found", loc,
+                      "❌ Ticket desconhecido. Para tickets de antes do último reinício, informe também a expressão.")
+            return await interaction.response.send_message(msg, ephemeral=True)
+        embed = discord.Embed(
+            title=_tr("roll.replay.title", loc, "🔁 Rolagem {ticket}", ticket=result.ticket),
+            description=f"## {result.total}",
+            color=discord.Color.blurple()
+        )
+        embed.add_field(name=_tr("roll.free.details", loc, "Detalhes"), value=f"`{result.breakdown}`", inline=False)
+        embed.set_footer(text=result.expression)
+        await interaction.response.send_message(embed=embed)
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
-        if not message.content or message.author.bot:
+        if message.author.bot:
             return
-
-        content = message.content.strip()
-        looks_like_roll = bool(re.search(r'(^\s*\d+\s*#)|(\bd\d+)|(\d+d\d+)', content, flags=re.IGNORECASE))
-        adv_token = re.match(r'^\s*(adv|vantagem|advantage)\b', content, flags=re.IGNORECASE)
-        dis_token = re.match(r'^\s*(dis|desvantagem|disadvantage)\b', content, flags=re.IGNORECASE)
-
-        if not (looks_like_roll or adv_token or dis_token):
+        # Conversa comum sai aqui, numa única varredura, antes de qualquer I/O.
+        parsed = recognize(message.content)
+        if parsed is None:
+            return
+        if message.guild is not None and not await roll_channels.is_enabled(
+                message.guild.id, message.channel.id, getattr(message.channel, "parent_id", None)):
             return
 
         loc = _guess_message_locale(message)
 
         try:
-            expr = content
-            advantage_state = "normal"
-            if adv_token:
-                advantage_state = "vantagem"
-                expr = re.sub(r'^\s*(adv|vantagem|advantage)\b[:\-]*\s*', '', expr, flags=re.IGNORECASE)
-            elif dis_token:
-                advantage_state = "desvantagem"
-                expr = re.sub(r'^\s*(dis|desvantagem|disadvantage)\b[:\-]*\s*', '', expr, flags=re.IGNORECASE)
-
-            repeat = 1
-            m_repeat = re.match(r'^\s*(\d+)\s*#\s*(.+)$', expr, flags=re.IGNORECASE)
-            if m_repeat:
-                repeat = max(1, int(m_repeat.group(1)))
-                expr = m_repeat.group(2).strip()
-
-            def _apply_adv(expr_in: str, mode: str) -> str:
-                if mode not in ("vantagem", "desvantagem"):
-                    return expr_in
-                def repl(match):
-                    prefix = match.group(1) or ""
-                    if mode == "vantagem":
-                        return f"{prefix}2d20kh1"
-                    return f"{prefix}2d20kl1"
-                return re.sub(r'(?i)\b(\d*)d20\b(?!k[hl]\d)', repl, expr_in, count=1)
-
-            expr = _apply_adv(expr, advantage_state)
-            expr = re.sub(r'(?i)(^|[^0-9a-zA-Z_])d(\d+)', r'\g<1>1d\2', expr)
-            results = []
-            for _ in range(repeat):
-                total, breakdown = await dice_roller.roll_dice(expr)
-                results.append((total, breakdown))
+            repeat = parsed.repeat
+            results = await dice_roller.roll_many(parsed.expr, repeat, user_id=message.author.id,
+                                                  channel_id=message.channel.id,
+                                                  guild_id=message.guild.id if message.guild else None)
 
             title_single = _tr("roll.free.title.single", loc, "🎲 Rolagem")
             title_multi = _tr("roll.free.title.multi", loc, "🎲 Rolagens ({count})", count=repeat)
@@ -155,10 +141,16 @@ class CoreCog(commands.Cog):
                     lines.append(f"**#{i}** → **{total}**  ·  `{breakdown}`")
                 embed.description = "\n".join(lines)
 
+            if results[0].ticket:
+                ticket = results[0].ticket if repeat == 1 else f"{results[0].ticket} … {results[-1].ticket}"
+                embed.set_footer(text=_tr("roll.free.ticket", loc, "🔁 Ticket {ticket}", ticket=ticket))
             embed.set_author(name=message.author.display_name, icon_url=message.author.display_avatar.url)
 
             await message.channel.send(embed=embed)
 
+        except DiceRejected:
+            busy = _tr("roll.free.busy", loc, "⏳ Muitas rolagens ao mesmo tempo. Tente de novo em instantes.")
+            await message.channel.send(busy)
         except Exception:
             err = _tr("roll.free.error", loc, "❌ Não consegui interpretar essa rolagem. Tente algo como `1d20+5`.")
             await message.channel.send(err)
@@ -20,21 +20,9 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from discord.utils import get as dget
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    try:
-        txt = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if txt == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return txt
-
 def localized_command(name_pt, desc_pt, name_en, desc_en):
     def decorator(func):
         cmd = app_commands.command(name=name_pt, description=desc_pt)(func)
@@ -20,26 +20,17 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from typing import List
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
-from utils import mestre_utils
+from utils.storage import store
 from utils.npc_utils import NPCContext
 from utils.embed_utils import create_npc_summary_embed
 from view.ficha_npc.gm_npc_sheet_view import GMNPCSheetView
 from view.rolling.npc_dice_hub_view import NPCDiceHubView
 from view.ficha_npc.npc_main_menu_view import NPCSelectView
-
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
+from utils import combat_sim
+from utils.dice_executor import DiceRejected
+from utils.dice_stats import UnsupportedDistribution
 
 
 def localized_command_en_base(name_en: str, desc_en: str, *, pt_name: str, pt_desc: str):
@@ -72,29 +63,10 @@ class NPCCog(commands.Cog):
         if guild is None:
             return []
 
-        query = (current or "").lower()
         user_id = interaction.user.id
-        guild_id = guild.id
-
-        choices: List[app_commands.Choice[str]] = []
-
-        if mestre_utils.verificar_mestre(guild.name, user_id):
-            names = NPCContext.list_npcs(guild_id, user_id)
-            for n in names:
-                if (not query) or (query in n.lower()):
-                    choices.append(app_commands.Choice(name=n, value=n))
-        else:
-            names = NPCContext.list_npcs(guild_id, user_id)
-            for n in names:
-                try:
-                    data = NPCContext(guild_id, user_id, n).load()
-                    if data.get("visivel_para_players"):
-                        if (not query) or (query in n.lower()):
-                            choices.append(app_commands.Choice(name=n, value=n))
-                except Exception:
-                    continue
-
-        return choices[:25]
+        owner_id = user_id if await store.is_mestre(guild.id, user_id, guild.name) else None
+        names = await store.search_npcs(guild.id, owner_id, current, limit=25)
+        return [app_commands.Choice(name=n, value=n) for n in names]
 
     @localized_command_en_base(
         name_en="npc_menu",
@@ -109,7 +81,7 @@ class NPCCog(commands.Cog):
             msg = _tr("npc.menu.guild_only", loc, "❌ This command can only be used in a server.")
             return await interaction.response.send_message(msg, ephemeral=True)
 
-        if not mestre_utils.verificar_mestre(guild.name, interaction.user.id):
+        if not await store.is_mestre(guild.id, interaction.user.id, guild.name):
             msg = _tr("npc.menu.only_master", loc, "❌ Only GMs can open the NPC menu.")
             return await interaction.response.send_message(msg, ephemeral=True)
 
@@ -134,17 +106,24 @@ class NPCCog(commands.Cog):
 
         ctx = NPCContext(guild.id, interaction.user.id, nome)
         try:
-            npc_data = ctx.load()
+            npc_data = await store.get_npc(ctx)
         except FileNotFoundError:
             msg = _tr("npc.view.not_found", loc, "❌ NPC **{name}** was not found.", name=nome)
             return await interaction.response.send_message(msg, ephemeral=True)
 
-        if mestre_utils.verificar_mestre(guild.name, interaction.user.id):
+        if await store.is_mestre(guild.id, interaction.user.id, guild.name):
             view = GMNPCSheetView(npc_context=ctx)
             embed = await view.create_embed(interaction)
             header = _tr("npc.view.master_header", loc, "👁️ GM View: **{name}** sheet", name=nome)
             return await interaction.response.send_message(content=header, embed=embed, view=view, ephemeral=True)
 
+        if not npc_data:
+            visible_ctx = await store.find_visible_npc(guild.id, nome)
+            if visible_ctx is None:
+                msg = _tr("npc.view.not_found", loc, "❌ NPC **{name}** was not found.", name=nome)
+                return await interaction.response.send_message(msg, ephemeral=True)
+            npc_data = await store.get_npc(visible_ctx)
+
         if not npc_data.get("visivel_para_players"):
             msg = _tr("npc.view.hidden", loc, "🔒 This NPC is hidden from players.")
             return await interaction.response.send_message(msg, ephemeral=True)
@@ -167,13 +146,13 @@ class NPCCog(commands.Cog):
             msg = _tr("npc.roll.guild_only", loc, "❌ This command can only be used in a server.")
             return await interaction.response.send_message(msg, ephemeral=True)
 
-        if not mestre_utils.verificar_mestre(guild.name, interaction.user.id):
+        if not await store.is_mestre(guild.id, interaction.user.id, guild.name):
             msg = _tr("npc.roll.only_master", loc, "❌ Only GMs can roll for NPCs.")
             return await interaction.response.send_message(msg, ephemeral=True)
 
         ctx = NPCContext(guild.id, interaction.user.id, nome)
         try:
-            ctx.load()
+            await store.get_npc(ctx)
         except FileNotFoundError:
             msg = _tr("npc.roll.not_found", loc, "❌ NPC **{name}** was not found.", name=nome)
             return await interaction.response.send_message(msg, ephemeral=True)
@@ -183,5 +162,93 @@ class NPCCog(commands.Cog):
         await interaction.response.send_message(content=header, view=view, ephemeral=True)
 
 
+    @localized_command_en_base(
+        name_en="simulate_combat",
+        desc_en="Simulate a party of players against an NPC (win rate, DPR, rounds to kill).",
+        pt_name="simular_combate",
+        pt_desc="Simula a party de jogadores contra um NPC (vitória, DPR, rodadas até derrubar).",
+    )
+    @app_commands.describe(
+        inimigo="NPC enemy / NPC inimigo",
+        jogador1="Party member / Membro da party",
+        jogador2="Party member / Membro da party",
+        jogador3="Party member / Membro da party",
+        jogador4="Party member / Membro da party",
+        iteracoes="Number of simulated fights / Número de combates simulados",
+    )
+    @app_commands.autocomplete(inimigo=_autocomplete_npc_names)
+    async def simular_combate(self, interaction: discord.Interaction, inimigo: str, jogador1: discord.Member,
+                              jogador2: discord.Member | None = None, jogador3: discord.Member | None = None,
+                              jogador4: discord.Member | None = None,
+                              iteracoes: app_commands.Range[int, 100, combat_sim.SIM_MAX_ITERATIONS] = 10000):
+        loc = resolve_locale(interaction, fallback="pt")
+        guild = interaction.guild
+        if guild is None:
+            msg = _tr("npc.sim.guild_only", loc, "❌ This command can only be used in a server.")
+            return await interaction.response.send_message(msg, ephemeral=True)
+
+        if not await store.is_mestre(guild.id, interaction.user.id, guild.name):
+            msg = _tr("npc.sim.only_master", loc, "❌ Only GMs can run combat simulations.")
+            return await interaction.response.send_message(msg, ephemeral=True)
+
+        ctx = NPCContext(guild.id, interaction.user.id, inimigo)
+        try:
+            npc_data = await store.get_npc(ctx)
+        except FileNotFoundError:
+            npc_data = None
+        if not npc_data:
+            msg = _tr("npc.roll.not_found", loc, "❌ NPC **{name}** was not found.", name=inimigo)
+            return await interaction.response.send_message(msg, ephemeral=True)
+
+        membros = [m for m in (jogador1, jogador2, jogador3, jogador4) if m is not None]
+        await interaction.response.defer(thinking=True)
+        try:
+            party = []
+            for membro in membros:
+                character_name = f"{membro.id}_{membro.name.lower()}"
+                if not await store.player_exists(character_name):
+                    msg = _tr("npc.sim.no_sheet", loc, "❌ **{name}** has no character sheet.",
+                              name=membro.display_name)
+                    return await interaction.followup.send(msg, ephemeral=True)
+                ficha = await store.get_player(character_name)
+                party.append(combat_sim.combatant_from_sheet(ficha, membro.display_name))
+            enemy = combat_sim.combatant_from_sheet(npc_data, inimigo)
+            report = await combat_sim.run_simulation(party, enemy, iteracoes,
+                                                     user_id=interaction.user.id,
+                                                     channel_id=interaction.channel_id)
+        except DiceRejected:
+            msg = _tr("npc.sim.busy", loc, "⏳ A simulation is already running. Try again in a moment.")
+            return await interaction.followup.send(msg, ephemeral=True)
+        except combat_sim.SimulationUnavailable:
+            msg = _tr("npc.sim.unavailable", loc, "❌ The combat simulator is not available on this bot.")
+            return await interaction.followup.send(msg, ephemeral=True)
+        except (UnsupportedDistribution, ValueError):
+            msg = _tr("npc.sim.unsupported", loc,
+                      "❌ Some attack formula is too complex for the simulator.")
+            return await interaction.followup.send(msg, ephemeral=True)
+
+        embed = discord.Embed(
+            title=_tr("npc.sim.title", loc, "⚔️ Party vs {name}", name=inimigo),
+            description=_tr("npc.sim.summary", loc,
+                            "Win: **{win:.1%}** · Wipe: **{wipe:.1%}** · No result: {none:.1%}",
+                            win=report["vitoria"], wipe=report["derrota"], none=report["sem_resultado"]),
+            color=discord.Color.dark_red()
+        )
+        ttk = report["rodadas_para_derrubar"]
+        ttk_value = f"{ttk['media']:.1f} ± {ttk['desvio']:.1f}"
+        if ttk["percentis"]:
+            ttk_value += "\n" + " · ".join(f"p{p}: {v}" for p, v in ttk["percentis"].items())
+        embed.add_field(name=_tr("npc.sim.ttk", loc, "⏱️ Rounds to kill"), value=ttk_value, inline=False)
+        dpr = report["dpr_party"]
+        linhas = [f"**Party:** {dpr['media']:.1f} ± {dpr['desvio']:.1f}"]
+        linhas += [f"{m['nome']}: {m['media']:.1f} ± {m['desvio']:.1f}" for m in report["dpr_membros"]]
+        inimigo_dpr = report["dpr_inimigo"]
+        linhas.append(f"**{inimigo}:** {inimigo_dpr['media']:.1f} ± {inimigo_dpr['desvio']:.1f}")
+        embed.add_field(name=_tr("npc.sim.dpr", loc, "🗡️ Damage per round"), value="\n".join(linhas), inline=False)
+        embed.set_footer(text=_tr("npc.sim.footer", loc, "{n} simulated fights · up to {rounds} rounds",
+                                  n=report["iteracoes"], rounds=report["rodadas_max"]))
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+
 async def setup(bot: commands.Bot):
-    await bot.add_cog(NPCCog(bot))
\ No newline at end of file
+    await bot.add_cog(NPCCog(bot))
\ No newline at end of file
@@ -19,24 +19,16 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from utils import player_utils, mestre_utils
-from utils.i18n import t as t_raw
+from utils.storage import store
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 from view.ficha_player.ficha_player_menu import PlayerMainMenuView
 from view.ficha_player.personal_sheet_view import PersonalSheetView
 from utils.embed_utils import create_player_summary_embed
+from utils import dice_stats
 from models.shared_models.add_pet_modal import AddPetModal
 from view.pet_view.npc_pet_selector_view import NPCPetSelectorView
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        return fallback.format(**kwargs) if kwargs else fallback
-    return text
-
 def localized_command(name_pt, desc_pt, name_en, desc_en):
     def decorator(func):
         cmd = app_commands.command(name=name_pt, description=desc_pt)(func)
@@ -49,6 +41,17 @@ class PlayerCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+    async def _autocomplete_attacks(self, interaction: discord.Interaction, current: str):
+        character_name = f"{interaction.user.id}_{interaction.user.name.lower()}"
+        if not await store.player_exists(character_name):
+            return []
+        ataques = (await store.get_player(character_name)).get("ataques", [])
+        if isinstance(ataques, dict):
+            ataques = list(ataques.values())
+        alvo = current.strip().lower()
+        nomes = [a.get("nome", "") for a in ataques if isinstance(a, dict) and alvo in str(a.get("nome", "")).lower()]
+        return [app_commands.Choice(name=n[:100], value=n[:100]) for n in nomes[:25] if n]
+
     @localized_command(
         name_pt="player_menu", desc_pt="Abrir o menu do player",
         name_en="player_menu", desc_en="Open the player menu"
@@ -69,7 +72,7 @@ class PlayerCog(commands.Cog):
     async def minha_ficha(self, interaction: discord.Interaction):
         loc = resolve_locale(interaction, fallback="pt")
         character_name = f"{interaction.user.id}_{interaction.user.name.lower()}"
-        if not player_utils.player_sheet_exists(character_name):
+        if not await store.player_exists(character_name):
             msg = _tr("player.sheet.missing", loc, "❌ Você ainda não tem uma ficha! Use `/player_menu` para começar.")
             return await interaction.response.send_message(msg, ephemeral=True)
         view = PersonalSheetView(user=interaction.user)
@@ -84,19 +87,19 @@ class PlayerCog(commands.Cog):
     async def ver_player(self, interaction: discord.Interaction, jogador: discord.Member):
         loc = resolve_locale(interaction, fallback="pt")
         character_name = f"{jogador.id}_{jogador.name.lower()}"
-        if not player_utils.player_sheet_exists(character_name):
+        if not await store.player_exists(character_name):
             msg = _tr("player.sheet.other_missing", loc, "❌ O jogador **{name}** ainda não possui uma ficha.",
                       name=jogador.display_name)
             return await interaction.response.send_message(msg, ephemeral=True)
 
-        if mestre_utils.verificar_mestre(interaction.guild.name, interaction.user.id):
+        if await store.is_mestre(interaction.guild_id, interaction.user.id, interaction.guild.name):
             view = PersonalSheetView(user=jogador)
             embed = await view.create_embed()
             header = _tr("player.sheet.master_view", loc, "👁️ Visão de Mestre: Ficha completa de **{name}**",
                          name=jogador.display_name)
             await interaction.response.send_message(header, embed=embed, view=view, ephemeral=True)
         else:
-            ps = player_utils.load_player_sheet(character_name)
+            ps = await store.get_player(character_name)
             embed = create_player_summary_embed(ps, jogador)
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -109,24 +112,79 @@ class PlayerCog(commands.Cog):
         guild_name = interaction.guild.name
         user_id = interaction.user.id
 
-        if mestre_utils.verificar_mestre(guild_name, user_id):
+        if await store.is_mestre(interaction.guild_id, user_id, guild_name):
             view = NPCPetSelectorView(interaction.guild_id, user_id)
             msg = _tr("pet.master.prompt", loc, "Você é um mestre. Selecione um NPC para registrar um pet para ele:")
             await interaction.response.send_message(msg, view=view, ephemeral=True)
             return
 
-        modal = AddPetModal()
+        modal = AddPetModal(interaction, locale=loc)
         await interaction.response.send_modal(modal)
         await modal.wait()
         if modal.pet_data:
             character_name = f"{user_id}_{interaction.user.name.lower()}"
-            player_sheet = player_utils.load_player_sheet(character_name)
-            pets_list = player_sheet.setdefault("pets", [])
-            pets_list.append(modal.pet_data)
-            player_utils.save_player_sheet(character_name, player_sheet)
+            await store.update_player(
+                character_name,
+                lambda ficha: ficha.setdefault("pets", []).append(modal.pet_data)
+            )
             msg = _tr("pet.player.saved", loc, "🐾 Pet **{pet}** foi registrado para seu personagem!",
                       pet=modal.pet_data['nome'])
             await interaction.followup.send(msg, ephemeral=True)
 
+    @localized_command(
+        name_pt="estatisticas_ataque", desc_pt="Chance de acerto e dano esperado de um ataque da sua ficha contra uma CA.",
+        name_en="attack_stats", desc_en="Hit chance and expected damage of one of your attacks against an AC."
+    )
+    @app_commands.describe(
+        ataque="Ataque da sua ficha / Attack from your sheet",
+        ca="CA do alvo / Target AC",
+        vantagem="Vantagem ou desvantagem no acerto / Advantage or disadvantage on the hit",
+    )
+    @app_commands.choices(vantagem=[
+        app_commands.Choice(name="Normal", value="normal"),
+        app_commands.Choice(name="Vantagem / Advantage", value="vantagem"),
+        app_commands.Choice(name="Desvantagem / Disadvantage", value="desvantagem"),
+    ])
+    @app_commands.autocomplete(ataque=_autocomplete_attacks)
+    async def estatisticas_ataque(self, interaction: discord.Interaction, ataque: str,
+                                  ca: app_commands.Range[int, 0, 60], vantagem: str = "normal"):
+        loc = resolve_locale(interaction, fallback="pt")
+        character_name = f"{interaction.user.id}_{interaction.user.name.lower()}"
+        if not await store.player_exists(character_name):
+            msg = _tr("player.sheet.missing", loc, "❌ Você ainda não tem uma ficha! Use `/player_menu` para começar.")
+            return await interaction.response.send_message(msg, ephemeral=True)
+        ficha = await store.get_player(character_name)
+        selected_attack = dice_stats.find_attack(ficha, ataque)
+        if selected_attack is None:
+            msg = _tr("player.attack.stats.not_found", loc, "❌ Ataque **{name}** não encontrado na sua ficha.", name=ataque)
+            return await interaction.response.send_message(msg, ephemeral=True)
+        try:
+            stats = dice_stats.attack_stats(ficha, selected_attack, ca, vantagem)
+        except (dice_stats.UnsupportedDistribution, ValueError):
+            msg = _tr("player.attack.stats.unsupported", loc,
+                      "❌ Não consigo calcular as estatísticas exatas desse ataque (fórmula complexa demais).")
+            return await interaction.response.send_message(msg, ephemeral=True)
+
+        embed = discord.Embed(
+            title=_tr("player.attack.stats.title", loc, "📊 {attack} contra CA {ac}",
+                      attack=selected_attack.get("nome", ataque), ac=ca),
+            color=discord.Color.blurple()
+        )
+        embed.add_field(name=_tr("player.attack.stats.hit", loc, "🎯 Acerto"),
+                        value=f"{stats['chance_acerto']:.1%}", inline=True)
+        embed.add_field(name=_tr("player.attack.stats.crit", loc, "💥 Crítico"),
+                        value=f"{stats['chance_critico']:.1%}", inline=True)
+        embed.add_field(name=_tr("player.attack.stats.fumble", loc, "💀 Falha crítica"),
+                        value=f"{stats['chance_falha_critica']:.1%}", inline=True)
+        embed.add_field(name=_tr("player.attack.stats.expected", loc, "⚔️ Dano esperado por uso"),
+                        value=f"{stats['dano_esperado']:.1f}", inline=True)
+        embed.add_field(name=_tr("player.attack.stats.on_hit", loc, "🩸 Dano médio no acerto / crítico"),
+                        value=f"{stats['dano_medio_no_acerto']:.1f} / {stats['dano_medio_critico']:.1f}", inline=True)
+        percentis = " · ".join(f"p{p}: {v}" for p, v in stats["percentis_dano"].items())
+        embed.add_field(name=_tr("player.attack.stats.percentiles", loc, "📈 Percentis de dano (por ataque)"),
+                        value=percentis, inline=False)
+        embed.set_footer(text=f"{stats['ataques']}× {stats['expressao_acerto']} · {stats['expressao_dano']}")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(PlayerCog(bot))
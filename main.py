@@ -24,6 +24,10 @@ from discord.ext import commands
 from discord import app_commands
 from dotenv import load_dotenv
 from utils.checks import is_app_owner
+from utils import metrics
+from utils.storage import store
+from utils.dice_executor import dice_executor
+from utils.combat_sim import simulation_executor
 
 load_dotenv()
 
@@ -76,6 +80,16 @@ class RPGbot(commands.Bot):
         except Exception:
             log.exception("[sync] error on app command sync")
 
+    async def close(self):
+        await super().close()
+        dice_executor.shutdown()
+        simulation_executor.shutdown()
+        store.shutdown()
+
+    async def on_interaction(self, interaction: discord.Interaction):
+        lag = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        metrics.histogram("interaction.dispatch").observe(max(lag, 0.0))
+
     async def on_ready(self):
         log.info(f"Logged in as {self.user} (id={self.user.id})")
         await self.change_presence(
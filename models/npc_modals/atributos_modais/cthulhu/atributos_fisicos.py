@@ -63,7 +63,7 @@ class NPCAtributosFisicosModal(NPCModalBase):
       self.npc_data.setdefault("atributos", {})
       self.npc_data["atributos"].update(valores_int)
 
-      self.save()
+      await self.save()
 
       embed = discord.Embed(
         title=f"💪 Atributos Físicos de {self.npc_context.npc_name}",
@@ -79,4 +79,4 @@ class NPCAtributosFisicosModal(NPCModalBase):
 
     except ValueError as e:
       await interaction.response.send_message(f"❌ Erro: {e}. Certifique-se de usar apenas números entre 1 e 100.",
-                                              ephemeral=True)
\ No newline at end of file
+                                              ephemeral=True)
\ No newline at end of file
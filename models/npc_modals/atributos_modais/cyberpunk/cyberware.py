@@ -70,7 +70,7 @@ class NPCCyberpunkCyberwareModal(NPCModalBase):
         "melhorias": [mel.strip() for mel in self.melhorias.value.split(',') if mel.strip()]
       }
       self.npc_data["cyberware"] = cyberware_data
-      self.save()
+      await self.save()
 
       embed = discord.Embed(
         title=f"🔋 Sistema Cyberware de {self.npc_context.npc_name}",
@@ -93,4 +93,4 @@ class NPCCyberpunkCyberwareModal(NPCModalBase):
     except (ValueError, TypeError) as e:
       await interaction.response.send_message(
         f"❌ Erro: {e}. Verifique se a Humanidade é um número válido e se o atributo 'Empatia' está definido na ficha do NPC.",
-        ephemeral=True)
\ No newline at end of file
+        ephemeral=True)
\ No newline at end of file
@@ -60,7 +60,7 @@ class NPCCyberpunkFisicosModal(NPCModalBase):
       self.npc_data.setdefault("atributos", {})
       self.npc_data["atributos"].update(valores_int)
 
-      self.save()
+      await self.save()
 
       embed = discord.Embed(
         title=f"⚙️ Atributos Físicos de {self.npc_context.npc_name}",
@@ -76,4 +76,4 @@ class NPCCyberpunkFisicosModal(NPCModalBase):
 
     except ValueError as e:
       await interaction.response.send_message(f"❌ Erro: {e}. Certifique-se de usar apenas números entre 2 e 8.",
-                                              ephemeral=True)
\ No newline at end of file
+                                              ephemeral=True)
\ No newline at end of file
@@ -57,7 +57,7 @@ class NPCCyberpunkMentaisModal(NPCModalBase):
       self.npc_data.setdefault("atributos", {})
       self.npc_data["atributos"].update(valores_int)
 
-      self.save()
+      await self.save()
 
       embed = discord.Embed(
         title=f"💿 Atributos Mentais de {self.npc_context.npc_name}",
@@ -73,4 +73,4 @@ class NPCCyberpunkMentaisModal(NPCModalBase):
 
     except ValueError as e:
       await interaction.response.send_message(f"❌ Erro: {e}. Certifique-se de usar apenas números entre 2 e 8.",
-                                              ephemeral=True)
\ No newline at end of file
+                                              ephemeral=True)
\ No newline at end of file
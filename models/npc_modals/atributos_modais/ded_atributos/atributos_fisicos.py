@@ -77,7 +77,7 @@ class NPCDnDAtributosFisicosModal(NPCModalBase):
             if valores_int:
                 self.npc_data.setdefault("atributos", {})
                 self.npc_data["atributos"].update(valores_int)
-                self.save()
+                await self.save()
 
             embed = discord.Embed(
                 title=t("npc.attr_phys.saved.title", self.locale, name=self.npc_context.npc_name),
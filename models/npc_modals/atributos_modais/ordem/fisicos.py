@@ -56,7 +56,7 @@ class NPCOrdemFisicosModal(NPCModalBase):
 
       self.npc_data.setdefault("atributos", {})
       self.npc_data["atributos"].update(valores_int)
-      self.save()
+      await self.save()
 
       embed = discord.Embed(
         title=f"👁️ Atributos Físicos de {self.npc_context.npc_name}",
@@ -71,4 +71,4 @@ class NPCOrdemFisicosModal(NPCModalBase):
 
     except ValueError as e:
       await interaction.response.send_message(f"❌ Erro: {e}. Certifique-se de usar apenas números entre 1 e 5.",
-                                              ephemeral=True)
\ No newline at end of file
+                                              ephemeral=True)
\ No newline at end of file
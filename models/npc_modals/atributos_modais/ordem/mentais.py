@@ -54,7 +54,7 @@ class NPCOrdemMentaisModal(NPCModalBase):
 
       self.npc_data.setdefault("atributos", {})
       self.npc_data["atributos"].update(valores_int)
-      self.save()
+      await self.save()
 
       embed = discord.Embed(
         title=f"📜 Atributos Mentais de {self.npc_context.npc_name}",
@@ -69,4 +69,4 @@ class NPCOrdemMentaisModal(NPCModalBase):
 
     except ValueError as e:
       await interaction.response.send_message(f"❌ Erro: {e}. Certifique-se de usar apenas números entre 1 e 5.",
-                                              ephemeral=True)
\ No newline at end of file
+                                              ephemeral=True)
\ No newline at end of file
@@ -64,7 +64,7 @@ class NPCOrdemRecursosModal(NPCModalBase):
       self.npc_data.setdefault("recursos", {}).update({
         "sanidade": sanidade_val, "pe": pe_val, "nex": nex_val
       })
-      self.save()
+      await self.save()
 
       embed = discord.Embed(
         title=f"🔮 Recursos Paranormais de {self.npc_context.npc_name}",
@@ -86,4 +86,4 @@ class NPCOrdemRecursosModal(NPCModalBase):
 
     except (ValueError, TypeError) as e:
       await interaction.response.send_message(
-        f"❌ Erro: {e}. Verifique se os atributos base (Intelecto, Vigor, etc.) estão definidos.", ephemeral=True)
\ No newline at end of file
+        f"❌ Erro: {e}. Verifique se os atributos base (Intelecto, Vigor, etc.) estão definidos.", ephemeral=True)
\ No newline at end of file
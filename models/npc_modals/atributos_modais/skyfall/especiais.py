@@ -56,7 +56,7 @@ class NPCSkifallRecursosModal(NPCModalBase):
                 "dano_sangue_total": ds_total,
                 "corrupcao_total": cor_total
             })
-            self.save()
+            await self.save()
 
             embed = discord.Embed(
                 title=f"✨ Recursos Especiais de {self.npc_context.npc_name}",
@@ -71,4 +71,4 @@ class NPCSkifallRecursosModal(NPCModalBase):
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
         except ValueError as e:
-            await interaction.response.send_message(f"❌ Erro: {e}. Certifique-se de digitar apenas números válidos.", ephemeral=True)
\ No newline at end of file
+            await interaction.response.send_message(f"❌ Erro: {e}. Certifique-se de digitar apenas números válidos.", ephemeral=True)
\ No newline at end of file
@@ -54,7 +54,7 @@ class NPCSkifallFisicosModal(NPCModalBase):
             raise ValueError(f"O valor de {nome} deve estar entre 1 e 20")
           valores_int[nome] = v_int
       self.npc_data.setdefault("atributos", {}).update(valores_int)
-      self.save()
+      await self.save()
 
       embed = discord.Embed(
         title=f"❄️ Atributos Físicos de {self.npc_context.npc_name}",
@@ -68,4 +68,4 @@ class NPCSkifallFisicosModal(NPCModalBase):
 
     except ValueError as e:
       await interaction.response.send_message(f"❌ Erro: {e}. Certifique-se de usar apenas números entre 1 e 20.",
-                                              ephemeral=True)
\ No newline at end of file
+                                              ephemeral=True)
\ No newline at end of file
@@ -53,7 +53,7 @@ class NPCSkifallMentaisModal(NPCModalBase):
             raise ValueError(f"O valor de {nome.replace('_', ' ').capitalize()} deve estar entre 1 e 20")
           valores_int[nome] = v_int
       self.npc_data.setdefault("atributos", {}).update(valores_int)
-      self.save()
+      await self.save()
       embed = discord.Embed(
         title=f"🧠 Atributos Mentais de {self.npc_context.npc_name}",
         description="**SkiFall RPG**",
@@ -65,4 +65,4 @@ class NPCSkifallMentaisModal(NPCModalBase):
       await interaction.response.send_message(embed=embed, ephemeral=True)
     except ValueError as e:
       await interaction.response.send_message(f"❌ Erro: {e}. Certifique-se de usar apenas números entre 1 e 20.",
-                                              ephemeral=True)
\ No newline at end of file
+                                              ephemeral=True)
\ No newline at end of file
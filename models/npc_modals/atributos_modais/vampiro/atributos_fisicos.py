@@ -56,7 +56,7 @@ class NPCVampiroFisicosModal(NPCModalBase):
           valores_int[nome] = v_int
 
       self.npc_data.setdefault("atributos", {}).update(valores_int)
-      self.save()
+      await self.save()
       embed = discord.Embed(
         title=f"🩸 Atributos Físicos de {self.npc_context.npc_name}",
         description="**Vampiro: A Máscara**",
@@ -68,4 +68,4 @@ class NPCVampiroFisicosModal(NPCModalBase):
       await interaction.response.send_message(embed=embed, ephemeral=True)
     except ValueError as e:
       await interaction.response.send_message(f"❌ Erro: {e}. Certifique-se de usar apenas números entre 1 e 5.",
-                                              ephemeral=True)
\ No newline at end of file
+                                              ephemeral=True)
\ No newline at end of file
@@ -0,0 +1,51 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import discord
+from models.npc_modals.npc_basic_modal import NPCModalBase
+from utils import sheet_patch, system_rolls
+from utils.storage import store
+from utils.i18n import t
+from utils.locale_resolver import resolve_locale
+
+class NPCVampiroFomeModal(NPCModalBase):
+  def __init__(self, npc_context, locale: str = "pt"):
+    self.locale = locale
+    super().__init__(npc_context, title=f"{t('status.hunger.title', locale)} — {npc_context.npc_name}"[:45])
+    self.fome = discord.ui.TextInput(
+      label=t("status.hunger.label", locale),
+      placeholder=t("status.hunger.ph", locale),
+      default=str(system_rolls.hunger_of(self.npc_data)),
+      required=True,
+      max_length=1
+    )
+    self.add_item(self.fome)
+
+  async def on_submit(self, interaction: discord.Interaction):
+    loc = resolve_locale(interaction, fallback=self.locale)
+    try:
+      fome = int(self.fome.value)
+    except ValueError:
+      fome = -1
+    if not 0 <= fome <= 5:
+      await interaction.response.send_message(t("status.hunger.invalid", loc), ephemeral=True)
+      return
+
+    await store.patch_npc(self.npc_context, [sheet_patch.set_path(("recursos", "fome"), fome)])
+    await interaction.response.send_message(t("status.hunger.saved", loc, value=fome), ephemeral=True)
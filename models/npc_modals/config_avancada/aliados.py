@@ -62,7 +62,7 @@ class NPCAddAllyModal(NPCModalBase):
             "descricao": self.descricao.value
         })
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("npc.ally.add.success", self.locale, ally=self.nome.value, name=self.npc_context.npc_name),
@@ -57,7 +57,7 @@ class NPCExtrasModal(NPCModalBase):
         self.npc_data.setdefault("extras", {})
         self.npc_data["extras"]["comportamento"] = self.comportamento.value
         self.npc_data["extras"]["loot"] = self.loot.value
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("npc.extras.saved", self._, name=self.npc_context.npc_name),
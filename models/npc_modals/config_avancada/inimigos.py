@@ -67,7 +67,7 @@ class NPCAddEnemyModal(NPCModalBase):
             "descricao": self.descricao.value
         })
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("npc.enemy.add.success", self._, enemy=self.nome.value, name=self.npc_context.npc_name),
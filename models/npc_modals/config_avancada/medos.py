@@ -69,7 +69,7 @@ class NPCAddFearModal(NPCModalBase):
             "descricao": self.descricao.value
         })
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("npc.fear.add.success", self._, fear=self.medo.value, name=self.npc_context.npc_name),
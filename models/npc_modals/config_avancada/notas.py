@@ -59,7 +59,7 @@ class NPCNotesModal(NPCModalBase):
         roleplay_data["notas_gerais"] = self.notas_gerais.value
         roleplay_data["recursos_especiais"] = self.recursos_especiais.value
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("npc.notes.saved", self._, name=self.npc_context.npc_name),
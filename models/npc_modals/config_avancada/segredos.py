@@ -68,7 +68,7 @@ class NPCAddSecretModal(NPCModalBase):
             "quem_sabe": self.quem_sabe.value
         })
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("npc.secret.add.saved", self._, name=self.npc_context.npc_name),
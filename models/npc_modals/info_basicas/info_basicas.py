@@ -60,7 +60,7 @@ class NPCBasicInfoModal(NPCModalBase):
         info["raca_especie"] = self.raca_especie.value
         info["classe_profissao"] = self.classe_profissao.value
 
-        self.save()
+        await self.save()
 
         embed = discord.Embed(
             title=t("npc.basic.embed.title", self.locale, name=self.npc_context.npc_name),
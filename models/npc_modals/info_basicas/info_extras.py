@@ -85,7 +85,7 @@ class NPCExtraInfoModal(NPCModalBase):
         info["background"] = self.background.value
         info["origem"] = self.origem.value
 
-        self.save()
+        await self.save()
 
         embed = discord.Embed(
             title=t("npc.extra.embed.title", self.locale, name=self.npc_context.npc_name),
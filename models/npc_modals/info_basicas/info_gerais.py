@@ -73,7 +73,7 @@ class NPCGeneralInfoModal(NPCModalBase):
         info["idade"] = self.idade.value
         info["altura_peso"] = self.altura_peso.value
 
-        self.save()
+        await self.save()
 
         embed = discord.Embed(
             title=t("npc.general.embed.title", self.locale, name=self.npc_context.npc_name),
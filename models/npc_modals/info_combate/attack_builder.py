@@ -133,7 +133,7 @@ class NPCAttackBuilderView(NPCBaseBuilderView):
             else:
                 self.draft["itens_vinculados"] = select.values
 
-            self.save_draft()
+            await self.save_draft()
             await interaction.response.edit_message(embed=self.create_embed(), view=self)
 
         select.callback = callback
@@ -159,7 +159,7 @@ class NPCAttackBuilderView(NPCBaseBuilderView):
                 "alcance": modal.alcance.value,
                 "usos": modal.usos.value
             })
-            self.save_draft()
+            await self.save_draft()
             self._update_components_state()
             await interaction.edit_original_response(embed=self.create_embed(), view=self)
 
@@ -186,7 +186,7 @@ class NPCAttackBuilderView(NPCBaseBuilderView):
                 "margem_critico": modal.margem_critico.value,
                 "multiplicador_critico": modal.multiplicador_critico.value
             })
-            self.save_draft()
+            await self.save_draft()
             await interaction.edit_original_response(embed=self.create_embed(), view=self)
 
         button.callback = callback
@@ -201,11 +201,7 @@ class NPCAttackBuilderView(NPCBaseBuilderView):
 
         async def callback(interaction: discord.Interaction):
             from view.ficha_npc.npc_skills import NPCSkillsView
-            npc_data = self.npc_context.load()
-            drafts = npc_data.get(self.draft_key, {})
-            if self.build_id in drafts:
-                del drafts[self.build_id]
-                self.npc_context.save(npc_data)
+            self.discard_draft()
 
             view = NPCSkillsView(npc_context=self.npc_context)
             await interaction.response.edit_message(
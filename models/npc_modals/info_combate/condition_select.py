@@ -17,7 +17,9 @@
 # exclusive property of the author.
 
 import discord
+from utils import sheet_patch
 from utils.npc_utils import NPCContext
+from utils.storage import store
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 
@@ -81,9 +83,7 @@ class NPCConditionSelect(discord.ui.Select):
       loc = resolve_locale(interaction) or self.locale
     except Exception:
       loc = self.locale
-    npc_data = self.npc_context.load()
-    npc_data["condicoes_ativas"] = self.values
-    self.npc_context.save(npc_data)
+    await store.patch_npc(self.npc_context, [sheet_patch.set_path("condicoes_ativas", self.values)])
 
     if not self.values:
       await interaction.response.send_message(
@@ -95,7 +95,7 @@ class NPCCombatInfoModal(NPCModalBase):
       "resistencia_magica": self.resistencia_magica.value,
       "iniciativa": self.iniciativa.value,
     })
-    self.save()
+    await self.save()
 
     embed = discord.Embed(
       title=t("npc.combat.embed.title", self.locale, name=self.npc_context.npc_name),
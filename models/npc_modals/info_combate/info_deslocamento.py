@@ -82,7 +82,7 @@ class NPCMovementInfoModal(NPCModalBase):
       "fraquezas": self.fraquezas.value,
       "imunidades": self.imunidades.value,
     })
-    self.save()
+    await self.save()
 
     embed = discord.Embed(
       title=t("npc.movement.embed.title", self.locale, name=self.npc_context.npc_name),
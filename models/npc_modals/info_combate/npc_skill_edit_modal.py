@@ -58,7 +58,7 @@ class NPCSkillEditModal(NPCModalBase):
       pericias = self.npc_data.setdefault("pericias", {})
       if self.skill_name_to_edit and self.skill_name_to_edit != nome_val:
         pericias.pop(self.skill_name_to_edit, None)
-        self.save()
+        await self.save()
 
       view = NPCAttributeLinkView(
         npc_context=self.npc_context,
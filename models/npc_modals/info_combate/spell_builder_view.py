@@ -23,6 +23,7 @@ from models.npc_modals.info_combate.spell_modal_2 import NPCSpellDetailsModal
 from models.npc_modals.info_combate.spell_modal_3 import NPCSpellExtraModal
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
+from utils.storage import store
 
 class NPCSpellBuilderView(NPCBaseBuilderView):
     def __init__(self, npc_context, spell_id: str):
@@ -151,7 +152,7 @@ class NPCSpellBuilderView(NPCBaseBuilderView):
                 self.draft["itens_vinculados"] = []
             else:
                 self.draft["itens_vinculados"] = [v for v in vals if v not in ("NO_ITEMS", "NENHUM")]
-            self.save_draft()
+            await self.save_draft()
             await interaction.response.edit_message(embed=self.create_embed(), view=self)
 
         select.callback = callback
@@ -199,7 +200,7 @@ class NPCSpellBuilderView(NPCBaseBuilderView):
                 "tempo_conjuracao": modal.tempo_conjuracao.value,
                 "concentracao": modal.concentracao.value
             })
-            self.save_draft()
+            await self.save_draft()
             self._update_components_state()
             await interaction.edit_original_response(embed=self.create_embed(), view=self)
 
@@ -227,7 +228,7 @@ class NPCSpellBuilderView(NPCBaseBuilderView):
                 "formula_acerto": modal.formula_acerto.value,
                 "formula_dano_cura": modal.formula_dano_cura.value,
             })
-            self.save_draft()
+            await self.save_draft()
             await interaction.edit_original_response(embed=self.create_embed(), view=self)
 
         button.callback = callback
@@ -254,18 +255,12 @@ class NPCSpellBuilderView(NPCBaseBuilderView):
                 "classe_conjurador": modal.classe_conjurador.value,
                 "descricao": modal.descricao.value
             })
-            self.save_draft()
+            await self.save_draft()
             await interaction.edit_original_response(embed=self.create_embed(), view=self)
 
         button.callback = callback
         return button
 
-    def save_draft(self):
-        data = self.npc_context.load()
-        drafts = data.setdefault(getattr(self, "draft_key", "rascunhos"), {})
-        drafts[self.build_id] = self.draft
-        self.npc_context.save(data)
-
     def save_button(self):
         _ = self.locale
         button = discord.ui.Button(
@@ -275,16 +270,6 @@ class NPCSpellBuilderView(NPCBaseBuilderView):
         )
 
         async def callback(interaction: discord.Interaction):
-            data = self.npc_context.load()
-
-            ataques = data.get("ataques")
-            if ataques is None:
-                ataques = []
-            elif isinstance(ataques, dict):
-                ataques = list(ataques.values())
-            elif not isinstance(ataques, list):
-                ataques = []
-
             nome = (self.draft.get("nome") or "").strip()
             if not nome:
                 await interaction.response.send_message(
@@ -321,23 +306,28 @@ class NPCSpellBuilderView(NPCBaseBuilderView):
                 "atributo": self.draft.get("atributo", "")
             }
 
-            updated = False
-            for i, a in enumerate(ataques):
-                if isinstance(a, dict) and a.get("nome","").strip().lower() == nome.lower():
-                    ataques[i] = ataque_like
-                    updated = True
-                    break
-            if not updated:
-                ataques.append(ataque_like)
-
-            data["ataques"] = ataques
-            dkey = getattr(self, "draft_key", "rascunhos")
-            drafts = data.get(dkey, {})
-            if isinstance(drafts, dict) and self.build_id in drafts:
-                del drafts[self.build_id]
-                data[dkey] = drafts
-
-            self.npc_context.save(data)
+            def _apply(data: dict):
+                ataques = data.get("ataques")
+                if ataques is None:
+                    ataques = []
+                elif isinstance(ataques, dict):
+                    ataques = list(ataques.values())
+                elif not isinstance(ataques, list):
+                    ataques = []
+
+                updated = False
+                for i, a in enumerate(ataques):
+                    if isinstance(a, dict) and a.get("nome","").strip().lower() == nome.lower():
+                        ataques[i] = ataque_like
+                        updated = True
+                        break
+                if not updated:
+                    ataques.append(ataque_like)
+
+                data["ataques"] = ataques
+
+            await store.update_npc(self.npc_context, _apply)
+            self.discard_draft()
 
             embed = self.create_embed()
             embed.title = t("npc.spell.builder.saved_as_attack_title", _)
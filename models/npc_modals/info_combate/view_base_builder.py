@@ -20,8 +20,11 @@ import discord
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 from utils.npc_utils import NPCContext
+from utils.draft_store import drafts
+from utils.storage import store
 
 class NPCBaseBuilderView(discord.ui.View):
+    # Um rascunho aberto por (mestre, builder, NPC), fora da ficha: o NPC só é gravado no Salvar.
     def __init__(self, npc_context: NPCContext, build_id: str, build_type: str, build_type_plural: str):
         super().__init__(timeout=None)
         self.locale = resolve_locale(getattr(npc_context, "interaction", None))
@@ -33,8 +36,9 @@ class NPCBaseBuilderView(discord.ui.View):
         player_attributes_keys = self.npc_data.get("atributos", {}).keys()
         self.npc_attributes = list(player_attributes_keys)
         self.npc_attributes.append("Nenhum")
-        self.draft_key = f"{self.build_type_plural}_em_progresso"
-        self.draft = self.npc_data.get(self.draft_key, {}).get(self.build_id, {})
+        self.draft_builder = f"npc_{self.build_type_plural}"
+        self.draft_slot = f"{npc_context.guild_id}:{npc_context.npc_name}"
+        self.draft = drafts.get(npc_context.mestre_id, self.draft_builder, self.draft_slot) or {}
         self._add_components()
 
     def _add_components(self):
@@ -46,10 +50,11 @@ class NPCBaseBuilderView(discord.ui.View):
     def _update_components_state(self):
         raise NotImplementedError
 
-    def save_draft(self):
-        current_data = self.npc_context.load()
-        current_data.setdefault(self.draft_key, {})[self.build_id] = self.draft
-        self.npc_context.save(current_data)
+    async def save_draft(self):
+        drafts.put(self.npc_context.mestre_id, self.draft_builder, self.draft_slot, self.draft)
+
+    def discard_draft(self):
+        drafts.discard(self.npc_context.mestre_id, self.draft_builder, self.draft_slot)
 
     def attribute_select(self):
         _ = self.locale
@@ -63,7 +68,7 @@ class NPCBaseBuilderView(discord.ui.View):
 
         async def callback(interaction: discord.Interaction):
             self.draft["atributo"] = select.values[0]
-            self.save_draft()
+            await self.save_draft()
             await interaction.response.edit_message(embed=self.create_embed(), view=self)
 
         select.callback = callback
@@ -78,15 +83,11 @@ class NPCBaseBuilderView(discord.ui.View):
         )
 
         async def callback(interaction: discord.Interaction):
-            npc_data = self.npc_context.load()
-            npc_data.setdefault(self.build_type_plural, []).append(self.draft)
-
-            drafts = npc_data.get(self.draft_key, {})
-            if self.build_id in drafts:
-                del drafts[self.build_id]
-                npc_data[self.draft_key] = drafts
+            def _apply(npc_data: dict):
+                npc_data.setdefault(self.build_type_plural, []).append(self.draft)
 
-            self.npc_context.save(npc_data)
+            await store.update_npc(self.npc_context, _apply)
+            self.discard_draft()
             self.stop()
 
             embed = self.create_embed()
@@ -108,12 +109,7 @@ class NPCBaseBuilderView(discord.ui.View):
         )
 
         async def callback(interaction: discord.Interaction):
-            npc_data = self.npc_context.load()
-            drafts = npc_data.get(self.draft_key, {})
-            if self.build_id in drafts:
-                del drafts[self.build_id]
-                npc_data[self.draft_key] = drafts
-                self.npc_context.save(npc_data)
+            self.discard_draft()
 
             self.stop()
             embed = self.create_embed()
@@ -135,12 +131,7 @@ class NPCBaseBuilderView(discord.ui.View):
         async def callback(interaction: discord.Interaction):
             from view.ficha_npc.npc_skills import NPCSkillsView
 
-            npc_data = self.npc_context.load()
-            drafts = npc_data.get(self.draft_key, {})
-            if self.build_id in drafts:
-                del drafts[self.build_id]
-                npc_data[self.draft_key] = drafts
-                self.npc_context.save(npc_data)
+            self.discard_draft()
 
             view = NPCSkillsView(npc_context=self.npc_context)
             await interaction.response.edit_message(
@@ -101,7 +101,7 @@ class NPCAddItemRandomModal(NPCModalBase):
         }
         random_items.append(novo_item)
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("npc.inventory.random.added", self.locale, item=self.nome.value, name=self.npc_context.npc_name),
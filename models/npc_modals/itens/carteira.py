@@ -57,7 +57,7 @@ class NPCWalletModal(NPCModalBase):
             "moedas": self.moedas.value,
             "gemas": self.gemas.value
         }
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("npc.wallet.updated", self.locale, name=self.npc_context.npc_name),
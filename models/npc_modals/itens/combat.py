@@ -113,7 +113,7 @@ class NPCAddItemCombatModal(NPCModalBase):
         }
         combat_items.append(novo_item)
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t(
@@ -104,7 +104,7 @@ class NPCAddItemConsumableModal(NPCModalBase):
         }
         consumable_items.append(novo_item)
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t(
@@ -108,7 +108,7 @@ class NPCAddItemDefenseModal(NPCModalBase):
             "penalidade": self.penalidade.value
         })
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("npc.items.defense.added", self.locale, item=self.nome.value, name=self.npc_context.npc_name),
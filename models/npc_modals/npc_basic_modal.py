@@ -16,14 +16,18 @@
 # from the software and are NOT covered by the AGPL. They remain the
 # exclusive property of the author.
 
+import copy
 import discord
 from utils.npc_utils import NPCContext
+from utils.storage import store
 
 class NPCModalBase(discord.ui.Modal):
     def __init__(self, npc_context: NPCContext, title: str):
         super().__init__(title=title)
         self.npc_context = npc_context
         self.npc_data = self.npc_context.load()
+        self._base = copy.deepcopy(self.npc_data)
 
-    def save(self):
-        self.npc_context.save(self.npc_data)
\ No newline at end of file
+    async def save(self):
+        self.npc_data = await store.merge_npc(self.npc_context, self._base, self.npc_data)
+        self._base = copy.deepcopy(self.npc_data)
\ No newline at end of file
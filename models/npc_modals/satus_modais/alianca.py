@@ -73,7 +73,7 @@ class NPCAllianceModal(NPCModalBase):
       "contatos": self.contatos.value,
       "inimigos": self.inimigos.value
     }
-    self.save()
+    await self.save()
 
     await interaction.response.send_message(
       t("npc.alliances.saved", self._).format(name=self.npc_context.npc_name),
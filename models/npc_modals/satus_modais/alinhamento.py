@@ -67,7 +67,7 @@ class NPCAlignmentModal(NPCModalBase):
       "defeitos": self.defeitos.value,
       "vinculos": self.vinculos.value
     }
-    self.save()
+    await self.save()
 
     await interaction.response.send_message(
       t("npc.alignment.saved", self._).format(name=self.npc_context.npc_name),
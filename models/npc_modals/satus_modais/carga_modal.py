@@ -53,7 +53,7 @@ class NPCCargaModal(NPCModalBase):
       "atual": self.carga_atual.value,
       "maxima": self.carga_maxima.value
     }
-    self.save()
+    await self.save()
 
     await interaction.response.send_message(
       t("npc.carry.saved", self._).format(name=self.npc_context.npc_name),
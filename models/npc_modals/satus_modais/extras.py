@@ -45,7 +45,7 @@ class NPCExtrasModal(NPCModalBase):
     self.npc_data["extras"] = {
       "notas": self.notas.value
     }
-    self.save()
+    await self.save()
     await interaction.response.send_message(
       t("npc.extras.saved", self._).format(name=self.npc_context.npc_name),
       ephemeral=True
@@ -65,7 +65,7 @@ class NPCObjectivesModal(NPCModalBase):
       "longo_prazo": self.longo_prazo.value,
       "secreto": self.secreto.value
     }
-    self.save()
+    await self.save()
     await interaction.response.send_message(
       t("npc.objectives.saved", self._).format(name=self.npc_context.npc_name),
       ephemeral=True
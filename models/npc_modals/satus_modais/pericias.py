@@ -59,7 +59,7 @@ class NPCLearnSkillsModal(NPCModalBase):
       new_skills[name] = self._existing_skills.get(name, "N/A")
 
     self.npc_data["pericias"] = new_skills
-    self.save()
+    await self.save()
 
     count = len(new_skills)
     await interaction.response.send_message(
@@ -58,7 +58,7 @@ class NPCPersonalityModal(NPCModalBase):
       "resumo": resumo,
       "tracos_marcantes": tracos
     }
-    self.save()
+    await self.save()
     embed = discord.Embed(
       title=t("npc.personality.saved.title", self._).format(name=self.npc_context.npc_name),
       description=t("npc.personality.saved.desc", self._),
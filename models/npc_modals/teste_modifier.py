@@ -100,7 +100,7 @@ class NPCAddTestModifierModal(NPCModalBase):
         "condicao": cond
       })
 
-    self.save()
+    await self.save()
 
     cond_txt = f" {t('npc.tests.confirm.cond_prefix', _)} {cond}" if cond else ""
     if updated:
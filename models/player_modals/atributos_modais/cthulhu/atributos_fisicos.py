@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class PlayerAtributosFisicosModal(discord.ui.Modal, title="💪 Atributos Físicos (Call of Cthulhu)"):
     def __init__(self, interaction: discord.Interaction):
@@ -54,8 +55,6 @@ class PlayerAtributosFisicosModal(discord.ui.Modal, title="💪 Atributos Físic
     )
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             forca_val = int(self.forca.value)
             destreza_val = int(self.destreza.value)
@@ -63,14 +62,16 @@ class PlayerAtributosFisicosModal(discord.ui.Modal, title="💪 Atributos Físic
             tamanho_val = int(self.tamanho.value)
             if not all(1 <= val <= 1000 for val in [forca_val, destreza_val, constituicao_val, tamanho_val]):
                 raise ValueError("Valores devem estar entre 1 e 100")
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "forca": forca_val,
                 "destreza": destreza_val,
                 "constituicao": constituicao_val,
                 "tamanho": tamanho_val
-            })
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="💪 Atributos Físicos Atualizados",
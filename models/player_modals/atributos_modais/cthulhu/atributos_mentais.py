@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class PlayerAtributosMentaisModal(discord.ui.Modal, title="🧠 Atributos Mentais (Call of Cthulhu)"):
     def __init__(self, interaction: discord.Interaction):
@@ -54,8 +55,6 @@ class PlayerAtributosMentaisModal(discord.ui.Modal, title="🧠 Atributos Mentai
     )
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             int_val = int(self.inteligencia.value)
             edu_val = int(self.educacao.value)
@@ -65,14 +64,16 @@ class PlayerAtributosMentaisModal(discord.ui.Modal, title="🧠 Atributos Mentai
             if not all(1 <= val <= 1000 for val in [int_val, edu_val, pow_val, apa_val]):
                 raise ValueError("Todos os valores devem estar entre 1 e 100")
 
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "inteligencia": int_val,
                 "educacao": edu_val,
                 "poder": pow_val,
                 "aparencia": apa_val
-            })
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="🧠 Atributos Mentais Atualizados",
@@ -17,7 +17,9 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.player_utils import load_player_sheet
+from utils.storage import store
 
 class CyberpunkCyberwareModal(discord.ui.Modal, title="🔋 Sistema Cyberware"):
     def __init__(self, interaction: discord.Interaction):
@@ -71,8 +73,7 @@ class CyberpunkCyberwareModal(discord.ui.Modal, title="🔋 Sistema Cyberware"):
                 "melhorias": [mel.strip() for mel in self.melhorias.value.split(",") if mel.strip()]
             }
 
-            ficha["cyberware"] = cyberware_data
-            save_player_sheet(self.character_name, ficha)
+            await store.patch_player(self.character_name, [sheet_patch.set_path("cyberware", cyberware_data)])
 
             embed = discord.Embed(
                 title="🔋 Sistema Cyberware Atualizado",
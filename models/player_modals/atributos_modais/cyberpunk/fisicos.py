@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import save_player_sheet, load_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class CyberpunkFisicosModal(discord.ui.Modal, title="⚙️ Atributos Físicos (Cyberpunk)"):
     def __init__(self, interaction: discord.Interaction):
@@ -50,8 +51,6 @@ class CyberpunkFisicosModal(discord.ui.Modal, title="⚙️ Atributos Físicos (
         self.add_item(self.tecnica)
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             corpo_val = int(self.corpo.value)
             reflexos_val = int(self.reflexos.value)
@@ -60,14 +59,15 @@ class CyberpunkFisicosModal(discord.ui.Modal, title="⚙️ Atributos Físicos (
             if not all(2 <= val <= 800 for val in [corpo_val, reflexos_val, tecnica_val]):
                 raise ValueError("Atributos devem estar entre 2 e 8")
 
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "corpo": corpo_val,
                 "reflexos": reflexos_val,
                 "tecnica": tecnica_val
-            })
-
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="⚙️ Atributos Físicos Atualizados",
@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import save_player_sheet, load_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class CyberpunkSociaisModal(discord.ui.Modal, title="🌐 Atributos Sociais (Cyberpunk)"):
     def __init__(self, interaction: discord.Interaction):
@@ -42,8 +43,6 @@ class CyberpunkSociaisModal(discord.ui.Modal, title="🌐 Atributos Sociais (Cyb
         self.add_item(self.sorte)
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             atratividade_val = int(self.atratividade.value)
             sorte_val = int(self.sorte.value)
@@ -51,13 +50,14 @@ class CyberpunkSociaisModal(discord.ui.Modal, title="🌐 Atributos Sociais (Cyb
             if not all(2 <= val <= 800 for val in [atratividade_val, sorte_val]):
                 raise ValueError("Atributos devem estar entre 2 e 8")
 
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "atratividade": atratividade_val,
                 "sorte": sorte_val
-            })
-
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="🌐 Atributos Sociais Atualizados",
@@ -82,7 +82,7 @@ class PlayerAtributosFisicosModal(PlayerModalBase):
             "destreza": destreza,
             "constituicao": constituicao
         })
-        self.save()
+        await self.save()
 
         embed = discord.Embed(
             title=t("attr_phys.saved.title", self.locale),
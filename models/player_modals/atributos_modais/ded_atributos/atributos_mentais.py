@@ -83,7 +83,7 @@ class PlayerAtributosMentaisModal(PlayerModalBase):
             "sabedoria": sabedoria,
             "carisma": carisma
         })
-        self.save()
+        await self.save()
 
         embed = discord.Embed(
             title=t("attr_mental.saved.title", self.locale),
@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class OrdemFisicosModal(discord.ui.Modal, title="👁️ Atributos Físicos/Paranormais"):
     def __init__(self, interaction: discord.Interaction):
@@ -57,8 +58,6 @@ class OrdemFisicosModal(discord.ui.Modal, title="👁️ Atributos Físicos/Para
         self.add_item(self.presenca)
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             forca_val = int(self.forca.value)
             agilidade_val = int(self.agilidade.value)
@@ -68,15 +67,16 @@ class OrdemFisicosModal(discord.ui.Modal, title="👁️ Atributos Físicos/Para
             if not all(1 <= val <= 5000 for val in [forca_val, agilidade_val, vigor_val, presenca_val]):
                 raise ValueError("Níveis devem estar entre 1 e 5")
 
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "forca": forca_val,
                 "agilidade": agilidade_val,
                 "vigor": vigor_val,
                 "presenca": presenca_val
-            })
-
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="👁️ Atributos Atualizados",
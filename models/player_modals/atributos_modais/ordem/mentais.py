@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class OrdemMentaisModal(discord.ui.Modal, title="📜 Atributos Mentais"):
     def __init__(self, interaction: discord.Interaction):
@@ -49,8 +50,6 @@ class OrdemMentaisModal(discord.ui.Modal, title="📜 Atributos Mentais"):
         self.add_item(self.vontade)
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             intelecto_val = int(self.intelecto.value)
             percepcao_val = int(self.percepcao.value)
@@ -59,14 +58,15 @@ class OrdemMentaisModal(discord.ui.Modal, title="📜 Atributos Mentais"):
             if not all(1 <= val <= 5000 for val in [intelecto_val, percepcao_val, vontade_val]):
                 raise ValueError("Níveis devem estar entre 1 e 5")
 
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "intelecto": intelecto_val,
                 "percepcao": percepcao_val,
                 "vontade": vontade_val
-            })
-
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="📜 Atributos Mentais Atualizados",
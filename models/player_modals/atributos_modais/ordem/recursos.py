@@ -17,7 +17,9 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.player_utils import load_player_sheet
+from utils.storage import store
 
 class OrdemParanormalModal(discord.ui.Modal, title="🔮 Recursos Paranormais"):
     def __init__(self, interaction: discord.Interaction):
@@ -65,14 +67,15 @@ class OrdemParanormalModal(discord.ui.Modal, title="🔮 Recursos Paranormais"):
                 raise ValueError("NEX deve ser entre 5% e 99%")
             max_sanidade = (ficha["atributos"].get("intelecto", 0) + ficha["atributos"].get("vontade", 0)) * 5
             max_pe = (ficha["atributos"].get("vigor", 0) + ficha["atributos"].get("presenca", 0))
-            ficha["recursos"] = ficha.get("recursos", {})
-            ficha["recursos"].update({
+            valores = {
                 "sanidade": sanidade_val,
                 "pe": pe_val,
                 "nex": nex_val
-            })
-
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("recursos", campo), valor) for campo, valor in valores.items()]
+            )
             embed = discord.Embed(
                 title="🔮 Recursos Paranormais Atualizados",
                 description="**Ordem Paranormal RPG**",
@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class SkiFallRecursosModal(discord.ui.Modal, title="✨ Recursos Especiais"):
     def __init__(self, interaction: discord.Interaction):
@@ -49,8 +50,6 @@ class SkiFallRecursosModal(discord.ui.Modal, title="✨ Recursos Especiais"):
         self.add_item(self.corrupcao)
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             enfase_total = int(self.enfase.value)
             ds_total = int(self.dano_sangue.value)
@@ -63,14 +62,15 @@ class SkiFallRecursosModal(discord.ui.Modal, title="✨ Recursos Especiais"):
             if not (0 <= cor_total <= 5000):
                 raise ValueError("Corrupção deve ser um número")
 
-            ficha["recursos"] = ficha.get("recursos", {})
-            ficha["recursos"].update({
+            valores = {
                 "enfase_total": enfase_total,
                 "dano_sangue_total": ds_total,
                 "corrupcao_total": cor_total
-            })
-
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("recursos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="✨ Recursos Especiais Atualizados",
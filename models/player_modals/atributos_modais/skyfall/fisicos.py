@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class SkiFallFisicosModal(discord.ui.Modal, title="❄️ Atributos Físicos (Valores Totais)"):
     def __init__(self, interaction: discord.Interaction):
@@ -49,8 +50,6 @@ class SkiFallFisicosModal(discord.ui.Modal, title="❄️ Atributos Físicos (Va
         self.add_item(self.vigor)
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             forca_total = int(self.forca.value)
             destreza_total = int(self.destreza.value)
@@ -59,14 +58,15 @@ class SkiFallFisicosModal(discord.ui.Modal, title="❄️ Atributos Físicos (Va
             if not all(1 <= val <= 2000 for val in [forca_total, destreza_total, vigor_total]):
                 raise ValueError("Todos os valores devem ser números")
 
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "forca_total": forca_total,
                 "destreza_total": destreza_total,
                 "vigor_total": vigor_total
-            })
-
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="❄️ Atributos Físicos Atualizados",
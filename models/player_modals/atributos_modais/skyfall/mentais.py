@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class SkiFallMentaisModal(discord.ui.Modal, title="🧠 Atributos Mentais (Valores Totais)"):
     def __init__(self, interaction: discord.Interaction):
@@ -48,8 +49,6 @@ class SkiFallMentaisModal(discord.ui.Modal, title="🧠 Atributos Mentais (Valor
         self.add_item(self.vontade)
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             intelecto_total = int(self.intelecto.value)
             percepcao_total = int(self.percepcao.value)
@@ -58,14 +57,15 @@ class SkiFallMentaisModal(discord.ui.Modal, title="🧠 Atributos Mentais (Valor
             if not all(1 <= val <= 2000 for val in [intelecto_total, percepcao_total, vontade_total]):
                 raise ValueError("Todos os valores devem ser números")
 
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "intelecto_total": intelecto_total,
                 "percepcao_total": percepcao_total,
                 "vontade_total": vontade_total
-            })
-
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="🧠 Atributos Mentais Atualizados",
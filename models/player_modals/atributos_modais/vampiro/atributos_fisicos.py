@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class VampiroAtributosFisicosModal(discord.ui.Modal, title="🩸 Atributos Físicos (Vampiro)"):
     def __init__(self, interaction: discord.Interaction):
@@ -48,8 +49,6 @@ class VampiroAtributosFisicosModal(discord.ui.Modal, title="🩸 Atributos Físi
         self.add_item(self.vigor)
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             forca_val = int(self.forca.value)
             destreza_val = int(self.destreza.value)
@@ -58,14 +57,15 @@ class VampiroAtributosFisicosModal(discord.ui.Modal, title="🩸 Atributos Físi
             if not all(1 <= val <= 5000 for val in [forca_val, destreza_val, vigor_val]):
                 raise ValueError("Todos os atributos devem estar entre 1 e 5")
 
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "forca": forca_val,
                 "destreza": destreza_val,
                 "vigor": vigor_val
-            })
-
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="🩸 Atributos Físicos Atualizados",
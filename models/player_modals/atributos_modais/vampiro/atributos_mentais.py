@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class VampiroAtributosMentaisModal(discord.ui.Modal, title="🧠 Atributos Mentais (Vampiro)"):
     def __init__(self, interaction: discord.Interaction):
@@ -48,8 +49,6 @@ class VampiroAtributosMentaisModal(discord.ui.Modal, title="🧠 Atributos Menta
         self.add_item(self.raciocinio)
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             percepcao_val = int(self.percepcao.value)
             inteligencia_val = int(self.inteligencia.value)
@@ -58,13 +57,15 @@ class VampiroAtributosMentaisModal(discord.ui.Modal, title="🧠 Atributos Menta
             if not all(1 <= val <= 5000 for val in [percepcao_val, inteligencia_val, raciocinio_val]):
                 raise ValueError("Todos os atributos devem estar entre 1 e 5")
 
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "percepcao": percepcao_val,
                 "inteligencia": inteligencia_val,
                 "raciocinio": raciocinio_val
-            })
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="🧠 Atributos Mentais Atualizados",
@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.storage import store
 
 class VampiroAtributosSociaisModal(discord.ui.Modal, title="🎭 Atributos Sociais (Vampiro)"):
     def __init__(self, interaction: discord.Interaction):
@@ -49,8 +50,6 @@ class VampiroAtributosSociaisModal(discord.ui.Modal, title="🎭 Atributos Socia
         self.add_item(self.aparencia)
 
     async def on_submit(self, interaction: discord.Interaction):
-        ficha = load_player_sheet(self.character_name)
-
         try:
             carisma_val = int(self.carisma.value)
             manipulacao_val = int(self.manipulacao.value)
@@ -59,13 +58,15 @@ class VampiroAtributosSociaisModal(discord.ui.Modal, title="🎭 Atributos Socia
             if not all(1 <= val <= 5000 for val in [carisma_val, manipulacao_val, aparencia_val]):
                 raise ValueError("Todos os atributos devem estar entre 1 e 5")
 
-            ficha["atributos"] = ficha.get("atributos", {})
-            ficha["atributos"].update({
+            valores = {
                 "carisma": carisma_val,
                 "manipulacao": manipulacao_val,
                 "aparencia": aparencia_val
-            })
-            save_player_sheet(self.character_name, ficha)
+            }
+            await store.patch_player(
+                self.character_name,
+                [sheet_patch.set_path(("atributos", campo), valor) for campo, valor in valores.items()]
+            )
 
             embed = discord.Embed(
                 title="🎭 Atributos Sociais Atualizados",
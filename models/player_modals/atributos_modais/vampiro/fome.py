@@ -0,0 +1,50 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import discord
+from models.player_modals.player_basic_modal import PlayerModalBase
+from utils import sheet_patch, system_rolls
+from utils.i18n import t
+from utils.locale_resolver import resolve_locale
+
+class VampiroFomeModal(PlayerModalBase):
+    def __init__(self, interaction: discord.Interaction):
+        self.locale = resolve_locale(interaction)
+        super().__init__(interaction, title=t("status.hunger.title", self.locale))
+
+        self.fome = discord.ui.TextInput(
+            label=t("status.hunger.label", self.locale),
+            placeholder=t("status.hunger.ph", self.locale),
+            default=str(system_rolls.hunger_of(self.ficha)),
+            required=True,
+            max_length=1
+        )
+        self.add_item(self.fome)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        try:
+            fome = int(self.fome.value)
+        except ValueError:
+            fome = -1
+        if not 0 <= fome <= 5:
+            await interaction.response.send_message(t("status.hunger.invalid", self.locale), ephemeral=True)
+            return
+
+        await self.patch(sheet_patch.set_path(("recursos", "fome"), fome))
+        await interaction.response.send_message(t("status.hunger.saved", self.locale, value=fome), ephemeral=True)
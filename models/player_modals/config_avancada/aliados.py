@@ -64,7 +64,7 @@ class AddAllyModal(PlayerModalBase):
             "descricao": self.descricao.value
         })
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("add_ally.success", self.locale, name=self.nome.value),
@@ -64,7 +64,7 @@ class AddEnemyModal(PlayerModalBase):
             "descricao": self.descricao.value
         })
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("add_enemy.success", self.locale, name=self.nome.value),
@@ -64,7 +64,7 @@ class AddFearModal(PlayerModalBase):
             "descricao": self.descricao.value
         })
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("add_fear.success", self.locale, name=self.medo.value),
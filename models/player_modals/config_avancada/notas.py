@@ -53,7 +53,7 @@ class NotesModal(PlayerModalBase):
         roleplay_data = self.ficha.setdefault("roleplay", {})
         roleplay_data["notas_gerais"] = self.notas_gerais.value
         roleplay_data["recursos_especiais"] = self.recursos_especiais.value
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("notes.success", self.locale),
@@ -64,7 +64,7 @@ class AddSecretModal(PlayerModalBase):
             "quem_sabe": self.quem_sabe.value
         })
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("add_secret.success", self.locale),
@@ -56,7 +56,7 @@ class PlayerBasicInfoModal(PlayerModalBase):
             "raca_especie": self.raca_especie.value,
             "classe_profissao": self.classe_profissao.value,
         }
-        self.save()
+        await self.save()
         embed = discord.Embed(
             title=t("basic_info.saved.title", self.locale),
             description=f"**{self.titulo_apelido.value or t('common.na', self.locale)}**",
@@ -80,7 +80,7 @@ class PlayerExtraInfoModal(PlayerModalBase):
             "background": self.background.value,
             "origem": self.origem.value
         }
-        self.save()
+        await self.save()
 
         na = t("common.na", self.locale)
 
@@ -65,7 +65,7 @@ class PlayerGeneralInfoModal(PlayerModalBase):
             "idade": self.idade.value,
             "altura_peso": self.altura_peso.value,
         }
-        self.save()
+        await self.save()
 
         na = t("common.na", self.locale)
 
@@ -137,7 +137,7 @@ class AttackBuilderView(BaseBuilderView):
                 self.draft["itens_vinculados"] = []
             else:
                 self.draft["itens_vinculados"] = [v for v in select.values if v != "NO_ITEMS"]
-            self.save_draft()
+            await self.save_draft()
             await interaction.response.edit_message(embed=self.create_embed(), view=self)
 
         select.callback = callback
@@ -164,7 +164,7 @@ class AttackBuilderView(BaseBuilderView):
                 "alcance": modal.alcance.value,
                 "usos": modal.usos.value
             })
-            self.save_draft()
+            await self.save_draft()
             self._update_components_state()
             await interaction.edit_original_response(embed=self.create_embed(), view=self)
 
@@ -193,27 +193,12 @@ class AttackBuilderView(BaseBuilderView):
                 "margem_critico": modal.margem_critico.value,
                 "multiplicador_critico": modal.multiplicador_critico.value
             })
-            self.save_draft()
+            await self.save_draft()
             await interaction.edit_original_response(embed=self.create_embed(), view=self)
 
         button.callback = callback
         return button
 
-    def save_draft(self):
-        ficha = player_utils.load_player_sheet(self.character_name)
-        ataques = ficha.setdefault(self.draft_key, {})
-        nome_novo = (self.draft.get("nome") or "").strip().lower()
-
-        for atk_id, atk_data in ataques.items():
-            if atk_id != self.build_id and (atk_data.get("nome") or "").strip().lower() == nome_novo:
-                raise ValueError(self._i(
-                    "attack_builder.errors.duplicate_name",
-                    name=self.draft.get('nome') or ""
-                ))
-
-        ataques[self.build_id] = self.draft
-        player_utils.save_player_sheet(self.character_name, ficha)
-
     def back_button(self):
         self._ensure_locale()
         button = discord.ui.Button(
@@ -226,11 +211,7 @@ class AttackBuilderView(BaseBuilderView):
             self._ensure_locale(interaction)
             try:
                 from view.ficha_player.player_skills import PlayerAtaquesMenuView
-                ficha = player_utils.load_player_sheet(self.character_name)
-                drafts = ficha.get(self.draft_key, {})
-                if self.build_id in drafts:
-                    del drafts[self.build_id]
-                    player_utils.save_player_sheet(self.character_name, ficha)
+                self.discard_draft()
 
                 view = PlayerAtaquesMenuView(user=self.user)
 
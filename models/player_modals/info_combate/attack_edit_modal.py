@@ -115,7 +115,7 @@ class AttackEditModal(PlayerModalBase):
             )
             return
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("attack_edit.success", self.locale, name=self.nome.value),
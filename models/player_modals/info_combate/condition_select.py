@@ -17,7 +17,9 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.player_utils import load_player_sheet
+from utils.storage import store
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 
@@ -85,10 +87,8 @@ class ConditionSelect(discord.ui.Select):
         if not getattr(self, "locale", None):
             self.locale = resolve_locale(interaction)
 
-        ficha = load_player_sheet(self.character_name)
-
-        ficha["condicoes_ativas"] = list(self.values)
-        save_player_sheet(self.character_name, ficha)
+        selected = list(self.values)
+        await store.patch_player(self.character_name, [sheet_patch.set_path("condicoes_ativas", selected)])
 
         if not self.values:
             await interaction.response.send_message(
@@ -131,7 +131,7 @@ class PlayerCombatInfoModal(PlayerModalBase):
             "resistencia_magica": self.resistencia_magica.value,
             "iniciativa": self.iniciativa.value,
         }
-        self.save()
+        await self.save()
 
         embed = discord.Embed(
             title=t("combat_info.saved.title", self.locale),
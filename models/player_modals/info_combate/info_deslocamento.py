@@ -82,7 +82,7 @@ class PlayerMovementInfoModal(PlayerModalBase):
             "fraquezas": self.fraquezas.value,
             "imunidades": self.imunidades.value,
         }
-        self.save()
+        await self.save()
 
         na = t("common.na", self.locale)
 
@@ -18,6 +18,7 @@
 
 import discord
 from utils import player_utils
+from utils.storage import store
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 
@@ -101,13 +102,14 @@ class RemoveAttackView(discord.ui.View):
 
             attacks_to_remove = set(select.values)
 
-            ficha = player_utils.load_player_sheet(self.view.character_name)
-            current = ficha.get("ataques", [])
-            ficha["ataques"] = [
-                ataque for ataque in current
-                if not (isinstance(ataque, dict) and ataque.get("nome") in attacks_to_remove)
-            ]
-            player_utils.save_player_sheet(self.view.character_name, ficha)
+            def _apply(ficha: dict):
+                current = ficha.get("ataques", [])
+                ficha["ataques"] = [
+                    ataque for ataque in current
+                    if not (isinstance(ataque, dict) and ataque.get("nome") in attacks_to_remove)
+                ]
+
+            await store.update_player(self.view.character_name, _apply)
 
             await interaction.response.edit_message(
                 content=t("remove_attack.success", self.owner.locale, count=len(attacks_to_remove)),
@@ -127,4 +129,4 @@ class RemoveAttackView(discord.ui.View):
             await interaction.response.edit_message(
                 content=t("remove_attack.menu_title", self.owner.locale),
                 view=self.view.previous_view,
-            )
\ No newline at end of file
+            )
\ No newline at end of file
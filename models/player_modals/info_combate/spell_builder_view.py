@@ -18,6 +18,7 @@
 
 import discord
 from utils import player_utils
+from utils.storage import store
 from models.player_modals.info_combate.view_base_builder import BaseBuilderView
 from models.player_modals.info_combate.spell_modal import SpellPrimaryModal
 from models.player_modals.info_combate.spell_modal_2 import SpellDetailsModal
@@ -148,7 +149,7 @@ class SpellBuilderView(BaseBuilderView):
                 self.draft["itens_vinculados"] = []
             else:
                 self.draft["itens_vinculados"] = select.values
-            self.save_draft()
+            await self.save_draft()
             await interaction.response.edit_message(embed=self.create_embed(), view=self)
 
         select.callback = callback
@@ -168,9 +169,7 @@ class SpellBuilderView(BaseBuilderView):
         async def callback(interaction: discord.Interaction):
             self._ensure_locale(interaction)
             self.draft["atributo"] = select.values[0]
-            ficha = player_utils.load_player_sheet(self.character_name)
-            ficha.setdefault(self.draft_key, {})[self.build_id] = self.draft
-            player_utils.save_player_sheet(self.character_name, ficha)
+            await self.save_draft()
             await interaction.response.edit_message(embed=self.create_embed(), view=self)
 
         select.callback = callback
@@ -193,7 +192,7 @@ class SpellBuilderView(BaseBuilderView):
                 "tempo_conjuracao": modal.tempo_conjuracao.value,
                 "concentracao": modal.concentracao.value
             })
-            self.save_draft()
+            await self.save_draft()
             self._update_components_state()
             await interaction.edit_original_response(embed=self.create_embed(), view=self)
 
@@ -217,7 +216,7 @@ class SpellBuilderView(BaseBuilderView):
                 "formula_acerto": modal.formula_acerto.value,
                 "formula_dano_cura": modal.formula_dano_cura.value,
             })
-            self.save_draft()
+            await self.save_draft()
             await interaction.edit_original_response(embed=self.create_embed(), view=self)
 
         button.callback = callback
@@ -240,17 +239,12 @@ class SpellBuilderView(BaseBuilderView):
                 "classe_conjurador": modal.classe_conjurador.value,
                 "descricao": modal.descricao.value
             })
-            self.save_draft()
+            await self.save_draft()
             await interaction.edit_original_response(embed=self.create_embed(), view=self)
 
         button.callback = callback
         return button
 
-    def save_draft(self):
-        ficha = player_utils.load_player_sheet(self.character_name)
-        ficha.setdefault(self.draft_key, {})[self.build_id] = self.draft
-        player_utils.save_player_sheet(self.character_name, ficha)
-
     def save_button(self):
         self._ensure_locale()
         button = discord.ui.Button(label=self._i("spell_builder.btn.save"),
@@ -258,15 +252,6 @@ class SpellBuilderView(BaseBuilderView):
 
         async def callback(interaction: discord.Interaction):
             self._ensure_locale(interaction)
-            ficha = player_utils.load_player_sheet(self.character_name)
-
-            ataques = ficha.get("ataques")
-            if ataques is None:
-                ataques = []
-            elif isinstance(ataques, dict):
-                ataques = list(ataques.values())
-            elif not isinstance(ataques, list):
-                ataques = []
 
             nome_novo = (self.draft.get("nome") or "").strip()
             if not nome_novo:
@@ -299,20 +284,26 @@ class SpellBuilderView(BaseBuilderView):
                 "componentes": self.draft.get("componentes", ""),
             }
 
-            updated = False
-            for i, atk in enumerate(ataques):
-                if isinstance(atk, dict) and (atk.get("nome") or "").strip().lower() == nome_novo.lower():
-                    ataques[i] = ataque_like
-                    updated = True
-                    break
-            if not updated:
-                ataques.append(ataque_like)
+            def _apply(ficha: dict):
+                ataques = ficha.get("ataques")
+                if ataques is None:
+                    ataques = []
+                elif isinstance(ataques, dict):
+                    ataques = list(ataques.values())
+                elif not isinstance(ataques, list):
+                    ataques = []
+
+                for i, atk in enumerate(ataques):
+                    if isinstance(atk, dict) and (atk.get("nome") or "").strip().lower() == nome_novo.lower():
+                        ataques[i] = ataque_like
+                        break
+                else:
+                    ataques.append(ataque_like)
 
-            ficha["ataques"] = ataques
+                ficha["ataques"] = ataques
 
-            if self.build_id in ficha.get(self.draft_key, {}):
-                del ficha[self.draft_key][self.build_id]
-            player_utils.save_player_sheet(self.character_name, ficha)
+            await store.update_player(self.character_name, _apply)
+            self.discard_draft()
 
             embed = self.create_embed()
             embed.title = self._i("spell_builder.saved.title")
@@ -331,10 +322,7 @@ class SpellBuilderView(BaseBuilderView):
             self._ensure_locale(interaction)
             try:
                 from view.ficha_player.player_skills import PlayerAtaquesMenuView
-                ficha = player_utils.load_player_sheet(self.character_name)
-                if self.build_id in ficha.get(self.draft_key, {}):
-                    del ficha[self.draft_key][self.build_id]
-                    player_utils.save_player_sheet(self.character_name, ficha)
+                self.discard_draft()
                 view = PlayerAtaquesMenuView(user=self.user)
                 await interaction.response.edit_message(
                     content=self._i("spell_builder.menu_title"),
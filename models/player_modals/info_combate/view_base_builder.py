@@ -17,12 +17,16 @@
 # exclusive property of the author.
 
 import discord
-import time
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils.player_utils import load_player_sheet
+from utils.draft_store import drafts
+from utils.storage import store
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 
 class BaseBuilderView(discord.ui.View):
+    # Um rascunho aberto por (usuário, builder): reabrir o builder retoma o que ficou pela metade.
+    DRAFT_SLOT = "novo"
+
     def __init__(self, user: discord.User, build_id: str, build_type: str, build_type_plural: str):
         super().__init__(timeout=None)
         self.user = user
@@ -38,8 +42,7 @@ class BaseBuilderView(discord.ui.View):
         player_attributes_keys = ficha.get("atributos", {}).keys()
         self.player_attributes = list(player_attributes_keys)
         self.player_attributes.append(t("builder.attr.none", self.locale))
-        self.draft_key = f"{self.build_type_plural}_em_progresso"
-        self.draft = ficha.get(self.draft_key, {}).get(self.build_id, {})
+        self.draft = drafts.get(user.id, self.build_type_plural, self.DRAFT_SLOT) or {}
 
         self._add_components()
 
@@ -59,6 +62,12 @@ class BaseBuilderView(discord.ui.View):
     def _update_components_state(self):
         raise NotImplementedError
 
+    async def save_draft(self):
+        drafts.put(self.user.id, self.build_type_plural, self.DRAFT_SLOT, self.draft)
+
+    def discard_draft(self):
+        drafts.discard(self.user.id, self.build_type_plural, self.DRAFT_SLOT)
+
     def save_button(self):
         button = discord.ui.Button(
             label=self._i("builder.save.label"),
@@ -69,8 +78,6 @@ class BaseBuilderView(discord.ui.View):
         async def callback(interaction: discord.Interaction):
             self._ensure_locale(interaction)
 
-            ficha = load_player_sheet(self.character_name)
-            itens = ficha.setdefault(self.build_type_plural, [])
             nome_atual = (self.draft.get("nome") or "").strip().lower()
             if not nome_atual:
                 await interaction.response.send_message(
@@ -79,20 +86,21 @@ class BaseBuilderView(discord.ui.View):
                 )
                 return
 
-            for it in itens:
-                if (it.get("nome") or "").strip().lower() == nome_atual:
-                    await interaction.response.send_message(
-                        self._i("builder.errors.duplicate_name", name=self.draft.get("nome")),
-                        ephemeral=True
-                    )
-                    return
-
-            itens.append(self.draft)
-
-            if self.build_id in ficha.get(self.draft_key, {}):
-                del ficha[self.draft_key][self.build_id]
+            def _apply(ficha: dict) -> bool:
+                itens = ficha.setdefault(self.build_type_plural, [])
+                for it in itens:
+                    if (it.get("nome") or "").strip().lower() == nome_atual:
+                        return False
+                itens.append(self.draft)
+                return True
 
-            save_player_sheet(self.character_name, ficha)
+            if not await store.update_player(self.character_name, _apply):
+                await interaction.response.send_message(
+                    self._i("builder.errors.duplicate_name", name=self.draft.get("nome")),
+                    ephemeral=True
+                )
+                return
+            self.discard_draft()
 
             embed = self.create_embed()
             embed.title = self._i("builder.saved.title", item=self.build_type.capitalize())
@@ -124,10 +132,7 @@ class BaseBuilderView(discord.ui.View):
         async def callback(interaction: discord.Interaction):
             self._ensure_locale(interaction)
 
-            ficha = load_player_sheet(self.character_name)
-            if self.build_id in ficha.get(self.draft_key, {}):
-                del ficha[self.draft_key][self.build_id]
-                save_player_sheet(self.character_name, ficha)
+            self.discard_draft()
 
             self.stop()
             embed = self.create_embed()
@@ -155,9 +160,7 @@ class BaseBuilderView(discord.ui.View):
         async def callback(interaction: discord.Interaction):
             self._ensure_locale(interaction)
             self.draft["atributo"] = select.values[0]
-            ficha = load_player_sheet(self.character_name)
-            ficha.setdefault(self.draft_key, {})[self.build_id] = self.draft
-            save_player_sheet(self.character_name, ficha)
+            await self.save_draft()
             await interaction.response.edit_message(embed=self.create_embed(), view=self)
 
         select.callback = callback
@@ -96,7 +96,7 @@ class AddItemRandomModal(PlayerModalBase):
             "descricao": self.descricao.value
         })
 
-        self.save()
+        await self.save()
 
         na = t("common.na", self.locale)
         embed = discord.Embed(
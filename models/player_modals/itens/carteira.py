@@ -18,6 +18,7 @@
 
 import discord
 from models.player_modals.player_basic_modal import PlayerModalBase
+from utils import sheet_patch
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 
@@ -49,12 +50,10 @@ class WalletModal(PlayerModalBase):
         self.add_item(self.gemas)
 
     async def on_submit(self, interaction: discord.Interaction):
-        inventory = self.ficha.setdefault("inventario", {})
-        inventory["carteira"] = {
+        await self.patch(sheet_patch.set_path(("inventario", "carteira"), {
             "moedas": self.moedas.value,
             "gemas": self.gemas.value
-        }
-        self.save()
+        }))
 
         await interaction.response.send_message(
             t("wallet.saved", self.locale),
@@ -107,7 +107,7 @@ class AddItemCombatModal(PlayerModalBase):
         }
         combat_items.append(novo_item)
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("inv_add_combat.saved", self.locale, name=self.nome.value),
@@ -97,7 +97,7 @@ class AddItemConsumableModal(PlayerModalBase):
         }
         consumable_items.append(novo_item)
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("inv_add_cons.saved", self.locale, name=self.nome.value, qty=qtd),
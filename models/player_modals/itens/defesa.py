@@ -105,7 +105,7 @@ class AddItemDefenseModal(PlayerModalBase):
         }
         defense_items.append(novo_item)
 
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("inv_add_defense.saved", self.locale, name=self.nome.value),
@@ -16,8 +16,11 @@
 # from the software and are NOT covered by the AGPL. They remain the
 # exclusive property of the author.
 
+import copy
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
+from utils import sheet_patch
+from utils.player_utils import load_player_sheet
+from utils.storage import store
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 
@@ -30,9 +33,17 @@ class PlayerModalBase(discord.ui.Modal):
         self.interaction = interaction
         self.character_name = f"{interaction.user.id}_{interaction.user.name.lower()}"
         self.ficha = load_player_sheet(self.character_name)
+        # Cópia do que foi lido; no save só os campos que o modal mudou são aplicados.
+        self._base = copy.deepcopy(self.ficha)
+
+    async def patch(self, *ops: dict):
+        """Grava só os campos das ops (ver utils.sheet_patch), sem regravar a ficha."""
+        await store.patch_player(self.character_name, list(ops))
+        sheet_patch.apply(self.ficha, list(ops))
 
     def tr(self, key: str, **kwargs) -> str:
         return t(key, self.locale, **kwargs)
 
-    def save(self):
-        save_player_sheet(self.character_name, self.ficha)
+    async def save(self):
+        self.ficha = await store.merge_player(self.character_name, self._base, self.ficha)
+        self._base = copy.deepcopy(self.ficha)
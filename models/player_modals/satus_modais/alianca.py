@@ -70,7 +70,7 @@ class AllianceModal(PlayerModalBase):
             "contatos": self.contatos.value,
             "inimigos": self.inimigos.value
         }
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("alliances.saved", self.locale),
@@ -68,7 +68,7 @@ class AlignmentModal(PlayerModalBase):
             "defeitos": self.defeitos.value,
             "vinculos": self.vinculos.value
         }
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("alignment.saved", self.locale),
@@ -18,6 +18,7 @@
 
 import discord
 from models.player_modals.player_basic_modal import PlayerModalBase
+from utils import sheet_patch
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 
@@ -46,11 +47,10 @@ class CargaModal(PlayerModalBase):
         self.add_item(self.carga_maxima)
 
     async def on_submit(self, interaction: discord.Interaction):
-        self.ficha["carga"] = {
+        await self.patch(sheet_patch.set_path("carga", {
             "atual": self.carga_atual.value,
             "maxima": self.carga_maxima.value
-        }
-        self.save()
+        }))
 
         await interaction.response.send_message(
             t("load.saved", self.locale),
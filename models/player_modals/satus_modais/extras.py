@@ -42,7 +42,7 @@ class ExtrasModal(PlayerModalBase):
         self.ficha["extras"] = {
             "notas": self.notas.value
         }
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("extras.saved", self.locale),
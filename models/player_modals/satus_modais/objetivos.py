@@ -61,7 +61,7 @@ class ObjectivesModal(PlayerModalBase):
             "longo_prazo": self.longo_prazo.value,
             "secreto": self.secreto.value
         }
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("objectives.saved", self.locale),
@@ -51,7 +51,7 @@ class PersonalityModal(PlayerModalBase):
             "resumo": self.personalidade.value,
             "tracos_marcantes": self.tracos.value
         }
-        self.save()
+        await self.save()
 
         await interaction.response.send_message(
             t("personality.saved", self.locale),
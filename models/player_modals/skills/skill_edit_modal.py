@@ -61,7 +61,7 @@ class SkillEditModal(PlayerModalBase):
             if self.skill_name_to_edit and self.skill_name_to_edit != nome_val:
                 pericias = self.ficha.setdefault("pericias", {})
                 pericias.pop(self.skill_name_to_edit, None)
-                self.save()
+                await self.save()
 
             view = AttributeLinkView(user=interaction.user, skill_name=nome_val, skill_bonus=bonus_val)
 
@@ -18,6 +18,8 @@
 
 import discord
 from models.player_modals.player_basic_modal import PlayerModalBase
+from utils import sheet_patch
+from utils.draft_store import drafts
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 
@@ -25,8 +27,7 @@ class AddTestModifierModal(PlayerModalBase):
     def __init__(self, interaction: discord.Interaction):
         self.locale = resolve_locale(interaction)
         super().__init__(interaction, title=t("tests_add_mod.title", self.locale))
-        drafts_root = self.ficha.get("testes_modificadores_drafts", {}) or {}
-        saved = drafts_root.get("add", {}) or {}
+        saved = drafts.get(interaction.user.id, "teste_modificador", "add") or {}
 
         self.nome_teste = discord.ui.TextInput(
             label=t("tests_add_mod.name.label", self.locale),
@@ -56,23 +57,13 @@ class AddTestModifierModal(PlayerModalBase):
         self.add_item(self.condicao)
 
     async def on_submit(self, interaction: discord.Interaction):
-        modificadores = self.ficha.setdefault("testes_modificadores", [])
-
         novo_modificador = {
             "nome_teste": self.nome_teste.value,
             "modificador": self.modificador.value,
             "condicao": self.condicao.value
         }
-        modificadores.append(novo_modificador)
-
-        drafts_root = self.ficha.setdefault("testes_modificadores_drafts", {})
-        drafts_root["add"] = {
-            "nome_teste": self.nome_teste.value,
-            "modificador": self.modificador.value,
-            "condicao": self.condicao.value
-        }
-
-        self.save()
+        await self.patch(sheet_patch.append("testes_modificadores", novo_modificador))
+        drafts.put(interaction.user.id, "teste_modificador", "add", novo_modificador)
 
         await interaction.response.send_message(
             t("tests_add_mod.saved", self.locale, name=self.nome_teste.value),
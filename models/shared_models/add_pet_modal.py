@@ -18,6 +18,7 @@
 
 import discord
 from models.player_modals.player_basic_modal import PlayerModalBase
+from utils.draft_store import drafts
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 
@@ -25,8 +26,7 @@ class AddPetModal(PlayerModalBase):
     def __init__(self, interaction: discord.Interaction, *, locale: str | None = None):
         self.locale = locale or resolve_locale(interaction)
         super().__init__(interaction, title=t("pet.add.title", self.locale))
-        drafts_root = self.ficha.get("pets_drafts", {}) or {}
-        saved = drafts_root.get("add", {}) or {}
+        saved = drafts.get(interaction.user.id, "pet", "add") or {}
 
         self.pet_data: dict | None = None
 
@@ -83,9 +83,7 @@ class AddPetModal(PlayerModalBase):
             "personalidade": self.personalidade.value.strip(),
             "habilidades": self.habilidades.value.strip(),
         }
-        drafts_root = self.ficha.setdefault("pets_drafts", {})
-        drafts_root["add"] = dict(self.pet_data)
-        self.save()
+        drafts.put(interaction.user.id, "pet", "add", self.pet_data)
 
         await interaction.response.defer(ephemeral=True)
         self.stop()
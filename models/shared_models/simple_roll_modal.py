@@ -18,6 +18,7 @@
 
 import discord
 from models.player_modals.player_basic_modal import PlayerModalBase
+from utils.draft_store import drafts
 from utils.i18n import t
 from utils.locale_resolver import resolve_locale
 from utils.dice_roller import roll_dice
@@ -26,9 +27,7 @@ class SimpleRollModal(PlayerModalBase):
     def __init__(self, interaction: discord.Interaction):
         self.locale = resolve_locale(interaction)
         super().__init__(interaction, title=t("roll.simple.title", self.locale))
-        rolls_root = self.ficha.get("rolagens", {}) or {}
-        drafts = rolls_root.get("drafts", {}) or {}
-        saved = drafts.get("simple", {}) or {}
+        saved = drafts.get(interaction.user.id, "rolagem", "simples") or {}
 
         self.dice_string = discord.ui.TextInput(
             label=t("roll.simple.input.label", self.locale),
@@ -42,7 +41,8 @@ class SimpleRollModal(PlayerModalBase):
 
     async def on_submit(self, interaction: discord.Interaction):
         try:
-            total, breakdown = roll_dice(self.dice_string.value)
+            total, breakdown = await roll_dice(self.dice_string.value, user_id=interaction.user.id,
+                                               channel_id=interaction.channel_id, guild_id=interaction.guild_id)
         except Exception as e:
             await interaction.response.send_message(
                 t("roll.simple.errors.parse", self.locale, msg=str(e)),
@@ -50,10 +50,7 @@ class SimpleRollModal(PlayerModalBase):
             )
             return
 
-        rolls_root = self.ficha.setdefault("rolagens", {})
-        drafts = rolls_root.setdefault("drafts", {})
-        drafts["simple"] = {"dice": self.dice_string.value}
-        self.save()
+        drafts.put(interaction.user.id, "rolagem", "simples", {"dice": self.dice_string.value})
 
         embed = discord.Embed(
             title=t("roll.simple.embed.title", self.locale),
@@ -0,0 +1,155 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import asyncio
+import copy
+import itertools
+import pytest
+from utils import metrics, player_utils, sheet_cas, sheet_versions, storage_backends
+from utils.sheet_versions import VERSION_KEY
+
+_ids = itertools.count()
+
+class FakeSheet:
+    """Ficha em memória com a mesma regra de versão do backend real."""
+
+    def __init__(self, data: dict):
+        self.sheet_id = f"player:teste-cas-{next(_ids)}"
+        self.data = copy.deepcopy(data)
+        sheet_versions.stamp(self.sheet_id, self.data)
+        self.saves = 0
+
+    def load(self) -> dict:
+        return copy.deepcopy(self.data)
+
+    def save(self, data: dict):
+        sheet_versions.stamp(self.sheet_id, data)
+        self.data = copy.deepcopy(data)
+        self.saves += 1
+
+def test_diff_walks_dicts_and_replaces_lists_whole():
+    base = {"a": 1, "info": {"nome": "Ana", "idade": 20}, "pets": ["Rex"], "velho": True, VERSION_KEY: 3}
+    edited = {"a": 1, "info": {"nome": "Ana", "idade": 21}, "pets": ["Rex", "Mia"], "novo": 5, VERSION_KEY: 9}
+
+    changes = dict(sheet_cas.diff(base, edited))
+    assert changes[("info", "idade")] == 21
+    assert changes[("pets",)] == ["Rex", "Mia"]
+    assert changes[("novo",)] == 5
+    assert ("velho",) in changes
+    assert ("a",) not in changes and ("info", "nome") not in changes
+    assert (VERSION_KEY,) not in changes
+
+def test_apply_sets_nested_values_and_removes_keys():
+    base = {"info": {"nome": "Ana"}, "velho": 1}
+    edited = {"info": {"nome": "Bia"}, "extra": {"x": [1]}}
+    target = {"info": {"nome": "Ana", "idade": 30}, "velho": 1, "outro": 2}
+
+    sheet_cas.apply(target, sheet_cas.diff(base, edited))
+    assert target == {"info": {"nome": "Bia", "idade": 30}, "extra": {"x": [1]}, "outro": 2}
+    # Os valores aplicados são cópias: mexer no editado depois não vaza para a ficha.
+    edited["extra"]["x"].append(2)
+    assert target["extra"] == {"x": [1]}
+
+def test_merge_save_without_conflict_writes_the_edited_copy():
+    sheet = FakeSheet({"nivel": 1, "nome": "Ana"})
+    base = sheet.load()
+    edited = copy.deepcopy(base)
+    edited["nivel"] = 2
+    conflicts = metrics.counters().get("sheet.cas.conflicts", 0)
+
+    saved = sheet_cas.merge_save(sheet.sheet_id, base, edited, sheet.load, sheet.save)
+    assert saved is edited
+    assert sheet.data["nivel"] == 2
+    assert metrics.counters().get("sheet.cas.conflicts", 0) == conflicts
+
+def test_merge_save_keeps_concurrent_changes_to_other_fields():
+    sheet = FakeSheet({"nivel": 1, "carga": {"atual": 0, "max": 10}, "pets": []})
+    base = sheet.load()
+
+    other = sheet.load()
+    other["carga"]["atual"] = 7
+    other["pets"] = ["Rex"]
+    sheet.save(other)
+
+    edited = copy.deepcopy(base)
+    edited["nivel"] = 2
+    edited["carga"]["max"] = 15
+    conflicts = metrics.counters().get("sheet.cas.conflicts", 0)
+
+    saved = sheet_cas.merge_save(sheet.sheet_id, base, edited, sheet.load, sheet.save)
+    assert saved["nivel"] == 2
+    assert saved["carga"] == {"atual": 7, "max": 15}
+    assert saved["pets"] == ["Rex"]
+    assert sheet.data == saved
+    assert metrics.counters()["sheet.cas.conflicts"] == conflicts + 1
+    assert not sheet_versions.is_stale(sheet.sheet_id, saved)
+
+def test_merge_save_last_writer_wins_on_the_same_field():
+    sheet = FakeSheet({"nivel": 1})
+    base = sheet.load()
+    other = sheet.load()
+    other["nivel"] = 5
+    sheet.save(other)
+
+    edited = copy.deepcopy(base)
+    edited["nivel"] = 3
+    assert sheet_cas.merge_save(sheet.sheet_id, base, edited, sheet.load, sheet.save)["nivel"] == 3
+
+def test_merge_save_propagates_removed_keys():
+    sheet = FakeSheet({"nivel": 1, "rascunho": {"x": 1}})
+    base = sheet.load()
+    other = sheet.load()
+    other["nivel"] = 2
+    sheet.save(other)
+
+    edited = copy.deepcopy(base)
+    del edited["rascunho"]
+    saved = sheet_cas.merge_save(sheet.sheet_id, base, edited, sheet.load, sheet.save)
+    assert "rascunho" not in saved
+    assert saved["nivel"] == 2
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    from utils.storage import SheetStore
+    monkeypatch.setattr(storage_backends, "_backend", storage_backends.JsonFileBackend(
+        str(tmp_path / "players"), str(tmp_path / "npcs"), str(tmp_path / "servidores")))
+    monkeypatch.setattr(player_utils, "_sheet_cache", player_utils.SheetCache(flush_interval=0))
+    return SheetStore(max_workers=1)
+
+def test_store_merge_player_waits_for_a_running_update(store):
+    name = f"cas_{next(_ids)}"
+
+    async def scenario():
+        await store.put_player(name, {"nome": "Ana", "nivel": 1, "pv": 10})
+        base = copy.deepcopy(await store.get_player(name))
+        edited = copy.deepcopy(base)
+        edited["nivel"] = 2
+
+        async def slow_update(ficha):
+            await asyncio.sleep(0.01)
+            ficha["pv"] = 4
+
+        await asyncio.gather(store.update_player(name, slow_update), store.merge_player(name, base, edited))
+        return await store.get_player(name)
+
+    ficha = asyncio.run(scenario())
+    assert ficha["nivel"] == 2
+    assert ficha["pv"] == 4
+    on_disk = storage_backends.get_backend().load_player(player_utils.player_key(name))
+    assert on_disk["nivel"] == 2 and on_disk["pv"] == 4
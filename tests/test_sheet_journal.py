@@ -0,0 +1,131 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import json
+import os
+import pytest
+from utils import sheet_patch
+from utils.sheet_versions import VERSION_KEY
+from utils.storage_backends import JsonFileBackend
+
+@pytest.fixture
+def backend(tmp_path):
+    return JsonFileBackend(str(tmp_path / "players"), str(tmp_path / "npcs"), str(tmp_path / "servidores"),
+                           compact_entries=4)
+
+def _base_on_disk(backend, key):
+    with open(backend.player_path(key), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _journal(backend, key):
+    return backend.journal_path(backend.player_path(key))
+
+def test_patch_goes_to_journal_and_is_replayed_on_load(backend):
+    backend.save_player("ana", {"nome": "Ana", "carga": {"atual": 0}, VERSION_KEY: 1})
+    backend.patch_player("ana", [sheet_patch.set_path(("carga", "atual"), 12)], 2)
+    backend.patch_player("ana", [sheet_patch.append("pets", {"nome": "Rex"})], 3)
+
+    assert os.path.exists(_journal(backend, "ana"))
+    assert _base_on_disk(backend, "ana")["carga"] == {"atual": 0}
+    data = backend.load_player("ana")
+    assert data["carga"] == {"atual": 12}
+    assert data["pets"] == [{"nome": "Rex"}]
+
+def test_replay_skips_entries_already_in_the_base(backend):
+    # Crash entre gravar o base compactado e apagar o journal: as entradas
+    # com versão <= a do base não podem ser aplicadas de novo.
+    backend.save_player("ana", {"pets": [], VERSION_KEY: 1})
+    backend.patch_player("ana", [sheet_patch.append("pets", "Rex")], 2)
+    backend.patch_player("ana", [sheet_patch.append("pets", "Mia")], 3)
+    with open(backend.player_path("ana"), "w", encoding="utf-8") as f:
+        json.dump({"pets": ["Rex"], VERSION_KEY: 2}, f)
+
+    assert backend.load_player("ana")["pets"] == ["Rex", "Mia"]
+
+def test_truncated_journal_line_is_ignored(backend):
+    backend.save_player("ana", {"nivel": 1, VERSION_KEY: 1})
+    backend.patch_player("ana", [sheet_patch.set_path("nivel", 2)], 2)
+    with open(_journal(backend, "ana"), "a", encoding="utf-8") as f:
+        f.write('{"v": 3, "ops": [{"op": "set", "pa')
+
+    assert backend.load_player("ana")["nivel"] == 2
+
+def test_journal_is_compacted_after_compact_entries(backend):
+    backend.save_player("ana", {"nivel": 0, VERSION_KEY: 1})
+    for version in range(2, 6):
+        backend.patch_player("ana", [sheet_patch.set_path("nivel", version)], version)
+
+    assert not os.path.exists(_journal(backend, "ana"))
+    assert _base_on_disk(backend, "ana")["nivel"] == 5
+    assert backend.load_player("ana")["nivel"] == 5
+
+def test_compaction_counts_entries_written_by_a_previous_process(backend, tmp_path):
+    backend.save_player("ana", {"nivel": 0, VERSION_KEY: 1})
+    backend.patch_player("ana", [sheet_patch.set_path("nivel", 2)], 2)
+    backend.patch_player("ana", [sheet_patch.set_path("nivel", 3)], 3)
+
+    restarted = JsonFileBackend(backend.players_dir, backend.npcs_dir, backend.servers_dir, compact_entries=4)
+    restarted.patch_player("ana", [sheet_patch.set_path("nivel", 4)], 4)
+    assert os.path.exists(_journal(restarted, "ana"))
+    restarted.patch_player("ana", [sheet_patch.set_path("nivel", 5)], 5)
+    assert not os.path.exists(_journal(restarted, "ana"))
+    assert _base_on_disk(restarted, "ana")["nivel"] == 5
+
+def test_full_save_drops_the_journal(backend):
+    backend.save_player("ana", {"nivel": 1, VERSION_KEY: 1})
+    backend.patch_player("ana", [sheet_patch.set_path("nivel", 2)], 2)
+    backend.save_player("ana", {"nivel": 7, VERSION_KEY: 3})
+
+    assert not os.path.exists(_journal(backend, "ana"))
+    assert backend.load_player("ana") == {"nivel": 7, VERSION_KEY: 3}
+
+def test_compact_without_journal_is_a_noop(backend):
+    backend.save_player("ana", {"nivel": 1, VERSION_KEY: 1})
+    before = os.path.getmtime(backend.player_path("ana"))
+    backend.compact(backend.player_path("ana"))
+    assert os.path.getmtime(backend.player_path("ana")) == before
+
+def test_patch_of_missing_sheet_writes_it_in_full(backend):
+    backend.patch_player("novo", [sheet_patch.set_path("nivel", 1)], 1)
+
+    assert not os.path.exists(_journal(backend, "novo"))
+    assert _base_on_disk(backend, "novo")["nivel"] == 1
+
+def test_delete_removes_the_journal(backend):
+    backend.save_player("ana", {"nivel": 1, VERSION_KEY: 1})
+    backend.patch_player("ana", [sheet_patch.set_path("nivel", 2)], 2)
+
+    assert backend.delete_player("ana")
+    assert not os.path.exists(_journal(backend, "ana"))
+    assert backend.load_player("ana") is None
+
+def test_npc_patch_journals_plain_fields_and_rewrites_index_fields(backend):
+    backend.save_npc(1, 2, "Goblin", {"nome": "Goblin", "visivel_para_players": False, "pv": 7, VERSION_KEY: 1})
+    path = backend.npc_path(1, 2, "Goblin")
+
+    backend.patch_npc(1, 2, "Goblin", [sheet_patch.set_path("pv", 3)], 2)
+    assert os.path.exists(backend.journal_path(path))
+
+    backend.patch_npc(1, 2, "Goblin", [sheet_patch.set_path("visivel_para_players", True)], 3)
+    assert not os.path.exists(backend.journal_path(path))
+    with open(path, "r", encoding="utf-8") as f:
+        on_disk = json.load(f)
+    assert on_disk["visivel_para_players"] is True
+    assert on_disk["pv"] == 3
+    assert backend.list_visible_npcs(1) == ["Goblin"]
@@ -0,0 +1,40 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import asyncio
+import pytest
+from utils import dice_roller, system_rolls
+
+@pytest.mark.parametrize("system", ["vampiro", "cthulhu", "ordem_paranormal"])
+def test_system_check_replays_from_its_ticket(system):
+    async def scenario():
+        engine = system_rolls.get_engine(system)
+        rolagem = await system_rolls.roll_check(engine, {"recursos": {"fome": 2}}, 4, 3, "vantagem", "")
+        return rolagem, await dice_roller.replay_roll(rolagem.ticket)
+
+    rolagem, replayed = asyncio.run(scenario())
+    assert rolagem.ticket and rolagem.spec.startswith(system + ":")
+    assert replayed.total == rolagem.total
+    assert replayed.breakdown == rolagem.breakdown
+
+def test_parse_spec_ignores_dice_expressions():
+    assert system_rolls.parse_spec("1d20+5") is None
+    assert system_rolls.parse_spec("vampiro:x") is None
+    engine, args = system_rolls.parse_spec("vampiro:7:2")
+    assert engine.name == "vampiro" and args == (7, 2)
@@ -0,0 +1,292 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import os
+import re
+from utils.dice_executor import DiceExecutor
+from utils.dice_stats import UnsupportedDistribution
+from utils.fast_dice import FastDice
+from utils.pool_dice import PoolDice, np, HAS_NUMPY
+
+SIM_WORKERS = int(os.getenv("SIM_WORKERS", "1"))
+SIM_TIMEOUT = float(os.getenv("SIM_TIMEOUT", "10"))
+SIM_MAX_ITERATIONS = int(os.getenv("SIM_MAX_ITERATIONS", "200000"))
+SIM_MAX_ROUNDS = int(os.getenv("SIM_MAX_ROUNDS", "50"))
+# Iterações por bloco; limita a memória das matrizes de dados.
+SIM_CHUNK = 25000
+DEFAULT_AC = 10
+
+class SimulationUnavailable(RuntimeError):
+    """O simulador precisa da NumPy para vetorizar as rolagens."""
+
+class SimAttack:
+    """
+    Ataque já compilado para o simulador: termos de dado como
+    (sinal, qtd, lados, modo, n) com modo em {None, "kh", "kl"}, constantes
+    somadas e, se houver, o índice do d20 natural no teste de acerto.
+    """
+    __slots__ = ("name", "repeat", "hit_terms", "hit_const", "natural", "crit_range", "multiplier",
+                 "damage_terms", "damage_const")
+
+    def __init__(self, name: str, repeat: int, hit_terms: tuple, hit_const: int, natural: int | None,
+                 crit_range: int, multiplier: int, damage_terms: tuple, damage_const: int):
+        self.name = name
+        self.repeat = repeat
+        self.hit_terms = hit_terms
+        self.hit_const = hit_const
+        self.natural = natural
+        self.crit_range = crit_range
+        self.multiplier = multiplier
+        self.damage_terms = damage_terms
+        self.damage_const = damage_const
+
+class SimCombatant:
+    __slots__ = ("name", "hp", "ac", "attacks")
+
+    def __init__(self, name: str, hp: int, ac: int, attacks: list[SimAttack]):
+        self.name = name
+        self.hp = hp
+        self.ac = ac
+        self.attacks = attacks
+
+def _compile_terms(expr: str) -> tuple[tuple, int]:
+    from utils.dice_roller import _roll_plans
+    plan = _roll_plans.get(expr)
+    if plan.fallback:
+        raise UnsupportedDistribution(f"expressão não suportada: {expr}")
+    terms, const = [], 0
+    for sign, value, compiled, _ in plan.terms:
+        if compiled is None:
+            const += sign * value
+            continue
+        if not isinstance(compiled, (FastDice, PoolDice)) or getattr(compiled, "op", None):
+            raise UnsupportedDistribution(f"termo não suportado no simulador: {expr}")
+        mode, n = compiled.mode, compiled.n
+        if mode in ("ph", "pl"):
+            mode, n = ("kl" if mode == "ph" else "kh"), compiled.count - n
+        if mode is not None and n >= compiled.count:
+            mode = None
+        terms.append((sign, compiled.count, compiled.sides, mode, max(0, n)))
+    return tuple(terms), const
+
+def _natural_index(terms: tuple) -> int | None:
+    # Mesma regra do dice_stats: um único d20 mantendo um dado é o natural.
+    found = None
+    for i, (sign, count, sides, mode, n) in enumerate(terms):
+        if sides != 20:
+            continue
+        kept = count if mode is None else n
+        if found is not None or sign < 0 or kept != 1:
+            raise UnsupportedDistribution("acerto com mais de um d20 natural")
+        found = i
+    return found
+
+def compile_attack(ficha: dict, selected_attack: dict, advantage_state: str = "normal") -> SimAttack:
+    from utils.dice_roller import _attack_modifier, _apply_advantage, _damage_parts, _resolve_mod
+    modifier = _attack_modifier(ficha, selected_attack)
+    hit_formula = selected_attack.get("teste_de_acerto", "d20+MOD")
+    match = re.match(r'^\s*(\d+)\s*#\s*(.+)$', hit_formula)
+    repeat = int(match.group(1)) if match else 1
+    base = match.group(2).strip() if match else hit_formula
+    hit_terms, hit_const = _compile_terms(_apply_advantage(_resolve_mod(base, modifier), advantage_state))
+    dano_base_str, _ = _damage_parts(ficha, selected_attack)
+    damage_terms, damage_const = _compile_terms(dano_base_str)
+    return SimAttack(
+        selected_attack.get("nome", ""), repeat, hit_terms, hit_const, _natural_index(hit_terms),
+        int(selected_attack.get("margem_critico", 20)), int(selected_attack.get("multiplicador_critico", 2)),
+        damage_terms, damage_const + modifier,
+    )
+
+def _first_int(value, default: int) -> int:
+    match = re.search(r'-?\d+', str(value or ""))
+    return int(match.group()) if match else default
+
+def combatant_from_sheet(ficha: dict, nome: str, ataques: list[str] | None = None,
+                         advantage_state: str = "normal") -> SimCombatant:
+    """
+    Monta um combatente a partir de uma ficha de player ou NPC. Usa a vida
+    máxima, o primeiro número do campo de defesa como CA e, por rodada, os
+    ataques nomeados (por padrão só o primeiro da ficha).
+    """
+    combate = ficha.get("informacoes_combate") or {}
+    lista = ficha.get("ataques") or []
+    if isinstance(lista, dict):
+        lista = list(lista.values())
+    lista = [a for a in lista if isinstance(a, dict)]
+    if ataques:
+        nomes = {n.strip().lower() for n in ataques}
+        escolhidos = [a for a in lista if str(a.get("nome", "")).strip().lower() in nomes]
+    else:
+        escolhidos = lista[:1]
+    hp = _first_int(combate.get("vida_maxima", combate.get("vida_atual")), 1)
+    return SimCombatant(nome, max(1, hp), _first_int(combate.get("defesa"), DEFAULT_AC),
+                        [compile_attack(ficha, a, advantage_state) for a in escolhidos])
+
+def _roll_terms(rng, terms: tuple, const: int, size: int):
+    total = np.full(size, const, dtype=np.int64)
+    for sign, count, sides, mode, n in terms:
+        total += sign * _roll_dice(rng, count, sides, mode, n, size)
+    return total
+
+def _roll_dice(rng, count: int, sides: int, mode: str | None, n: int, size: int):
+    values = rng.integers(1, sides + 1, size=(size, count), dtype=np.int64)
+    if count == 1:
+        return values[:, 0]
+    if mode is None:
+        return values.sum(axis=1)
+    if n == 1:
+        return values.max(axis=1) if mode == "kh" else values.min(axis=1)
+    values.sort(axis=1)
+    return values[:, count - n:].sum(axis=1) if mode == "kh" else values[:, :n].sum(axis=1)
+
+def _attack_damage(rng, attack: SimAttack, ac, size: int):
+    """Dano de um uso do ataque (com as repetições N#) em `size` iterações."""
+    dealt = np.zeros(size, dtype=np.int64)
+    for _ in range(attack.repeat):
+        if attack.natural is None:
+            hit = _roll_terms(rng, attack.hit_terms, attack.hit_const, size) >= ac
+            crit = None
+        else:
+            nat_term = attack.hit_terms[attack.natural]
+            rest = attack.hit_terms[:attack.natural] + attack.hit_terms[attack.natural + 1:]
+            natural = _roll_dice(rng, *nat_term[1:], size)
+            total = natural + _roll_terms(rng, rest, attack.hit_const, size)
+            crit = natural >= attack.crit_range
+            hit = crit | ((natural > 1) & (total >= ac))
+        damage = np.maximum(_roll_terms(rng, attack.damage_terms, attack.damage_const, size), 0)
+        if crit is not None:
+            damage = np.where(crit, damage * attack.multiplier, damage)
+        dealt += damage * hit
+    return dealt
+
+def _round_damage(rng, combatant: SimCombatant, ac, size: int):
+    dealt = np.zeros(size, dtype=np.int64)
+    for attack in combatant.attacks:
+        dealt += _attack_damage(rng, attack, ac, size)
+    return dealt
+
+class _Moments:
+    __slots__ = ("n", "total", "squares")
+
+    def __init__(self):
+        self.n = 0
+        self.total = 0.0
+        self.squares = 0.0
+
+    def add(self, values):
+        self.n += int(values.size)
+        self.total += float(values.sum())
+        self.squares += float((values.astype(np.float64) ** 2).sum())
+
+    def summary(self) -> dict:
+        if not self.n:
+            return {"media": 0.0, "variancia": 0.0, "desvio": 0.0}
+        mean = self.total / self.n
+        var = max(0.0, self.squares / self.n - mean * mean)
+        return {"media": mean, "variancia": var, "desvio": var ** 0.5}
+
+def _simulate_chunk(rng, party: list[SimCombatant], enemy: SimCombatant, size: int, max_rounds: int,
+                    party_moments: _Moments, member_moments: list[_Moments], enemy_moments: _Moments):
+    party_ac = np.array([m.ac for m in party], dtype=np.int64)
+    party_hp = np.array([[m.hp] for m in party], dtype=np.int64).repeat(size, axis=1)
+    enemy_hp = np.full(size, enemy.hp, dtype=np.int64)
+    kill_round = np.zeros(size, dtype=np.int64)
+    wipe_round = np.zeros(size, dtype=np.int64)
+    active = np.ones(size, dtype=bool)
+    for rnd in range(1, max_rounds + 1):
+        idx = np.flatnonzero(active)
+        if not idx.size:
+            break
+        # A party age primeiro; o inimigo só responde se sobreviver à rodada.
+        round_total = np.zeros(idx.size, dtype=np.int64)
+        for i, member in enumerate(party):
+            alive = party_hp[i, idx] > 0
+            dealt = _round_damage(rng, member, enemy.ac, idx.size) * alive
+            member_moments[i].add(dealt[alive])
+            round_total += dealt
+        party_moments.add(round_total)
+        enemy_hp[idx] -= round_total
+        killed = enemy_hp[idx] <= 0
+        kill_round[idx[killed]] = rnd
+        survivors = idx[~killed]
+        if survivors.size and enemy.attacks:
+            alive = party_hp[:, survivors] > 0
+            target = (rng.random(alive.shape) * alive).argmax(axis=0)
+            dealt = _round_damage(rng, enemy, party_ac[target], survivors.size)
+            enemy_moments.add(dealt)
+            party_hp[target, survivors] -= dealt
+            wiped = ~(party_hp[:, survivors] > 0).any(axis=0)
+            wipe_round[survivors[wiped]] = rnd
+            active[survivors[wiped]] = False
+        active[idx[killed]] = False
+    return kill_round, wipe_round
+
+def simulate(party: list[SimCombatant], enemy: SimCombatant, iterations: int = 10000,
+             max_rounds: int = SIM_MAX_ROUNDS, seed: int | None = None) -> dict:
+    """
+    Simula `iterations` combates party x inimigo, rodada a rodada, com as
+    rolagens de todas as iterações vetorizadas. Relata DPR (média e
+    variância), rodadas até derrubar o inimigo e taxa de vitória.
+    """
+    if not HAS_NUMPY:
+        raise SimulationUnavailable("simulador de combate requer numpy")
+    iterations = max(1, min(iterations, SIM_MAX_ITERATIONS))
+    rng = np.random.default_rng(seed)
+    party_moments = _Moments()
+    member_moments = [_Moments() for _ in party]
+    enemy_moments = _Moments()
+    kills, wipes = [], []
+    for start in range(0, iterations, SIM_CHUNK):
+        size = min(SIM_CHUNK, iterations - start)
+        kill_round, wipe_round = _simulate_chunk(rng, party, enemy, size, max_rounds,
+                                                 party_moments, member_moments, enemy_moments)
+        kills.append(kill_round)
+        wipes.append(wipe_round)
+    kill_round = np.concatenate(kills)
+    wipe_round = np.concatenate(wipes)
+    killed = kill_round[kill_round > 0]
+    ttk = {"media": 0.0, "desvio": 0.0, "percentis": {}}
+    if killed.size:
+        ttk = {
+            "media": float(killed.mean()),
+            "desvio": float(killed.std()),
+            "percentis": {p: int(np.percentile(killed, p, method="higher")) for p in (10, 50, 90)},
+        }
+    return {
+        "iteracoes": iterations,
+        "rodadas_max": max_rounds,
+        "vitoria": float((kill_round > 0).mean()),
+        "derrota": float((wipe_round > 0).mean()),
+        "sem_resultado": float(((kill_round == 0) & (wipe_round == 0)).mean()),
+        "rodadas_para_derrubar": ttk,
+        "dpr_party": party_moments.summary(),
+        "dpr_membros": [{"nome": m.name, **mom.summary()} for m, mom in zip(party, member_moments)],
+        "dpr_inimigo": enemy_moments.summary(),
+    }
+
+# Processo separado: a simulação é CPU pura e não pode segurar o GIL do bot.
+simulation_executor = DiceExecutor(kind="process", max_workers=SIM_WORKERS, max_pending=SIM_WORKERS * 2,
+                                   per_user=1, per_channel=1, timeout=SIM_TIMEOUT, name="combat_sim")
+
+async def run_simulation(party: list[SimCombatant], enemy: SimCombatant, iterations: int = 10000,
+                         max_rounds: int = SIM_MAX_ROUNDS, seed: int | None = None,
+                         user_id: int | None = None, channel_id: int | None = None) -> dict:
+    """Roda simulate() no processo dedicado; levanta DiceRejected se ocupado ou em timeout."""
+    return await simulation_executor.submit(simulate, party, enemy, iterations, max_rounds, seed,
+                                            user_id=user_id, channel_id=channel_id)
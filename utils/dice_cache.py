@@ -0,0 +1,104 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import os
+import threading
+from collections import OrderedDict
+import d20
+from utils.fast_dice import FastDice
+from utils.pool_dice import PoolDice
+
+DICE_CACHE_SIZE = int(os.getenv("DICE_CACHE_SIZE", "1024"))
+
+_local = threading.local()
+
+def _roller() -> d20.Roller:
+    # d20.Roller guarda estado da rolagem corrente (RollContext); um por thread.
+    roller = getattr(_local, "roller", None)
+    if roller is None:
+        roller = _local.roller = d20.Roller()
+    return roller
+
+def parse(expr: str) -> d20.ast.Expression:
+    return _roller().parse(expr, allow_comments=True)
+
+def roll_parsed(node):
+    """Rola um termo compilado: FastDice/PoolDice nativos ou AST do d20 sem reparsear."""
+    if isinstance(node, (FastDice, PoolDice)):
+        return node.roll()
+    return _roller().roll(node)
+
+class CompiledRoll:
+    """
+    Plano de rolagem de uma expressão: já traduzida para a sintaxe do d20 e
+    quebrada em termos (sinal, modificador, FastDice, PoolDice ou AST do d20), com o custo
+    estimado (dice_cost). Imutável, pode ser re-rolado quantas vezes for preciso.
+    """
+    __slots__ = ("source", "translated", "terms", "fallback", "cost")
+
+    def __init__(self, source: str, translated: str = "", terms: tuple = (), fallback: bool = False,
+                 cost=None):
+        self.source = source
+        self.translated = translated
+        self.terms = terms
+        self.fallback = fallback
+        self.cost = cost
+
+class RollPlanCache:
+    """Cache LRU de expressão crua -> CompiledRoll, com contadores de acerto."""
+
+    def __init__(self, compile_fn, max_entries: int = DICE_CACHE_SIZE):
+        self.compile_fn = compile_fn
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, CompiledRoll]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, expr: str) -> CompiledRoll:
+        with self._lock:
+            plan = self._entries.get(expr)
+            if plan is not None:
+                self._entries.move_to_end(expr)
+                self.hits += 1
+                return plan
+            self.misses += 1
+        plan = self.compile_fn(expr)
+        with self._lock:
+            self._entries[expr] = plan
+            self._entries.move_to_end(expr)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return plan
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,175 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import os
+import re
+
+# Tetos globais; cada servidor pode apertar (nunca afrouxar) estes valores.
+DICE_MAX_LENGTH = int(os.getenv("DICE_MAX_LENGTH", "200"))
+DICE_MAX_DICE = int(os.getenv("DICE_MAX_DICE", "100000"))
+DICE_MAX_SIDES = int(os.getenv("DICE_MAX_SIDES", "10000"))
+DICE_MAX_KEEP_WORK = int(os.getenv("DICE_MAX_KEEP_WORK", "2000000"))
+DICE_MAX_DEPTH = int(os.getenv("DICE_MAX_DEPTH", "8"))
+DICE_MAX_TERMS = int(os.getenv("DICE_MAX_TERMS", "40"))
+# Maior literal aceito (em dígitos); evita aritmética com inteiros gigantes.
+MAX_LITERAL_DIGITS = 9
+# Acima disso o d20 recusa a rolagem (RollContext.max_rolls); vai direto para a pool.
+D20_MAX_ROLLS = 1000
+
+SETTINGS_KEY = "limites_dados"
+
+_TOKEN_RE = re.compile(
+    r'(?P<count>\d*)d(?P<sides>\d+|f)(?P<ops>(?:(?:kh|kl|ph|pl|dh|dl|k|p|rr|ro|ra|mi|ma|e)[<>=]?\d+)*)'
+    r'|(?P<num>\d+)|(?P<paren>[()])',
+    re.IGNORECASE,
+)
+_SELECT_OPS = re.compile(r'(kh|kl|ph|pl|dh|dl|k|p)(?=[<>=]?\d)', re.IGNORECASE)
+_REROLL_OPS = re.compile(r'(rr|ra|e)(?=[<>=]?\d)', re.IGNORECASE)
+
+class ExpressionCost:
+    """
+    Custo estimado de uma expressão antes de rolar: dados rolados, trabalho
+    de seleção (kh/kl/ph/pl, ~n·log n), maior dado, profundidade de
+    parênteses, número de termos e tamanho do maior literal.
+    """
+    __slots__ = ("dice", "keep_work", "max_sides", "depth", "terms", "literal_digits", "balanced")
+
+    def __init__(self, dice: int = 0, keep_work: int = 0, max_sides: int = 0, depth: int = 0,
+                 terms: int = 0, literal_digits: int = 0, balanced: bool = True):
+        self.dice = dice
+        self.keep_work = keep_work
+        self.max_sides = max_sides
+        self.depth = depth
+        self.terms = terms
+        self.literal_digits = literal_digits
+        self.balanced = balanced
+
+    def __repr__(self):
+        return (f"ExpressionCost(dice={self.dice}, keep_work={self.keep_work}, max_sides={self.max_sides}, "
+                f"depth={self.depth}, terms={self.terms})")
+
+def estimate(expr: str) -> ExpressionCost:
+    """Varre a expressão (já na sintaxe do d20) sem rolar nada."""
+    cost = ExpressionCost()
+    depth = 0
+    for m in _TOKEN_RE.finditer(expr):
+        if m.group("paren"):
+            depth += 1 if m.group("paren") == "(" else -1
+            if depth < 0:
+                cost.balanced = False
+                depth = 0
+            cost.depth = max(cost.depth, depth)
+            continue
+        cost.terms += 1
+        if m.group("num") is not None:
+            cost.literal_digits = max(cost.literal_digits, len(m.group("num").lstrip("0")))
+            continue
+        count_text = m.group("count")
+        cost.literal_digits = max(cost.literal_digits, len(count_text.lstrip("0")))
+        count = int(count_text) if count_text else 1
+        if len(count_text) > MAX_LITERAL_DIGITS:
+            continue
+        sides = m.group("sides")
+        if sides.isdigit():
+            cost.literal_digits = max(cost.literal_digits, len(sides.lstrip("0")))
+            if len(sides) <= MAX_LITERAL_DIGITS:
+                cost.max_sides = max(cost.max_sides, int(sides))
+        ops = m.group("ops")
+        rolled = count
+        # Explodir/rerrolar pode rolar de novo cada dado; conta em dobro.
+        for _ in _REROLL_OPS.finditer(ops):
+            rolled *= 2
+        cost.dice += rolled
+        for _ in _SELECT_OPS.finditer(ops):
+            cost.keep_work += rolled * max(1, rolled.bit_length())
+    if depth:
+        cost.balanced = False
+    return cost
+
+class DiceLimits:
+    __slots__ = ("max_length", "max_dice", "max_sides", "max_keep_work", "max_depth", "max_terms")
+
+    FIELDS = ("max_length", "max_dice", "max_sides", "max_keep_work", "max_depth", "max_terms")
+
+    def __init__(self, max_length: int = DICE_MAX_LENGTH, max_dice: int = DICE_MAX_DICE,
+                 max_sides: int = DICE_MAX_SIDES, max_keep_work: int = DICE_MAX_KEEP_WORK,
+                 max_depth: int = DICE_MAX_DEPTH, max_terms: int = DICE_MAX_TERMS):
+        self.max_length = max_length
+        self.max_dice = max_dice
+        self.max_sides = max_sides
+        self.max_keep_work = max_keep_work
+        self.max_depth = max_depth
+        self.max_terms = max_terms
+
+    @classmethod
+    def from_settings(cls, values: dict | None) -> "DiceLimits":
+        """Limites do servidor, sempre presos aos tetos globais."""
+        limits = cls()
+        for field in cls.FIELDS:
+            value = (values or {}).get(field)
+            if isinstance(value, int) and value > 0:
+                setattr(limits, field, min(value, getattr(DEFAULT_LIMITS, field)))
+        return limits
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def violation(self, cost: ExpressionCost) -> str | None:
+        """Nome do limite estourado, ou None se a expressão pode rodar."""
+        if cost.literal_digits > MAX_LITERAL_DIGITS:
+            return "literal"
+        if cost.dice > self.max_dice:
+            return "dice"
+        if cost.max_sides > self.max_sides:
+            return "sides"
+        if cost.keep_work > self.max_keep_work:
+            return "keep"
+        if cost.depth > self.max_depth:
+            return "depth"
+        if cost.terms > self.max_terms:
+            return "terms"
+        return None
+
+DEFAULT_LIMITS = DiceLimits()
+
+_guild_limits: dict[int, DiceLimits] = {}
+
+async def limits_for(guild_id: int | None) -> DiceLimits:
+    if guild_id is None:
+        return DEFAULT_LIMITS
+    limits = _guild_limits.get(guild_id)
+    if limits is None:
+        from utils.storage import store
+        settings = await store.get_guild_settings(guild_id)
+        limits = _guild_limits[guild_id] = DiceLimits.from_settings(settings.get(SETTINGS_KEY))
+    return limits
+
+async def set_guild_limits(guild_id: int, values: dict | None) -> DiceLimits:
+    """Grava os limites do servidor (None volta aos tetos globais)."""
+    from utils.storage import store
+    def _apply(settings: dict) -> DiceLimits:
+        if values:
+            current = dict(settings.get(SETTINGS_KEY) or {})
+            current.update({k: v for k, v in values.items() if k in DiceLimits.FIELDS and v})
+            settings[SETTINGS_KEY] = current
+        else:
+            settings.pop(SETTINGS_KEY, None)
+        limits = _guild_limits[guild_id] = DiceLimits.from_settings(settings.get(SETTINGS_KEY))
+        return limits
+    return await store.update_guild_settings(guild_id, _apply)
@@ -0,0 +1,153 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import os
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from utils import metrics
+
+DICE_EXECUTOR = os.getenv("DICE_EXECUTOR", "thread")
+DICE_WORKERS = int(os.getenv("DICE_WORKERS", "2"))
+DICE_MAX_PENDING = int(os.getenv("DICE_MAX_PENDING", "64"))
+DICE_MAX_PER_USER = int(os.getenv("DICE_MAX_PER_USER", "2"))
+DICE_MAX_PER_CHANNEL = int(os.getenv("DICE_MAX_PER_CHANNEL", "4"))
+DICE_TIMEOUT = float(os.getenv("DICE_TIMEOUT", "5"))
+
+class DiceRejected(Exception):
+    """Rolagem recusada sem ser executada (ou abandonada por timeout)."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+def _call(fn, args):
+    # Roda no worker (thread ou processo); devolve o instante de início para medir a fila.
+    return time.monotonic(), fn(*args)
+
+class DiceExecutor:
+    """
+    Pool dedicado para avaliação de dados, separado do executor padrão do
+    loop. Limita o total de rolagens pendentes e quantas cada usuário/canal
+    pode ter ao mesmo tempo; acima disso a rolagem é recusada com
+    DiceRejected em vez de entrar na fila. Uma vaga só é liberada quando o
+    worker termina de fato, mesmo que o chamador já tenha desistido por
+    timeout.
+    """
+
+    def __init__(self, kind: str = DICE_EXECUTOR, max_workers: int = DICE_WORKERS,
+                 max_pending: int = DICE_MAX_PENDING, per_user: int = DICE_MAX_PER_USER,
+                 per_channel: int = DICE_MAX_PER_CHANNEL, timeout: float = DICE_TIMEOUT,
+                 name: str = "dice"):
+        self.name = name
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self.per_user = per_user
+        self.per_channel = per_channel
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._by_user: dict[int, int] = {}
+        self._by_channel: dict[int, int] = {}
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        return self._executor
+
+    def _acquire(self, user_id, channel_id):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                reason = "saturated"
+            elif user_id is not None and self.per_user > 0 and self._by_user.get(user_id, 0) >= self.per_user:
+                reason = "user"
+            elif channel_id is not None and self.per_channel > 0 and self._by_channel.get(channel_id, 0) >= self.per_channel:
+                reason = "channel"
+            else:
+                self._pending += 1
+                if user_id is not None:
+                    self._by_user[user_id] = self._by_user.get(user_id, 0) + 1
+                if channel_id is not None:
+                    self._by_channel[channel_id] = self._by_channel.get(channel_id, 0) + 1
+                self._publish()
+                return
+        metrics.incr(f"{self.name}.rejected.{reason}")
+        raise DiceRejected(reason)
+
+    def _release(self, user_id, channel_id):
+        with self._lock:
+            self._pending -= 1
+            for counts, key in ((self._by_user, user_id), (self._by_channel, channel_id)):
+                if key is None:
+                    continue
+                left = counts.get(key, 0) - 1
+                if left > 0:
+                    counts[key] = left
+                else:
+                    counts.pop(key, None)
+            self._publish()
+
+    def _publish(self):
+        metrics.set_gauge(f"{self.name}.pending", self._pending)
+        metrics.set_gauge(f"{self.name}.queue_depth", max(0, self._pending - self.max_workers))
+
+    async def submit(self, fn, *args, user_id: int | None = None, channel_id: int | None = None,
+                     timeout: float | None = None):
+        self._acquire(user_id, channel_id)
+        enqueued = time.monotonic()
+        try:
+            future = self._get_executor().submit(_call, fn, args)
+        except Exception:
+            self._release(user_id, channel_id)
+            raise
+        future.add_done_callback(lambda _: self._release(user_id, channel_id))
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            started, result = await asyncio.wait_for(asyncio.wrap_future(future), timeout if timeout > 0 else None)
+        except asyncio.TimeoutError:
+            future.cancel()
+            metrics.incr(f"{self.name}.timeouts")
+            raise DiceRejected("timeout")
+        finished = time.monotonic()
+        metrics.histogram(f"{self.name}.queue_wait").observe(max(0.0, started - enqueued))
+        metrics.histogram(f"{self.name}.run").observe(max(0.0, finished - started))
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "workers": self.max_workers,
+                "pending": self._pending,
+                "queue_depth": max(0, self._pending - self.max_workers),
+                "users": len(self._by_user),
+                "channels": len(self._by_channel),
+            }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+dice_executor = DiceExecutor()
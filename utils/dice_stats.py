@@ -0,0 +1,374 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import os
+import re
+import math
+from functools import lru_cache
+from utils.fast_dice import FastDice
+from utils.pool_dice import PoolDice
+
+DICE_STATS_CACHE_SIZE = int(os.getenv("DICE_STATS_CACHE_SIZE", "256"))
+# Teto de trabalho (dados x valores possíveis) para não travar o worker com pools enormes.
+DICE_STATS_MAX_WORK = int(os.getenv("DICE_STATS_MAX_WORK", "2000000"))
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+class UnsupportedDistribution(ValueError):
+    """Expressão fora do que o motor de distribuições sabe calcular de forma exata."""
+
+class Distribution:
+    """
+    Distribuição de probabilidade discreta sobre inteiros: probs[i] é a
+    chance do valor offset + i. Imutável; as operações devolvem novas
+    distribuições.
+    """
+    __slots__ = ("offset", "probs")
+
+    def __init__(self, offset: int, probs):
+        probs = list(probs)
+        # Apara zeros das pontas para manter o suporte enxuto.
+        start, end = 0, len(probs)
+        while start < end - 1 and probs[start] == 0:
+            start += 1
+        while end - 1 > start and probs[end - 1] == 0:
+            end -= 1
+        self.offset = offset + start
+        self.probs = tuple(probs[start:end])
+
+    @classmethod
+    def constant(cls, value: int) -> "Distribution":
+        return cls(value, (1.0,))
+
+    @classmethod
+    def uniform(cls, sides: int) -> "Distribution":
+        return cls(1, (1.0 / sides,) * sides)
+
+    @property
+    def min(self) -> int:
+        return self.offset
+
+    @property
+    def max(self) -> int:
+        return self.offset + len(self.probs) - 1
+
+    def items(self):
+        for i, p in enumerate(self.probs):
+            if p:
+                yield self.offset + i, p
+
+    def prob(self, value: int) -> float:
+        i = value - self.offset
+        return self.probs[i] if 0 <= i < len(self.probs) else 0.0
+
+    def prob_at_least(self, value: int) -> float:
+        i = max(0, value - self.offset)
+        return min(1.0, sum(self.probs[i:]))
+
+    def mean(self) -> float:
+        return sum(v * p for v, p in self.items())
+
+    def stdev(self) -> float:
+        mean = self.mean()
+        return math.sqrt(max(0.0, sum((v - mean) ** 2 * p for v, p in self.items())))
+
+    def percentile(self, pct: float) -> int:
+        """Menor valor x com P(X <= x) >= pct/100."""
+        target = pct / 100.0 - 1e-12
+        acc = 0.0
+        for v, p in self.items():
+            acc += p
+            if acc >= target:
+                return v
+        return self.max
+
+    def percentiles(self, pcts=DEFAULT_PERCENTILES) -> dict:
+        return {pct: self.percentile(pct) for pct in pcts}
+
+    def __add__(self, other: "Distribution") -> "Distribution":
+        if len(other.probs) > len(self.probs):
+            self, other = other, self
+        out = [0.0] * (len(self.probs) + len(other.probs) - 1)
+        for j, q in enumerate(other.probs):
+            if q:
+                for i, p in enumerate(self.probs):
+                    out[i + j] += p * q
+        return Distribution(self.offset + other.offset, out)
+
+    def __neg__(self) -> "Distribution":
+        return Distribution(-self.max, reversed(self.probs))
+
+    def shift(self, amount: int) -> "Distribution":
+        return Distribution(self.offset + amount, self.probs)
+
+    def scale(self, factor: int) -> "Distribution":
+        if factor == 1:
+            return self
+        if factor == 0:
+            return Distribution.constant(0)
+        out = {}
+        for v, p in self.items():
+            out[v * factor] = out.get(v * factor, 0.0) + p
+        return Distribution.from_dict(out)
+
+    @classmethod
+    def from_dict(cls, pmf: dict) -> "Distribution":
+        low, high = min(pmf), max(pmf)
+        probs = [0.0] * (high - low + 1)
+        for v, p in pmf.items():
+            probs[v - low] += p
+        return cls(low, probs)
+
+    @classmethod
+    def mixture(cls, parts) -> "Distribution":
+        """Mistura de (peso, distribuição); pesos nulos são ignorados."""
+        out = {}
+        for weight, dist in parts:
+            if weight <= 0:
+                continue
+            for v, p in dist.items():
+                out[v] = out.get(v, 0.0) + weight * p
+        return cls.from_dict(out) if out else cls.constant(0)
+
+    def summary(self, pcts=DEFAULT_PERCENTILES) -> dict:
+        return {
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean(),
+            "stdev": self.stdev(),
+            "percentiles": self.percentiles(pcts),
+        }
+
+def _check_work(count: int, sides: int):
+    if count * count * sides > DICE_STATS_MAX_WORK:
+        raise UnsupportedDistribution(f"{count}d{sides} é grande demais para a distribuição exata")
+
+def _sum_pmf(count: int, sides: int) -> Distribution:
+    # Soma de dados por janela deslizante (somas de prefixo): O(count * suporte).
+    probs = [1.0]
+    inv = 1.0 / sides
+    for _ in range(count):
+        prefix = [0.0]
+        for p in probs:
+            prefix.append(prefix[-1] + p)
+        size = len(probs) + sides - 1
+        n = len(probs)
+        probs = [(prefix[min(i + 1, n)] - prefix[max(0, i - sides + 1)]) * inv for i in range(size)]
+    return Distribution(count, probs)
+
+def _keep_highest_pmf(count: int, sides: int, keep: int) -> Distribution:
+    """
+    Soma dos `keep` maiores de `count` dados. Percorre as faces de cima para
+    baixo decidindo quantos dados caem em cada uma (binomial condicionada);
+    quando já há `keep` dados mantidos o resto não importa mais e o estado
+    colapsa.
+    """
+    # Estado: dados mantidos até agora -> {soma: prob}; "keep" = concluído.
+    states = {0: {0: 1.0}}
+    for face in range(sides, 0, -1):
+        p = 1.0 / face
+        q = 1.0 - p
+        new = {}
+        for kept, sums in states.items():
+            if kept == keep:
+                bucket = new.setdefault(keep, {})
+                for s, prob in sums.items():
+                    bucket[s] = bucket.get(s, 0.0) + prob
+                continue
+            remaining = count - kept
+            need = keep - kept
+            tail = 1.0
+            for j in range(need):
+                pj = math.comb(remaining, j) * p ** j * q ** (remaining - j)
+                tail -= pj
+                bucket = new.setdefault(kept + j, {})
+                for s, prob in sums.items():
+                    key = s + j * face
+                    bucket[key] = bucket.get(key, 0.0) + prob * pj
+            if tail > 0:
+                bucket = new.setdefault(keep, {})
+                for s, prob in sums.items():
+                    key = s + need * face
+                    bucket[key] = bucket.get(key, 0.0) + prob * tail
+        states = new
+    return Distribution.from_dict(states[keep])
+
+@lru_cache(maxsize=DICE_STATS_CACHE_SIZE)
+def dice_pmf(count: int, sides: int, mode: str | None = None, n: int = 0) -> Distribution:
+    """PMF exata de NdX com kh/kl/ph/pl opcional (mesma semântica do FastDice)."""
+    if count < 1 or sides < 1:
+        raise UnsupportedDistribution(f"{count}d{sides} inválido")
+    if mode in ("ph", "pl"):
+        mode, n = ("kl" if mode == "ph" else "kh"), count - n
+    if mode is None or n >= count:
+        _check_work(count, sides)
+        return _sum_pmf(count, sides)
+    if n <= 0:
+        return Distribution.constant(0)
+    _check_work(count, sides)
+    if mode == "kh":
+        return _keep_highest_pmf(count, sides, n)
+    # Menores = reflexo dos maiores em (sides + 1 - v).
+    return (-_keep_highest_pmf(count, sides, n)).shift(n * (sides + 1))
+
+def _success_pmf(count: int, sides: int, op: str, target: int) -> Distribution:
+    hits = max(0, sides - target + 1) if op == ">=" else max(0, sides - target)
+    p = min(1.0, hits / sides)
+    if count > 1_000_000:
+        raise UnsupportedDistribution(f"{count}d{sides} é grande demais para a distribuição exata")
+    # Binomial(count, p) calculada pela recorrência entre termos vizinhos.
+    if p in (0.0, 1.0):
+        return Distribution.constant(count if p else 0)
+    log_q = math.log1p(-p)
+    ratio = p / (1.0 - p)
+    probs = [0.0] * (count + 1)
+    probs[0] = math.exp(count * log_q)
+    if probs[0] == 0.0:
+        # Underflow: parte da moda e vai para os lados em escala logarítmica.
+        for k in range(count + 1):
+            probs[k] = math.exp(math.lgamma(count + 1) - math.lgamma(k + 1) - math.lgamma(count - k + 1)
+                                + k * math.log(p) + (count - k) * log_q)
+    else:
+        for k in range(1, count + 1):
+            probs[k] = probs[k - 1] * ratio * (count - k + 1) / k
+    return Distribution(0, probs)
+
+def term_distribution(compiled) -> Distribution:
+    if isinstance(compiled, FastDice):
+        return dice_pmf(compiled.count, compiled.sides, compiled.mode, compiled.n)
+    if isinstance(compiled, PoolDice):
+        if compiled.op is None:
+            return dice_pmf(compiled.count, compiled.sides, compiled.mode, compiled.n)
+        if compiled.mode is None:
+            return _success_pmf(compiled.count, compiled.sides, compiled.op, compiled.target)
+    raise UnsupportedDistribution("termo fora da gramática NdX[kh/kl/ph/pl]N")
+
+def _plan(expr: str):
+    from utils.dice_roller import _roll_plans
+    plan = _roll_plans.get(expr)
+    if plan.fallback:
+        raise UnsupportedDistribution(f"expressão não suportada: {expr}")
+    return plan
+
+@lru_cache(maxsize=DICE_STATS_CACHE_SIZE)
+def expression_distribution(expr: str) -> Distribution:
+    """Distribuição exata do total de uma expressão, memoizada por expressão."""
+    dist = Distribution.constant(0)
+    for sign, value, compiled, _ in _plan(expr).terms:
+        part = Distribution.constant(value) if compiled is None else term_distribution(compiled)
+        dist = dist + (part if sign > 0 else -part)
+    return dist
+
+def _single_natural(compiled) -> bool:
+    # d20 que mantém exatamente um dado: o valor do termo é o natural.
+    if not isinstance(compiled, FastDice) or compiled.sides != 20:
+        return False
+    if compiled.mode is None:
+        return compiled.count == 1
+    kept = compiled.n if compiled.mode in ("kh", "kl") else compiled.count - compiled.n
+    return kept == 1
+
+@lru_cache(maxsize=DICE_STATS_CACHE_SIZE)
+def _split_natural(expr: str) -> tuple[Distribution | None, Distribution]:
+    """Separa o d20 natural (se houver um só) do resto da expressão."""
+    natural = None
+    rest = Distribution.constant(0)
+    for sign, value, compiled, _ in _plan(expr).terms:
+        if compiled is not None and getattr(compiled, "sides", None) == 20:
+            if natural is not None or sign < 0 or not _single_natural(compiled):
+                raise UnsupportedDistribution(f"acerto com mais de um d20 natural: {expr}")
+            natural = term_distribution(compiled)
+            continue
+        part = Distribution.constant(value) if compiled is None else term_distribution(compiled)
+        rest = rest + (part if sign > 0 else -part)
+    return natural, rest
+
+def hit_chances(expr: str, ac: int, crit_range: int = 20) -> dict:
+    """
+    Chance de acerto contra `ac`. Com um d20 natural, crítico (>= crit_range)
+    sempre acerta e 1 natural sempre erra; sem d20 é só P(total >= ac).
+    """
+    natural, rest = _split_natural(expr)
+    if natural is None:
+        return {"hit": rest.prob_at_least(ac), "crit": 0.0, "fumble": 0.0}
+    hit = crit = 0.0
+    for v, p in natural.items():
+        if v >= crit_range:
+            crit += p
+            hit += p
+        elif v > 1:
+            hit += p * rest.prob_at_least(ac - v)
+    return {"hit": hit, "crit": crit, "fumble": natural.prob(1)}
+
+def find_attack(ficha: dict, nome: str) -> dict | None:
+    ataques = ficha.get("ataques", [])
+    if isinstance(ataques, dict):
+        ataques = list(ataques.values())
+    alvo = nome.strip().lower()
+    return next((a for a in ataques if str(a.get("nome", "")).strip().lower() == alvo), None)
+
+def attack_stats(ficha: dict, selected_attack: dict, ac: int, advantage_state: str = "normal",
+                 pcts=DEFAULT_PERCENTILES) -> dict:
+    """
+    Estatísticas exatas de um ataque da ficha contra uma CA: chance de
+    acerto/crítico, dano esperado e percentis de dano. Segue as mesmas
+    regras de execute_attack_roll (margem_critico, multiplicador_critico,
+    itens vinculados e modificador do atributo somado ao dano).
+    """
+    from utils.dice_roller import _attack_modifier, _apply_advantage, _damage_parts, _resolve_mod
+    modifier = _attack_modifier(ficha, selected_attack)
+    hit_formula = selected_attack.get("teste_de_acerto", "d20+MOD")
+    match = re.match(r'^\s*(\d+)\s*#\s*(.+)$', hit_formula)
+    num_attacks = int(match.group(1)) if match else 1
+    base = match.group(2).strip() if match else hit_formula
+    hit_expr = _apply_advantage(_resolve_mod(base, modifier), advantage_state)
+    crit_range = int(selected_attack.get("margem_critico", 20))
+    multiplicador = int(selected_attack.get("multiplicador_critico", 2))
+    chances = hit_chances(hit_expr, ac, crit_range)
+
+    dano_base_str, _ = _damage_parts(ficha, selected_attack)
+    dano = expression_distribution(dano_base_str).shift(modifier)
+    dano_critico = dano.scale(multiplicador)
+    normal = chances["hit"] - chances["crit"]
+    por_ataque = Distribution.mixture([
+        (1.0 - chances["hit"], Distribution.constant(0)),
+        (normal, dano),
+        (chances["crit"], dano_critico),
+    ])
+    return {
+        "expressao_acerto": hit_expr,
+        "expressao_dano": dano_base_str,
+        "ca": ac,
+        "ataques": num_attacks,
+        "chance_acerto": chances["hit"],
+        "chance_critico": chances["crit"],
+        "chance_falha_critica": chances["fumble"],
+        "dano_medio_no_acerto": dano.mean(),
+        "dano_medio_critico": dano_critico.mean(),
+        "dano_esperado": por_ataque.mean() * num_attacks,
+        "percentis_dano": por_ataque.percentiles(pcts),
+    }
+
+def expression_stats(expr: str, pcts=DEFAULT_PERCENTILES) -> dict:
+    return expression_distribution(expr).summary(pcts)
+
+def cache_stats() -> dict:
+    return {
+        "expressions": expression_distribution.cache_info()._asdict(),
+        "dice": dice_pmf.cache_info()._asdict(),
+    }
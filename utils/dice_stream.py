@@ -0,0 +1,237 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import os
+import random
+import hashlib
+import secrets
+import itertools
+import threading
+from collections import deque
+import d20.expression
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional; sem ela os lotes são gerados em Python puro.
+    np = None
+
+SETTINGS_KEY = "fluxo_dados"
+DICE_AUDIT_LOG_SIZE = int(os.getenv("DICE_AUDIT_LOG_SIZE", "1000"))
+# A partir daqui (com NumPy) o lote de dados é gerado vetorizado.
+STREAM_BATCH_THRESHOLD = 32
+
+_MASK = (1 << 64) - 1
+_GAMMA = 0x9E3779B97F4A7C15
+_M1 = 0xBF58476D1CE4E5B9
+_M2 = 0x94D049BB133111EB
+_MAX_VECTOR_SIDES = 1 << 32
+
+def _mix(z: int) -> int:
+    # Finalizador do SplitMix64: bijeção de 64 bits, aqui usada como hash do contador.
+    z = ((z ^ (z >> 30)) * _M1) & _MASK
+    z = ((z ^ (z >> 27)) * _M2) & _MASK
+    return z ^ (z >> 31)
+
+class Draw:
+    """
+    Cursor de uma rolagem: o i-ésimo número é mix(base + i·γ), com base
+    derivada de (chave do fluxo, contador). Não tem estado compartilhado; é
+    usado por uma thread só e pode ser recriado a partir do ticket para
+    reproduzir a rolagem.
+    """
+    __slots__ = ("base", "pos", "ticket")
+
+    def __init__(self, key: int, counter: int, ticket: str = ""):
+        self.base = _mix((key ^ _mix(counter)) & _MASK)
+        self.pos = 0
+        self.ticket = ticket
+
+    def _next(self) -> int:
+        x = _mix((self.base + self.pos * _GAMMA) & _MASK)
+        self.pos += 1
+        return x
+
+    def below(self, n: int) -> int:
+        """Inteiro uniforme em [0, n) por multiplicação e deslocamento."""
+        if n < _MAX_VECTOR_SIDES:
+            return ((self._next() >> 32) * n) >> 32
+        return (self._next() * n) >> 64
+
+    def randrange(self, start: int, stop: int | None = None, step: int = 1) -> int:
+        # Mesma assinatura usada pelo d20 (randrange(n) e randrange(0, 100, 10)).
+        if stop is None:
+            start, stop = 0, start
+        return start + step * self.below((stop - start + step - 1) // step)
+
+    def choices(self, population, k: int = 1) -> list:
+        n = len(population)
+        return [population[i] for i in self.indices(n, k)]
+
+    def indices(self, n: int, k: int) -> list[int]:
+        if n >= _MAX_VECTOR_SIDES:
+            return [self.below(n) for _ in range(k)]
+        if np is not None and k >= STREAM_BATCH_THRESHOLD:
+            return self._indices_numpy(n, k).tolist()
+        # _mix e below() em linha: metade do custo por dado no caminho escalar.
+        base, start = self.base, self.pos
+        self.pos += k
+        out = []
+        for i in range(start, start + k):
+            z = (base + i * _GAMMA) & _MASK
+            z = ((z ^ (z >> 30)) * _M1) & _MASK
+            z = ((z ^ (z >> 27)) * _M2) & _MASK
+            out.append((((z ^ (z >> 31)) >> 32) * n) >> 32)
+        return out
+
+    def dice(self, count: int, sides: int):
+        """count dados de `sides` lados; array do NumPy para lotes grandes, senão lista."""
+        if np is not None and count >= STREAM_BATCH_THRESHOLD and sides < _MAX_VECTOR_SIDES:
+            return (self._indices_numpy(sides, count) + np.uint64(1)).astype(np.int64)
+        return [i + 1 for i in self.indices(sides, count)]
+
+    def _indices_numpy(self, n: int, k: int):
+        # Mesma conta do caminho escalar, em uint64 (o estouro é o módulo 2^64).
+        z = np.arange(self.pos, self.pos + k, dtype=np.uint64)
+        z *= np.uint64(_GAMMA)
+        z += np.uint64(self.base)
+        z ^= z >> np.uint64(30)
+        z *= np.uint64(_M1)
+        z ^= z >> np.uint64(27)
+        z *= np.uint64(_M2)
+        z ^= z >> np.uint64(31)
+        self.pos += k
+        return ((z >> np.uint64(32)) * np.uint64(n)) >> np.uint64(32)
+
+_local = threading.local()
+
+def current() -> Draw | None:
+    """Cursor ativo na thread (dentro de um bloco `active`), ou None."""
+    return getattr(_local, "draw", None)
+
+class active:
+    """Ativa o cursor na thread corrente: FastDice, PoolDice e o d20 passam a tirar dele."""
+    __slots__ = ("draw", "_previous")
+
+    def __init__(self, draw: Draw | None):
+        self.draw = draw
+
+    def __enter__(self) -> Draw | None:
+        self._previous = current()
+        _local.draw = self.draw
+        return self.draw
+
+    def __exit__(self, *exc):
+        _local.draw = self._previous
+
+class _D20Random:
+    # O d20 chama random.randrange direto no módulo; desviamos para o cursor ativo.
+    def randrange(self, *args):
+        draw = current()
+        if draw is None:
+            return random.randrange(*args)
+        return draw.randrange(*args)
+
+d20.expression.random = _D20Random()
+
+def _derive_key(seed: bytes, epoch: int) -> int:
+    return int.from_bytes(hashlib.blake2b(epoch.to_bytes(8, "big"), key=seed, digest_size=8).digest(), "big")
+
+class DiceStream:
+    """
+    Fluxo de números de um servidor: chave secreta derivada de (semente,
+    época) e um contador. Cada rolagem reserva um contador com next() num
+    itertools.count, atômico no CPython, então não há lock na geração. A
+    época muda a cada início do bot, para que contadores nunca se repitam.
+    """
+
+    def __init__(self, seed: bytes, epoch: int):
+        self.epoch = epoch
+        self.key = _derive_key(seed, epoch)
+        self._counter = itertools.count()
+        # (contador, expressão); deque.append também dispensa lock.
+        self.log: deque = deque(maxlen=DICE_AUDIT_LOG_SIZE)
+
+    def draw(self, expr: str) -> Draw:
+        counter = next(self._counter)
+        self.log.append((counter, expr))
+        return Draw(self.key, counter, f"{self.epoch}-{counter}")
+
+    def issued(self) -> int:
+        return self.log[-1][0] + 1 if self.log else 0
+
+    def lookup(self, counter: int) -> str | None:
+        for logged, expr in reversed(self.log):
+            if logged == counter:
+                return expr
+        return None
+
+# Rolagens fora de servidor (DM): fluxo só do processo, reproduzível enquanto o bot estiver no ar.
+_local_stream = DiceStream(secrets.token_bytes(16), 0)
+_streams: dict[int, DiceStream] = {}
+
+def _open_stream(guild_id: int, settings: dict) -> DiceStream:
+    stream = _streams.get(guild_id)
+    if stream is not None:
+        return stream
+    state = dict(settings.get(SETTINGS_KEY) or {})
+    if not state.get("semente"):
+        state["semente"] = secrets.token_hex(16)
+    state["epoca"] = int(state.get("epoca", 0)) + 1
+    settings[SETTINGS_KEY] = state
+    stream = _streams[guild_id] = DiceStream(bytes.fromhex(state["semente"]), state["epoca"])
+    return stream
+
+async def stream_for(guild_id: int | None) -> DiceStream:
+    if guild_id is None:
+        return _local_stream
+    stream = _streams.get(guild_id)
+    if stream is None:
+        # Uma gravação por servidor a cada início do bot (nova época).
+        from utils.storage import store
+        stream = await store.update_guild_settings(guild_id, lambda settings: _open_stream(guild_id, settings))
+    return stream
+
+def parse_ticket(ticket: str) -> tuple[int, int] | None:
+    try:
+        epoch, counter = ticket.strip().lstrip("#").split("-")
+        return int(epoch), int(counter)
+    except ValueError:
+        return None
+
+async def replay_draw(guild_id: int | None, ticket: str) -> tuple[Draw, str | None] | None:
+    """
+    Recria o cursor de um ticket (época-contador) e devolve junto a expressão
+    registrada, se ainda estiver no log. None para ticket inválido, de uma
+    época desconhecida ou de um contador ainda não emitido.
+    """
+    parsed = parse_ticket(ticket)
+    if parsed is None:
+        return None
+    epoch, counter = parsed
+    stream = await stream_for(guild_id)
+    if epoch == stream.epoch:
+        if counter >= stream.issued():
+            return None
+        return Draw(stream.key, counter, ticket.strip()), stream.lookup(counter)
+    if guild_id is None or not 0 < epoch < stream.epoch:
+        return None
+    from utils.storage import store
+    state = (await store.get_guild_settings(guild_id)).get(SETTINGS_KEY) or {}
+    key = _derive_key(bytes.fromhex(state["semente"]), epoch)
+    return Draw(key, counter, ticket.strip()), None
@@ -0,0 +1,180 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import os
+import copy
+import json
+import time
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from utils import metrics
+from utils.file_utils import write_json_atomic
+from utils.storage_backends import DATA_DIR
+
+DRAFTS_PATH = os.getenv("DRAFTS_PATH", os.path.join(DATA_DIR, "rascunhos.json"))
+DRAFT_TTL = float(os.getenv("DRAFT_TTL", str(24 * 3600)))
+DRAFT_MAX_ENTRIES = int(os.getenv("DRAFT_MAX_ENTRIES", "5000"))
+DRAFT_FLUSH_INTERVAL = float(os.getenv("DRAFT_FLUSH_INTERVAL", "30"))
+
+log = logging.getLogger(__name__)
+
+class DraftStore:
+    """
+    Rascunhos de builders e modais, chaveados por (usuário, builder, build_id),
+    fora da ficha. Ficam em memória com TTL (renovado a cada escrita) e limite
+    de entradas (LRU); um snapshot compacto vai para disco periodicamente, só
+    quando algo mudou, para sobreviver a um restart. A ficha só é tocada no Salvar.
+    """
+
+    def __init__(self, path: str = DRAFTS_PATH, ttl: float = DRAFT_TTL,
+                 max_entries: int = DRAFT_MAX_ENTRIES, flush_interval: float = DRAFT_FLUSH_INTERVAL):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.flush_interval = flush_interval
+        # chave -> [expira_em (epoch), rascunho]
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self.expired = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(user_id: int, builder: str, build_id: str = "") -> str:
+        return f"{user_id}:{builder}:{build_id}"
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    saved = json.load(f)
+            except FileNotFoundError:
+                return
+            except Exception:
+                log.exception(f"[drafts] falha ao ler {self.path}, começando vazio")
+                return
+            now = time.time()
+            for key, (expires_at, data) in sorted(saved.items(), key=lambda kv: kv[1][0]):
+                if expires_at > now:
+                    self._entries[key] = [expires_at, data]
+            self._evict(now)
+
+    def get(self, user_id: int, builder: str, build_id: str = "") -> dict | None:
+        self._ensure_loaded()
+        key = self.key(user_id, builder, build_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                self.expired += 1
+                self._dirty = True
+                return None
+            return copy.deepcopy(entry[1])
+
+    def put(self, user_id: int, builder: str, build_id: str, data: dict):
+        self._ensure_loaded()
+        key = self.key(user_id, builder, build_id)
+        now = time.time()
+        with self._lock:
+            self._entries[key] = [now + self.ttl, copy.deepcopy(data)]
+            self._entries.move_to_end(key)
+            self._dirty = True
+            self._evict(now)
+        metrics.incr("drafts.writes")
+        self._ensure_flusher()
+
+    def discard(self, user_id: int, builder: str, build_id: str = "") -> bool:
+        self._ensure_loaded()
+        with self._lock:
+            removed = self._entries.pop(self.key(user_id, builder, build_id), None) is not None
+            if removed:
+                self._dirty = True
+        if removed:
+            self._ensure_flusher()
+        return removed
+
+    def _evict(self, now: float):
+        # Ordem do OrderedDict = ordem de escrita, e o TTL é igual para todos:
+        # os expirados estão sempre no começo.
+        while self._entries:
+            key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[key]
+            self.expired += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def flush(self):
+        with self._io_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                self._evict(time.time())
+                # Os rascunhos guardados nunca são mutados (put troca a entrada), então basta copiar o dict.
+                snapshot = {key: list(entry) for key, entry in self._entries.items()}
+                self._dirty = False
+            try:
+                write_json_atomic(self.path, snapshot, indent=None)
+            except Exception:
+                log.exception(f"[drafts] falha ao gravar {self.path}")
+                with self._lock:
+                    self._dirty = True
+
+    def _ensure_flusher(self):
+        if self.flush_interval <= 0:
+            self.flush()
+            return
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        with self._lock:
+            if self._flusher is not None and self._flusher.is_alive():
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name="draft-store-flush", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._wakeup.wait(self.flush_interval):
+            self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "dirty": self._dirty,
+                "expired": self.expired,
+                "evictions": self.evictions,
+            }
+
+drafts = DraftStore()
+atexit.register(drafts.flush)
@@ -0,0 +1,84 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import os
+import copy
+import threading
+from collections import OrderedDict
+import discord
+from utils import sheet_versions
+
+EMBED_CACHE_SIZE = int(os.getenv("EMBED_CACHE_SIZE", "512"))
+
+class EmbedRenderCache:
+    """
+    Cache LRU de embeds de ficha já montados, chaveado por (ficha, versão,
+    seção, locale, papel de quem vê). A versão vem de sheet_versions e sobe a
+    cada gravação, então uma ficha salva nunca reaproveita um embed antigo.
+    Guarda o dict do embed; cada acerto devolve um discord.Embed novo.
+    """
+
+    def __init__(self, max_entries: int = EMBED_CACHE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[tuple, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(sheet_id: str, section: str, locale: str, role: str, *extra) -> tuple:
+        """Chave com a versão atual da ficha; extra cobre o que não vem da ficha (nome, avatar)."""
+        return (sheet_id, sheet_versions.current(sheet_id), section, locale, role) + extra
+
+    def get(self, key: tuple) -> discord.Embed | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return discord.Embed.from_dict(copy.deepcopy(data))
+
+    def put(self, key: tuple, embed: discord.Embed):
+        data = embed.to_dict()
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "evictions": self.evictions,
+            }
+
+embed_cache = EmbedRenderCache()
@@ -0,0 +1,105 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import re
+import random
+from utils import dice_stream
+
+# Mesmo teto de dados por rolagem do d20 (RollContext.max_rolls).
+MAX_FAST_DICE = 1000
+
+_FAST_RE = re.compile(r'^(\d*)d(\d+)(?:(kh|kl|dh|dl|ph|pl)(\d+))?$', re.IGNORECASE)
+_KEEP_MODES = {"kh", "kl"}
+# dl/dh são aceitos como sinônimos do pl/ph do d20.
+_ALIASES = {"dh": "ph", "dl": "pl"}
+
+class FastRoll:
+    """Resultado estruturado de um termo NdX[kh/kl/ph/pl]N rolado no caminho rápido."""
+    __slots__ = ("spec", "values", "kept", "total")
+
+    def __init__(self, spec: "FastDice", values: list[int], kept: list[bool]):
+        self.spec = spec
+        self.values = values
+        self.kept = kept
+        self.total = sum(v for v, k in zip(values, kept) if k)
+
+    @property
+    def kept_values(self) -> list[int]:
+        return [v for v, k in zip(self.values, self.kept) if k]
+
+    @property
+    def dropped_values(self) -> list[int]:
+        return [v for v, k in zip(self.values, self.kept) if not k]
+
+    def __str__(self):
+        # Mesmo formato do MarkdownStringifier do d20.
+        sides = self.spec.sides
+        parts = []
+        for value, kept in zip(self.values, self.kept):
+            text = f"**{value}**" if value == 1 or value == sides else str(value)
+            parts.append(text if kept else f"~~{text}~~")
+        return f"{self.spec} ({', '.join(parts)}) = `{self.total}`"
+
+class FastDice:
+    """
+    Termo de dado simples (NdX com um kh/kl/ph/pl opcional) rolado direto com
+    random.choices, sem AST do d20. Expressões fora dessa gramática continuam
+    no d20.
+    """
+    __slots__ = ("count", "sides", "mode", "n", "_faces")
+
+    def __init__(self, count: int, sides: int, mode: str | None = None, n: int = 0):
+        self.count = count
+        self.sides = sides
+        self.mode = mode
+        self.n = n
+        self._faces = range(1, sides + 1)
+
+    @classmethod
+    def parse(cls, expr: str) -> "FastDice | None":
+        match = _FAST_RE.match(expr.strip())
+        if not match:
+            return None
+        count = int(match.group(1)) if match.group(1) else 1
+        sides = int(match.group(2))
+        if not 1 <= count <= MAX_FAST_DICE or sides < 1:
+            return None
+        mode = match.group(3).lower() if match.group(3) else None
+        mode = _ALIASES.get(mode, mode)
+        return cls(count, sides, mode, int(match.group(4) or 0))
+
+    def _selection(self, values: list[int]) -> list[bool]:
+        if self.mode is None:
+            return [True] * len(values)
+        # Ordenação estável como no SetSelector do d20: empates ficam na ordem rolada.
+        highest = self.mode.endswith("h")
+        order = sorted(range(len(values)), key=values.__getitem__, reverse=highest)
+        chosen = set(order[:self.n])
+        if self.mode in _KEEP_MODES:
+            return [i in chosen for i in range(len(values))]
+        return [i not in chosen for i in range(len(values))]
+
+    def roll(self, rng=None) -> FastRoll:
+        # Sem rng explícito usa o cursor do fluxo ativo (dice_stream) e, fora dele, o random global.
+        rng = rng or dice_stream.current() or random
+        values = rng.choices(self._faces, k=self.count)
+        return FastRoll(self, values, self._selection(values))
+
+    def __str__(self):
+        suffix = f"{self.mode}{self.n}" if self.mode else ""
+        return f"{self.count}d{self.sides}{suffix}"
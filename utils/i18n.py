@@ -19,8 +19,10 @@
 from __future__ import annotations
 from pathlib import Path
 from functools import lru_cache
-from typing import Any, Dict, Iterable, Optional
+from string import Formatter
+from typing import Any, Dict, Iterable, Optional, Tuple
 import json
+from utils import metrics
 
 LOCALES_DIR = Path(__file__).resolve().parent.parent / "locales"
 DEFAULT_LOCALE = "pt"
@@ -32,6 +34,8 @@ def set_default_locale(locale: str) -> None:
 
 def clear_i18n_cache() -> None:
     _load_bundle.cache_clear()
+    _catalogs.clear()
+    _translators.clear()
 
 def available_locales() -> list[str]:
     if not LOCALES_DIR.exists():
@@ -48,12 +52,14 @@ def _normalize(loc: Optional[str]) -> str:
         return "en"
     return DEFAULT_LOCALE
 
-def _merge_dicts(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
-    for k, v in src.items():
-        if isinstance(v, dict) and isinstance(dst.get(k), dict):
-            _merge_dicts(dst[k], v)
+def _flatten(prefix: str, node: Any, out: Dict[str, Any]) -> None:
+    # Aceita tanto chaves pontuadas planas quanto objetos aninhados no JSON.
+    for k, v in node.items():
+        key = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            _flatten(key, v, out)
         else:
-            dst[k] = v
+            out[key] = v
 
 @lru_cache(maxsize=16)
 def _load_bundle(locale: str) -> Dict[str, Any]:
@@ -66,55 +72,168 @@ def _load_bundle(locale: str) -> Dict[str, Any]:
             with p.open("r", encoding="utf-8") as f:
                 data = json.load(f)
             if isinstance(data, dict):
-                _merge_dicts(bundle, data)
+                _flatten("", data, bundle)
         except Exception:
             continue
     return bundle
 
-def _get_from_bundle(bundle: Dict[str, Any], dot_key: str) -> Any:
-    cur: Any = bundle
-    parts = dot_key.split(".")
-    ok = True
-    for part in parts:
-        if isinstance(cur, dict) and part in cur:
-            cur = cur[part]
-        else:
-            ok = False
-            break
-    if ok:
-        return cur
+class _Template:
+    """
+    Texto com campos já separados pelo Formatter. Campos simples ({nome})
+    são preenchidos concatenando as partes; conversões, specs ou acesso a
+    atributo/índice caem no str.format do texto original.
+    """
+    __slots__ = ("text", "head", "fields")
 
-    if isinstance(bundle, dict) and dot_key in bundle:
-        return bundle[dot_key]
+    def __init__(self, text: str, head: str, fields: Optional[Tuple[Tuple[str, str], ...]]):
+        self.text = text
+        self.head = head
+        self.fields = fields
 
-    return None
+    @classmethod
+    def compile(cls, text: str) -> Optional["_Template"]:
+        try:
+            parsed = list(Formatter().parse(text))
+        except ValueError:
+            return None
+        if all(name is None for _, name, _, _ in parsed):
+            # Sem campos, só vale template se houver {{ }} para desescapar.
+            literal = "".join(part for part, _, _, _ in parsed)
+            return cls(text, literal, ()) if literal != text else None
+        head = parsed[0][0]
+        fields = []
+        for i, (_, name, spec, conversion) in enumerate(parsed):
+            if name is None:
+                continue
+            if spec or conversion or not name.isidentifier():
+                return cls(text, "", None)
+            tail = parsed[i + 1][0] if i + 1 < len(parsed) else ""
+            fields.append((name, tail))
+        return cls(text, head, tuple(fields))
 
-def t(key: str, locale: Optional[str] = None, **kwargs) -> str:
-    loc = _normalize(locale)
-    text = _get_from_bundle(_load_bundle(loc), key)
-    if text is None and loc != DEFAULT_LOCALE:
-        text = _get_from_bundle(_load_bundle(DEFAULT_LOCALE), key)
-    if text is None:
-        text = key
-    if isinstance(text, str) and kwargs:
+    def render(self, kwargs: Dict[str, Any]) -> str:
         try:
-            text = text.format(**kwargs)
+            if self.fields is None:
+                return self.text.format(**kwargs)
+            parts = [self.head]
+            for name, tail in self.fields:
+                parts.append(format(kwargs[name]))
+                parts.append(tail)
+            return "".join(parts)
         except Exception:
-            pass
+            return self.text
+
+# locale cru (como veio da interação) -> {chave: (texto, template ou None)}
+_catalogs: Dict[Optional[str], Dict[str, Tuple[Any, Optional[_Template]]]] = {}
+
+def _build_catalog(locale: Optional[str]) -> Dict[str, Tuple[Any, Optional[_Template]]]:
+    loc = _normalize(locale)
+    merged: Dict[str, Any] = {}
+    if loc != DEFAULT_LOCALE:
+        merged.update(_load_bundle(DEFAULT_LOCALE))
+    merged.update(_load_bundle(loc))
+    catalog = {
+        key: (value, _Template.compile(value) if isinstance(value, str) else None)
+        for key, value in merged.items()
+    }
+    # Locales que normalizam igual compartilham o mesmo catálogo.
+    catalog = _catalogs.setdefault(loc, catalog)
+    _catalogs[locale] = catalog
+    return catalog
+
+def _catalog_for(locale: Optional[str]) -> Dict[str, Tuple[Any, Optional[_Template]]]:
+    catalog = _catalogs.get(locale)
+    if catalog is None:
+        catalog = _build_catalog(locale)
+    return catalog
+
+def t(key: str, locale: Optional[str] = None, **kwargs) -> str:
+    catalog = _catalogs.get(locale)
+    if catalog is None:
+        catalog = _build_catalog(locale)
+    entry = catalog.get(key)
+    if entry is None:
+        return key
+    text, template = entry
+    if kwargs and template is not None:
+        return template.render(kwargs)
     return text
 
+# Textos padrão (pt) das chaves, registrados uma vez por chave: pelo módulo
+# via register_fallbacks ou na primeira chamada que passar o fallback.
+_fallbacks: Dict[str, Tuple[str, Optional[_Template]]] = {}
+_missing: set[Tuple[str, str]] = set()
+
+def register_fallbacks(mapping: Dict[str, str]) -> None:
+    for key, text in mapping.items():
+        if key not in _fallbacks:
+            _fallbacks[key] = (text, _Template.compile(text))
+
+def missing_keys() -> list[Tuple[str, str]]:
+    """(locale, chave) que caíram no fallback desde o início do processo."""
+    return sorted(_missing)
+
+def _resolve_missing(locale: str, key: str, fallback: Optional[str], kwargs: Dict[str, Any]) -> str:
+    if (locale, key) not in _missing:
+        _missing.add((locale, key))
+        metrics.incr("i18n.missing")
+    entry = _fallbacks.get(key)
+    if entry is None:
+        if fallback is None:
+            return key
+        entry = _fallbacks[key] = (fallback, _Template.compile(fallback))
+    text, template = entry
+    if kwargs and template is not None:
+        return template.render(kwargs)
+    return text
+
+class Translator:
+    """
+    Tradução ligada a um locale: tr(chave, fallback, **campos). Textos sem
+    campos ficam memorizados; chave ausente usa o fallback registrado e é
+    contada em metrics (i18n.missing) uma vez por locale.
+    """
+    __slots__ = ("locale", "_catalog", "_plain")
+
+    def __init__(self, locale: Optional[str]):
+        self.locale = _normalize(locale)
+        self._catalog = _catalog_for(locale)
+        self._plain: Dict[str, str] = {}
+
+    def __call__(self, key: str, fallback: Optional[str] = None, **kwargs) -> str:
+        if not kwargs:
+            text = self._plain.get(key)
+            if text is None:
+                text = self._plain[key] = self._resolve(key, fallback, kwargs)
+            return text
+        return self._resolve(key, fallback, kwargs)
+
+    def _resolve(self, key: str, fallback: Optional[str], kwargs: Dict[str, Any]) -> str:
+        entry = self._catalog.get(key)
+        if entry is None:
+            return _resolve_missing(self.locale, key, fallback, kwargs)
+        text, template = entry
+        if kwargs and template is not None:
+            return template.render(kwargs)
+        return text
+
+_translators: Dict[Optional[str], Translator] = {}
+
+def bind(locale: Optional[str]) -> Translator:
+    tr = _translators.get(locale)
+    if tr is None:
+        tr = _translators[locale] = Translator(locale)
+    return tr
+
+def translate(key: str, locale: Optional[str], fallback: Optional[str] = None, **kwargs) -> str:
+    """Forma solta de bind(locale)(key, fallback, **kwargs), com a assinatura dos antigos _tr."""
+    tr = _translators.get(locale)
+    if tr is None:
+        tr = bind(locale)
+    return tr(key, fallback, **kwargs)
+
 def keys(locale: Optional[str] = None) -> set[str]:
-    loc = _normalize(locale)
-    bundle = _load_bundle(loc)
-    out: set[str] = set()
-    def walk(prefix: str, node: Any):
-        if isinstance(node, dict):
-            for k, v in node.items():
-                walk(f"{prefix}.{k}" if prefix else k, v)
-        else:
-            out.add(prefix)
-    walk("", bundle)
-    return out
+    return set(_load_bundle(_normalize(locale)))
 
 def diff_locales(a: str, b: str) -> dict[str, set[str]]:
     ak, bk = keys(a), keys(b)
@@ -16,39 +16,130 @@
 # from the software and are NOT covered by the AGPL. They remain the
 # exclusive property of the author.
 
+
 import os
-import json
-
-BASE_DIR = "data/servidores"
-
-def get_server_path(guild_name: str) -> str:
-    server_path = os.path.join(BASE_DIR, guild_name)
-    os.makedirs(server_path, exist_ok=True)
-    return server_path
-
-def get_mestres_path(guild_name: str) -> str:
-    return os.path.join(get_server_path(guild_name), "mestres.json")
-
-def carregar_mestres(guild_name: str) -> list:
-    mestres_path = get_mestres_path(guild_name)
-    if not os.path.exists(mestres_path):
-        return []
-    with open(mestres_path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-def salvar_mestres(guild_name: str, mestres: list):
-    mestres_path = get_mestres_path(guild_name)
-    with open(mestres_path, "w", encoding="utf-8") as f:
-        json.dump(mestres, f, indent=4, ensure_ascii=False)
-
-def adicionar_mestre(guild_name: str, mestre_id: int, mestre_nome: str):
-    mestres = carregar_mestres(guild_name)
-    if any(m["id"] == mestre_id for m in mestres):
-        return False
-    mestres.append({"id": mestre_id, "nome": mestre_nome})
-    salvar_mestres(guild_name, mestres)
-    return True
-
-def verificar_mestre(guild_name: str, user_id: int) -> bool:
-    mestres = carregar_mestres(guild_name)
-    return any(m["id"] == user_id for m in mestres)
+import atexit
+import logging
+import threading
+from utils import metrics
+from utils.storage_backends import get_backend
+
+MESTRES_FLUSH_INTERVAL = float(os.getenv("MESTRES_FLUSH_INTERVAL", "5"))
+
+log = logging.getLogger(__name__)
+
+class MestreRegistry:
+    """
+    Registro de mestres por guild id, em memória. Cada guild é lida do backend
+    uma vez; depois verificar um mestre é um teste de pertinência num set.
+    Escritas trocam o registro da guild inteiro sob lock (quem lê vê o antigo
+    ou o novo, nunca um meio-termo) e são gravadas por uma thread de flush.
+    Registros antigos, gravados pelo nome da guild, são migrados para o id na
+    primeira leitura.
+    """
+
+    def __init__(self, flush_interval: float = MESTRES_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        # guild_id -> {user_id: nome}, na ordem de registro
+        self._mestres: dict[int, dict[int, str]] = {}
+        self._ids: dict[int, frozenset] = {}
+        self._dirty: set[int] = set()
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+    def is_loaded(self, guild_id: int) -> bool:
+        return guild_id in self._ids
+
+    def _ensure(self, guild_id: int, guild_name: str | None = None) -> dict[int, str]:
+        mestres = self._mestres.get(guild_id)
+        if mestres is not None:
+            return mestres
+        with self._lock:
+            mestres = self._mestres.get(guild_id)
+            if mestres is not None:
+                return mestres
+            backend = get_backend()
+            rows = backend.load_mestres(str(guild_id))
+            if not rows and guild_name:
+                rows = backend.load_mestres(guild_name)
+                if rows:
+                    log.info(f"[mestres] migrando '{guild_name}' para a guild {guild_id}")
+                    self._dirty.add(guild_id)
+            mestres = {int(m["id"]): m.get("nome") for m in rows}
+            self._mestres[guild_id] = mestres
+            self._ids[guild_id] = frozenset(mestres)
+            metrics.incr("mestres.loads")
+        if guild_id in self._dirty:
+            self._ensure_flusher()
+        return mestres
+
+    def is_mestre(self, guild_id: int, user_id: int, guild_name: str | None = None) -> bool:
+        ids = self._ids.get(guild_id)
+        if ids is None:
+            self._ensure(guild_id, guild_name)
+            ids = self._ids[guild_id]
+        return user_id in ids
+
+    def list(self, guild_id: int, guild_name: str | None = None) -> list[dict]:
+        return [{"id": uid, "nome": nome} for uid, nome in self._ensure(guild_id, guild_name).items()]
+
+    def add(self, guild_id: int, user_id: int, nome: str, guild_name: str | None = None) -> bool:
+        self._ensure(guild_id, guild_name)
+        with self._lock:
+            current = self._mestres[guild_id]
+            if user_id in current:
+                return False
+            updated = dict(current)
+            updated[user_id] = nome
+            self._mestres[guild_id] = updated
+            self._ids[guild_id] = frozenset(updated)
+            self._dirty.add(guild_id)
+        self._ensure_flusher()
+        return True
+
+    def flush(self):
+        with self._io_lock:
+            with self._lock:
+                pending = {gid: self._mestres[gid] for gid in self._dirty}
+                self._dirty.clear()
+            backend = get_backend()
+            for guild_id, mestres in pending.items():
+                try:
+                    backend.save_mestres(str(guild_id), [{"id": uid, "nome": nome} for uid, nome in mestres.items()])
+                except Exception:
+                    log.exception(f"[mestres] falha ao gravar guild {guild_id}")
+                    with self._lock:
+                        self._dirty.add(guild_id)
+
+    def _ensure_flusher(self):
+        if self.flush_interval <= 0:
+            self.flush()
+            return
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        with self._lock:
+            if self._flusher is not None and self._flusher.is_alive():
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name="mestres-flush", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._wakeup.wait(self.flush_interval):
+            self.flush()
+
+registry = MestreRegistry()
+atexit.register(registry.flush)
+
+def carregar_mestres(guild_id: int, guild_name: str | None = None) -> list:
+    return registry.list(guild_id, guild_name)
+
+def adicionar_mestre(guild_id: int, mestre_id: int, mestre_nome: str, guild_name: str | None = None) -> bool:
+    return registry.add(guild_id, mestre_id, mestre_nome, guild_name)
+
+def verificar_mestre(guild_id: int, user_id: int, guild_name: str | None = None) -> bool:
+    return registry.is_mestre(guild_id, user_id, guild_name)
+
+def flush_mestres():
+    registry.flush()
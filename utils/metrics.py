@@ -0,0 +1,112 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import bisect
+import threading
+
+# Limites superiores dos buckets, em milissegundos.
+DEFAULT_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+class LatencyHistogram:
+    def __init__(self, name: str, buckets_ms: tuple = DEFAULT_BUCKETS_MS):
+        self.name = name
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        ms = seconds * 1000.0
+        idx = bisect.bisect_left(self.buckets_ms, ms)
+        with self._lock:
+            self._counts[idx] += 1
+            self._count += 1
+            self._sum_ms += ms
+            if ms > self._max_ms:
+                self._max_ms = ms
+
+    def percentile(self, p: float) -> float:
+        """Retorna o limite superior (ms) do bucket que contém o percentil p (0-100)."""
+        with self._lock:
+            if not self._count:
+                return 0.0
+            target = self._count * (p / 100.0)
+            seen = 0
+            for idx, c in enumerate(self._counts):
+                seen += c
+                if seen >= target and c:
+                    if idx < len(self.buckets_ms):
+                        return float(self.buckets_ms[idx])
+                    return self._max_ms
+            return self._max_ms
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            count, total, max_ms = self._count, self._sum_ms, self._max_ms
+            counts = list(self._counts)
+        labels = [f"<={b}ms" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]}ms"]
+        return {
+            "count": count,
+            "avg_ms": (total / count) if count else 0.0,
+            "max_ms": max_ms,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "buckets": dict(zip(labels, counts)),
+        }
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * (len(self.buckets_ms) + 1)
+            self._count = 0
+            self._sum_ms = 0.0
+            self._max_ms = 0.0
+
+_histograms: dict[str, LatencyHistogram] = {}
+_counters: dict[str, int] = {}
+_gauges: dict[str, float] = {}
+_registry_lock = threading.Lock()
+
+def histogram(name: str) -> LatencyHistogram:
+    with _registry_lock:
+        h = _histograms.get(name)
+        if h is None:
+            h = _histograms[name] = LatencyHistogram(name)
+        return h
+
+def snapshot() -> dict:
+    with _registry_lock:
+        items = list(_histograms.items())
+    return {name: h.snapshot() for name, h in items}
+
+def incr(name: str, amount: int = 1):
+    with _registry_lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+def set_gauge(name: str, value: float):
+    with _registry_lock:
+        _gauges[name] = value
+
+def counters() -> dict:
+    with _registry_lock:
+        return dict(_counters)
+
+def gauges() -> dict:
+    with _registry_lock:
+        return dict(_gauges)
@@ -0,0 +1,178 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import os
+import json
+import time
+import threading
+from utils.file_utils import write_json_atomic
+
+INDEX_FILENAME = "_index.json"
+INDEX_VERSION = 1
+INDEX_STALE_CHECK_SECONDS = float(os.getenv("NPC_INDEX_STALE_CHECK", "2"))
+
+def _entry_from_data(name: str, data: dict, mtime_ns: int) -> list:
+    data = data if isinstance(data, dict) else {}
+    sistema = (data.get("informacoes_basicas") or {}).get("sistema_rpg")
+    return [data.get("nome", name), 1 if data.get("visivel_para_players") else 0, sistema, mtime_ns]
+
+def _stat_mtime(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+class NPCIndex:
+    """
+    Catálogo de NPCs por guild para o backend JSON. Mapeia (mestre, nome) para
+    nome de exibição, visibilidade, sistema e mtime, e fica salvo num sidecar
+    compacto (data/npcs/<guild>/_index.json). É atualizado a cada save/delete
+    e reconstruído só para as pastas de mestre cujo mtime mudou por fora.
+    """
+
+    def __init__(self, npcs_dir: str):
+        self.npcs_dir = npcs_dir
+        self._guilds: dict[str, dict] = {}
+        self._checked_at: dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def _guild_folder(self, guild_id) -> str:
+        return os.path.join(self.npcs_dir, str(guild_id))
+
+    def _sidecar_path(self, guild_id) -> str:
+        return os.path.join(self._guild_folder(guild_id), INDEX_FILENAME)
+
+    def _read_sidecar(self, guild_id) -> dict:
+        try:
+            with open(self._sidecar_path(guild_id), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                return {"folders": data.get("folders", {}), "npcs": data.get("npcs", {})}
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {"folders": {}, "npcs": {}}
+
+    def _persist(self, guild_id, index: dict):
+        payload = {"version": INDEX_VERSION, "folders": index["folders"], "npcs": index["npcs"]}
+        write_json_atomic(self._sidecar_path(guild_id), payload, indent=None)
+
+    def _scan_folder(self, folder: str, previous: dict) -> dict:
+        entries = {}
+        for filename in os.listdir(folder):
+            if not filename.endswith(".json"):
+                continue
+            name = filename[:-5]
+            path = os.path.join(folder, filename)
+            mtime_ns = _stat_mtime(path)
+            old = previous.get(name)
+            if old is not None and old[3] == mtime_ns:
+                entries[name] = old
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            entries[name] = _entry_from_data(name, data, mtime_ns)
+        return entries
+
+    def _ensure(self, guild_id) -> dict:
+        key = str(guild_id)
+        index = self._guilds.get(key)
+        now = time.monotonic()
+        if index is not None and now - self._checked_at.get(key, 0.0) < INDEX_STALE_CHECK_SECONDS:
+            return index
+        if index is None:
+            index = self._read_sidecar(key)
+            self._guilds[key] = index
+        self._checked_at[key] = now
+
+        guild_folder = self._guild_folder(key)
+        if not os.path.isdir(guild_folder):
+            index["folders"].clear()
+            index["npcs"].clear()
+            return index
+
+        changed = False
+        seen = set()
+        for mestre_id in os.listdir(guild_folder):
+            folder = os.path.join(guild_folder, mestre_id)
+            if not os.path.isdir(folder):
+                continue
+            seen.add(mestre_id)
+            mtime_ns = _stat_mtime(folder)
+            if index["folders"].get(mestre_id) == mtime_ns:
+                continue
+            index["npcs"][mestre_id] = self._scan_folder(folder, index["npcs"].get(mestre_id, {}))
+            index["folders"][mestre_id] = mtime_ns
+            changed = True
+        for mestre_id in list(index["folders"]):
+            if mestre_id not in seen:
+                index["folders"].pop(mestre_id, None)
+                index["npcs"].pop(mestre_id, None)
+                changed = True
+        if changed:
+            self._persist(key, index)
+        return index
+
+    def upsert(self, guild_id, mestre_id, npc_name: str, data: dict, npc_path: str):
+        with self._lock:
+            index = self._ensure(guild_id)
+            mestre_key = str(mestre_id)
+            index["npcs"].setdefault(mestre_key, {})[npc_name] = _entry_from_data(npc_name, data, _stat_mtime(npc_path))
+            index["folders"][mestre_key] = _stat_mtime(os.path.dirname(npc_path))
+            self._persist(guild_id, index)
+
+    def remove(self, guild_id, mestre_id, npc_name: str, folder: str):
+        with self._lock:
+            index = self._ensure(guild_id)
+            mestre_key = str(mestre_id)
+            index["npcs"].get(mestre_key, {}).pop(npc_name, None)
+            index["folders"][mestre_key] = _stat_mtime(folder)
+            self._persist(guild_id, index)
+
+    def entries(self, guild_id, mestre_id=None, visible_only: bool = False) -> list[dict]:
+        with self._lock:
+            index = self._ensure(guild_id)
+            if mestre_id is None:
+                groups = list(index["npcs"].items())
+            else:
+                groups = [(str(mestre_id), index["npcs"].get(str(mestre_id), {}))]
+            out = []
+            for mestre_key, npcs in groups:
+                for name, (nome, visivel, sistema, mtime_ns) in npcs.items():
+                    if visible_only and not visivel:
+                        continue
+                    out.append({
+                        "name": name,
+                        "nome": nome,
+                        "owner_id": int(mestre_key) if mestre_key.isdigit() else mestre_key,
+                        "visivel": bool(visivel),
+                        "sistema": sistema,
+                        "mtime": mtime_ns / 1e9,
+                    })
+            return out
+
+    def invalidate(self, guild_id=None):
+        with self._lock:
+            if guild_id is None:
+                self._guilds.clear()
+                self._checked_at.clear()
+            else:
+                self._guilds.pop(str(guild_id), None)
+                self._checked_at.pop(str(guild_id), None)
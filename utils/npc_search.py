@@ -0,0 +1,234 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import bisect
+import heapq
+import threading
+
+DEFAULT_LIMIT = 25
+FUZZY_MIN_SCORE = 0.25
+# Teto de candidatos avaliados na fase aproximada; mantém o pior caso limitado.
+FUZZY_CANDIDATES = 256
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class NameSearchIndex:
+    """
+    Índice de busca de nomes para autocomplete: array ordenado para prefixo
+    (bisect) + índice invertido de trigramas para substring e busca
+    aproximada. As listas de cada trigrama também ficam em ordem alfabética,
+    então a fase de substring percorre a menor delas e para ao atingir o
+    limite. Os trigramas têm padding no início (" go" marca início de
+    palavra). Ordem do resultado: prefixo do nome, início de palavra,
+    substring e, por fim, semelhança (Jaccard de trigramas).
+    """
+
+    def __init__(self, names=()):
+        self._names: dict[str, str] = {}
+        self._name_grams: dict[str, frozenset] = {}
+        self._grams: dict[str, list[tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+        for name in sorted(set(names), key=lambda n: (n.lower(), n)):
+            lower = name.lower()
+            grams = frozenset(_trigrams(lower))
+            self._names[name] = lower
+            self._name_grams[name] = grams
+            for gram in grams:
+                self._grams.setdefault(gram, []).append((lower, name))
+        self._sorted: list[tuple[str, str]] = [(lower, name) for name, lower in self._names.items()]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def add(self, name: str):
+        with self._lock:
+            if name in self._names:
+                return
+            lower = name.lower()
+            grams = frozenset(_trigrams(lower))
+            self._names[name] = lower
+            self._name_grams[name] = grams
+            bisect.insort(self._sorted, (lower, name))
+            for gram in grams:
+                bisect.insort(self._grams.setdefault(gram, []), (lower, name))
+
+    def remove(self, name: str):
+        with self._lock:
+            lower = self._names.pop(name, None)
+            if lower is None:
+                return
+            item = (lower, name)
+            _discard_sorted(self._sorted, item)
+            for gram in self._name_grams.pop(name):
+                posting = self._grams.get(gram)
+                if posting is not None:
+                    _discard_sorted(posting, item)
+                    if not posting:
+                        del self._grams[gram]
+
+    def _prefix(self, query: str, limit: int) -> list[str]:
+        out = []
+        idx = bisect.bisect_left(self._sorted, (query, ""))
+        while idx < len(self._sorted) and len(out) < limit:
+            lower, name = self._sorted[idx]
+            if not lower.startswith(query):
+                break
+            out.append(name)
+            idx += 1
+        return out
+
+    def _substring(self, query: str, limit: int, seen: set) -> list[str]:
+        if len(query) < 2:
+            return []
+        # Todo nome que contém a consulta está na lista de cada trigrama interno dela.
+        core = [query[i:i + 3] for i in range(len(query) - 2)] or [f" {query}"]
+        posting = min((self._grams.get(g, ()) for g in core), key=len)
+        # Casamento em início de palavra também exige o trigrama " xy".
+        starts = min(posting, self._grams.get(f" {query[:2]}", ()), key=len)
+        word = f" {query}"
+        hits = self._walk(starts, limit, seen, lambda lower: word in f" {lower}")
+        if len(hits) < limit:
+            seen = seen | set(hits)
+            hits += self._walk(posting, limit - len(hits), seen, lambda lower: query in lower)
+        return hits
+
+    @staticmethod
+    def _walk(posting, limit: int, seen: set, match) -> list[str]:
+        out = []
+        for lower, name in posting:
+            if name not in seen and match(lower):
+                out.append(name)
+                if len(out) >= limit:
+                    break
+        return out
+
+    def _fuzzy(self, query: str, limit: int, seen: set) -> list[str]:
+        q_grams = _trigrams(query)
+        cand: set[str] = set()
+        for posting in sorted((self._grams.get(g, ()) for g in q_grams), key=len):
+            for _, name in posting:
+                if name not in seen:
+                    cand.add(name)
+                    if len(cand) >= FUZZY_CANDIDATES:
+                        break
+            if len(cand) >= FUZZY_CANDIDATES:
+                break
+        scored = []
+        for name in cand:
+            grams = self._name_grams[name]
+            shared = len(q_grams & grams)
+            score = shared / (len(q_grams) + len(grams) - shared)
+            if score >= FUZZY_MIN_SCORE:
+                scored.append((-score, self._names[name], name))
+        return [item[-1] for item in heapq.nsmallest(limit, scored)]
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> list[str]:
+        query = (query or "").strip().lower()
+        with self._lock:
+            if not query:
+                return [name for _, name in self._sorted[:limit]]
+            results = self._prefix(query, limit)
+            if len(results) < limit:
+                results += self._substring(query, limit - len(results), set(results))
+            if len(results) < limit:
+                results += self._fuzzy(query, limit - len(results), set(results))
+            return results
+
+def _discard_sorted(items: list, item):
+    idx = bisect.bisect_left(items, item)
+    if idx < len(items) and items[idx] == item:
+        del items[idx]
+
+_indexes: dict[tuple, NameSearchIndex] = {}
+_registry_lock = threading.Lock()
+# Incrementado a cada save/delete; um índice construído durante uma escrita não é guardado.
+_generation = 0
+
+def _build(guild_id: int, mestre_id: int | None) -> NameSearchIndex:
+    from utils.npc_utils import NPCContext
+    if mestre_id is None:
+        names = [e["name"] for e in NPCContext.list_entries(guild_id, visible_only=True)]
+    else:
+        names = NPCContext.list_npcs(guild_id, mestre_id)
+    return NameSearchIndex(names)
+
+def _key(guild_id, mestre_id) -> tuple:
+    return (str(guild_id), None if mestre_id is None else str(mestre_id))
+
+def is_warm(guild_id: int, mestre_id: int | None) -> bool:
+    return _key(guild_id, mestre_id) in _indexes
+
+def get_index(guild_id: int, mestre_id: int | None) -> NameSearchIndex:
+    """Índice do mestre (ou, com mestre_id=None, dos NPCs visíveis da guild)."""
+    key = _key(guild_id, mestre_id)
+    index = _indexes.get(key)
+    if index is None:
+        generation = _generation
+        index = _build(guild_id, mestre_id)
+        with _registry_lock:
+            if generation == _generation:
+                index = _indexes.setdefault(key, index)
+    return index
+
+def search(guild_id: int, mestre_id: int | None, query: str, limit: int = DEFAULT_LIMIT) -> list[str]:
+    return get_index(guild_id, mestre_id).search(query, limit)
+
+def _bump():
+    global _generation
+    with _registry_lock:
+        _generation += 1
+
+def on_npc_saved(guild_id: int, mestre_id: int, npc_name: str, visible: bool):
+    _bump()
+    own = _indexes.get(_key(guild_id, mestre_id))
+    if own is not None:
+        own.add(npc_name)
+    public = _indexes.get(_key(guild_id, None))
+    if public is None:
+        return
+    if visible:
+        public.add(npc_name)
+    elif npc_name in public:
+        _drop_public(guild_id)
+
+def on_npc_deleted(guild_id: int, mestre_id: int, npc_name: str):
+    _bump()
+    own = _indexes.get(_key(guild_id, mestre_id))
+    if own is not None:
+        own.remove(npc_name)
+    public = _indexes.get(_key(guild_id, None))
+    if public is not None and npc_name in public:
+        _drop_public(guild_id)
+
+def _drop_public(guild_id: int):
+    # Outro mestre pode ter um NPC visível com o mesmo nome; reconstrói sob demanda.
+    with _registry_lock:
+        _indexes.pop(_key(guild_id, None), None)
+
+def invalidate(guild_id: int | None = None):
+    with _registry_lock:
+        if guild_id is None:
+            _indexes.clear()
+            return
+        for key in [k for k in _indexes if k[0] == str(guild_id)]:
+            del _indexes[key]
@@ -17,10 +17,14 @@
 # exclusive property of the author.
 
 import os
-import json
+from utils import npc_search, sheet_versions, sheet_patch
+from utils.storage_backends import get_backend, NPCS_DIR
+
+# Rascunhos de builder que ficavam dentro da ficha do NPC; hoje vivem em utils.draft_store.
+LEGACY_DRAFT_KEYS = ("ataques_em_progresso", "magias_em_progresso")
 
 class NPCContext:
-    BASE_DIR = "data/npcs"
+    BASE_DIR = NPCS_DIR
     def __init__(self, guild_id: int, mestre_id: int, npc_name: str):
         self.guild_id = guild_id
         self.mestre_id = mestre_id
@@ -35,45 +39,69 @@ class NPCContext:
         folder = cls.get_npc_folder(guild_id, mestre_id)
         return os.path.join(folder, f"{npc_name}.json")
 
+    @property
+    def path(self) -> str:
+        return self.get_npc_path(self.guild_id, self.mestre_id, self.npc_name)
+
+    @property
+    def sheet_id(self) -> str:
+        return sheet_versions.npc_id(self.guild_id, self.mestre_id, self.npc_name)
+
     def save(self, npc_data: dict):
-        folder = self.get_npc_folder(self.guild_id, self.mestre_id)
-        os.makedirs(folder, exist_ok=True)
-        path = self.get_npc_path(self.guild_id, self.mestre_id, self.npc_name)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(npc_data, f, indent=4, ensure_ascii=False)
+        sheet_versions.stamp(self.sheet_id, npc_data)
+        get_backend().save_npc(self.guild_id, self.mestre_id, self.npc_name, npc_data)
+        npc_search.on_npc_saved(self.guild_id, self.mestre_id, self.npc_name, bool(npc_data.get("visivel_para_players")))
+
+    def patch(self, ops: list[dict]):
+        """Altera campos do NPC com ops de utils.sheet_patch, gravando só o delta."""
+        if not sheet_versions.current(self.sheet_id):
+            # A versão do patch tem que passar a do arquivo; sem ela em memória, lê uma vez.
+            self.load()
+        version = sheet_versions.bump(self.sheet_id)
+        ops = list(ops) + [sheet_patch.set_path(sheet_versions.VERSION_KEY, version)]
+        get_backend().patch_npc(self.guild_id, self.mestre_id, self.npc_name, ops, version)
+        for op in ops:
+            if op["path"] == ["visivel_para_players"]:
+                npc_search.on_npc_saved(self.guild_id, self.mestre_id, self.npc_name, bool(op["value"]))
 
     def load(self) -> dict:
-        path = self.get_npc_path(self.guild_id, self.mestre_id, self.npc_name)
-        if not os.path.exists(path):
-            return {}
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        data = get_backend().load_npc(self.guild_id, self.mestre_id, self.npc_name) or {}
+        sheet_versions.observe(self.sheet_id, sheet_versions.version_of(data))
+        if [k for k in LEGACY_DRAFT_KEYS if data.pop(k, None) is not None]:
+            # Limpeza única: o NPC volta para o disco sem os rascunhos antigos.
+            self.save(data)
+        return data
+
+    def exists(self) -> bool:
+        return get_backend().npc_exists(self.guild_id, self.mestre_id, self.npc_name)
+
+    def delete(self) -> bool:
+        deleted = get_backend().delete_npc(self.guild_id, self.mestre_id, self.npc_name)
+        sheet_versions.bump(self.sheet_id)
+        npc_search.on_npc_deleted(self.guild_id, self.mestre_id, self.npc_name)
+        return deleted
+
+    async def update(self, fn):
+        """Read-modify-write do NPC sob o lock da ficha (ver player_utils.update_player_sheet)."""
+        from utils.storage import store
+        return await store.update_npc(self, fn)
 
     @classmethod
     def list_npcs(cls, guild_id: int, mestre_id: int) -> list[str]:
-        folder = cls.get_npc_folder(guild_id, mestre_id)
-        if not os.path.exists(folder):
-            return []
-        return [
-            filename[:-5] for filename in os.listdir(folder)
-            if filename.endswith(".json")
-        ]
+        return get_backend().list_npcs(guild_id, mestre_id)
 
     @classmethod
     def list_visible_npcs(cls, guild_id: int) -> list[str]:
-        visible_npcs = []
-        guild_folder = os.path.join(cls.BASE_DIR, str(guild_id))
-        if not os.path.exists(guild_folder):
-            return []
-
-        for mestre_id in os.listdir(guild_folder):
-            mestre_folder = os.path.join(guild_folder, mestre_id)
-            if os.path.isdir(mestre_folder):
-                for npc_filename in os.listdir(mestre_folder):
-                    if npc_filename.endswith(".json"):
-                        npc_path = os.path.join(mestre_folder, npc_filename)
-                        with open(npc_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            if data.get("visivel_para_players", False):
-                                visible_npcs.append(data.get("nome", npc_filename[:-5]))
-        return visible_npcs
+        return get_backend().list_visible_npcs(guild_id)
+
+    @classmethod
+    def list_entries(cls, guild_id: int, mestre_id: int | None = None, visible_only: bool = False) -> list[dict]:
+        return get_backend().list_npc_entries(guild_id, mestre_id, visible_only)
+
+    @classmethod
+    def find_visible(cls, guild_id: int, npc_name: str) -> "NPCContext | None":
+        """Localiza um NPC visível da guild pelo nome, independente do mestre dono."""
+        for entry in cls.list_entries(guild_id, visible_only=True):
+            if entry["name"] == npc_name:
+                return cls(guild_id, entry["owner_id"], entry["name"])
+        return None
@@ -17,37 +17,303 @@
 # exclusive property of the author.
 
 import os
-import json
 import re
+import copy
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from utils import sheet_versions, sheet_patch
+from utils.storage_backends import get_backend, PLAYERS_DIR
 
-BASE_PLAYER_PATH = "data/players"
+BASE_PLAYER_PATH = PLAYERS_DIR
+SHEET_CACHE_SIZE = int(os.getenv("SHEET_CACHE_SIZE", "512"))
+SHEET_FLUSH_INTERVAL = float(os.getenv("SHEET_FLUSH_INTERVAL", "5"))
+
+log = logging.getLogger(__name__)
+
+# Rascunhos que ficavam dentro da ficha antes do utils.draft_store.
+LEGACY_DRAFT_KEYS = ("ataques_em_progresso", "magias_em_progresso", "pets_drafts", "testes_modificadores_drafts")
+
+class SheetCache:
+    """
+    Cache LRU de fichas, em processo, com write-back.
+    Leituras repetidas não tocam o disco; escritas marcam a entrada como suja e
+    são gravadas em lote por uma thread de flush (e no desligamento do bot).
+    As entradas guardadas nunca são mutadas: get/put trabalham com cópias.
+    Entradas alteradas só por patch() guardam as ops pendentes e o flush manda
+    só o delta para o backend (journal), sem regravar a ficha.
+    """
+
+    def __init__(self, max_entries: int = SHEET_CACHE_SIZE, flush_interval: float = SHEET_FLUSH_INTERVAL):
+        self.max_entries = max(1, max_entries)
+        self.flush_interval = flush_interval
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._dirty: set[str] = set()
+        # Entradas sujas que saíram do LRU antes do flush; continuam legíveis.
+        self._evicted_dirty: dict[str, dict] = {}
+        # chave -> (ops pendentes, versão da ficha depois delas).
+        self._patched: dict[str, tuple[list, int]] = {}
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.disk_writes = 0
+        self.patches = 0
+        self.patch_writes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                data = self._evicted_dirty.pop(key, None)
+                if data is None:
+                    self.misses += 1
+                    return None
+                self._entries[key] = data
+                self._dirty.add(key)
+                self._evict()
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(data)
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries or key in self._evicted_dirty
+
+    def fill(self, key: str, data: dict):
+        """Popula o cache com dados recém-lidos do backend (entrada limpa)."""
+        with self._lock:
+            if key in self._entries or key in self._evicted_dirty:
+                return
+            self._entries[key] = copy.deepcopy(data)
+            self._evict()
+
+    def put(self, key: str, data: dict):
+        snapshot = copy.deepcopy(data)
+        with self._lock:
+            self._evicted_dirty.pop(key, None)
+            self._patched.pop(key, None)
+            self._entries[key] = snapshot
+            self._entries.move_to_end(key)
+            self._dirty.add(key)
+            self.writes += 1
+            self._evict()
+        self._ensure_flusher()
+
+    def patch(self, key: str, ops: list[dict], sheet_id: str) -> int | None:
+        """
+        Aplica ops na entrada em cache e enfileira o delta. Retorna a nova versão
+        da ficha, ou None se ela não estiver no cache.
+        """
+        with self._lock:
+            resident = key in self._entries
+            current = self._entries.get(key) if resident else self._evicted_dirty.get(key)
+            if current is None:
+                return None
+            # Copy-on-write: o flush pode estar serializando a entrada atual fora do lock.
+            data = copy.deepcopy(current)
+            version = sheet_versions.bump(sheet_id, sheet_versions.version_of(data))
+            ops = list(ops) + [sheet_patch.set_path(sheet_versions.VERSION_KEY, version)]
+            sheet_patch.apply(data, ops)
+            if resident:
+                self._entries[key] = data
+                self._entries.move_to_end(key)
+            else:
+                self._evicted_dirty[key] = data
+            self.patches += 1
+            # Com uma gravação completa pendente o delta já vai junto nela.
+            if key not in self._dirty and key not in self._evicted_dirty:
+                pending, _ = self._patched.get(key, ([], 0))
+                self._patched[key] = (pending + ops, version)
+        self._ensure_flusher()
+        return version
+
+    def discard(self, key: str) -> bool:
+        with self._lock:
+            known = key in self._entries or key in self._evicted_dirty
+            self._entries.pop(key, None)
+            self._evicted_dirty.pop(key, None)
+            self._dirty.discard(key)
+            self._patched.pop(key, None)
+            return known
+
+    def remove(self, key: str) -> bool:
+        with self._io_lock:
+            removed = self.discard(key)
+            return get_backend().delete_player(key) or removed
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            key, data = self._entries.popitem(last=False)
+            self.evictions += 1
+            if key in self._dirty:
+                self._dirty.discard(key)
+                self._evicted_dirty[key] = data
+            elif self._patched.pop(key, None) is not None:
+                # Sem a entrada em memória o delta não seria visto numa releitura; grava inteira.
+                self._evicted_dirty[key] = data
+
+    def flush(self):
+        with self._io_lock:
+            with self._lock:
+                pending = {key: self._entries[key] for key in self._dirty}
+                pending.update(self._evicted_dirty)
+                patched = self._patched
+                self._dirty.clear()
+                self._evicted_dirty.clear()
+                self._patched = {}
+            backend = get_backend()
+            for key, data in pending.items():
+                try:
+                    backend.save_player(key, data)
+                    self.disk_writes += 1
+                except Exception:
+                    log.exception(f"[sheet-cache] falha ao gravar {key}")
+                    with self._lock:
+                        if key in self._entries:
+                            if self._entries[key] is data:
+                                self._dirty.add(key)
+                            elif self._patched.pop(key, None) is not None:
+                                # Patches feitos depois sairiam sobre um base sem esta gravação.
+                                self._dirty.add(key)
+                        elif key not in self._evicted_dirty:
+                            self._evicted_dirty[key] = data
+            for key, (ops, version) in patched.items():
+                try:
+                    backend.patch_player(key, ops, version)
+                    self.patch_writes += 1
+                except Exception:
+                    log.exception(f"[sheet-cache] falha ao gravar patch de {key}")
+                    with self._lock:
+                        if key in self._dirty or key in self._evicted_dirty:
+                            continue
+                        later, latest = self._patched.get(key, ([], version))
+                        self._patched[key] = (ops + later, max(version, latest))
+
+    def _ensure_flusher(self):
+        if self.flush_interval <= 0:
+            self.flush()
+            return
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        with self._lock:
+            if self._flusher is not None and self._flusher.is_alive():
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name="sheet-cache-flush", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._wakeup.wait(self.flush_interval):
+            self.flush()
+
+    def clear(self):
+        self.flush()
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "dirty": len(self._dirty) + len(self._evicted_dirty),
+                "patched": len(self._patched),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "writes": self.writes,
+                "disk_writes": self.disk_writes,
+                "patches": self.patches,
+                "patch_writes": self.patch_writes,
+                "evictions": self.evictions,
+            }
+
+_sheet_cache = SheetCache()
+atexit.register(_sheet_cache.flush)
 
 def sanitize_filename(name: str) -> str:
     return re.sub(r'[\\/*?:"<>|]', "_", name)
 
+def player_key(character_name: str) -> str:
+    return sanitize_filename(character_name.lower().replace(" ", "_"))
+
 def get_player_sheet_path(character_name: str) -> str:
-    safe_name = sanitize_filename(character_name.lower().replace(" ", "_"))
-    return os.path.join(BASE_PLAYER_PATH, f"{safe_name}.json")
+    return os.path.join(BASE_PLAYER_PATH, f"{player_key(character_name)}.json")
+
+def _drop_legacy_drafts(data: dict) -> bool:
+    dropped = [k for k in LEGACY_DRAFT_KEYS if data.pop(k, None) is not None]
+    rolagens = data.get("rolagens")
+    if isinstance(rolagens, dict) and rolagens.pop("drafts", None) is not None:
+        dropped.append("rolagens.drafts")
+    return bool(dropped)
 
 def load_player_sheet(character_name: str) -> dict:
-    path = get_player_sheet_path(character_name)
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    key = player_key(character_name)
+    cached = _sheet_cache.get(key)
+    if cached is not None:
+        return cached
+    data = get_backend().load_player(key)
+    if data is None:
+        return {}
+    sheet_versions.observe(sheet_versions.player_id(key), sheet_versions.version_of(data))
+    if _drop_legacy_drafts(data):
+        # Limpeza única: a ficha volta para o disco sem os rascunhos antigos.
+        save_player_sheet(character_name, data)
+    else:
+        _sheet_cache.fill(key, data)
+    return data
 
 def save_player_sheet(character_name: str, data: dict):
-    path = get_player_sheet_path(character_name)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    key = player_key(character_name)
+    sheet_versions.stamp(sheet_versions.player_id(key), data)
+    _sheet_cache.put(key, data)
+
+def patch_player_sheet(character_name: str, ops: list[dict]):
+    """
+    Altera campos da ficha com ops de utils.sheet_patch (set/append/remove).
+    Só o delta é gravado no flush, em vez da ficha inteira.
+    """
+    key = player_key(character_name)
+    sheet_id = sheet_versions.player_id(key)
+    if not _sheet_cache.contains(key):
+        load_player_sheet(character_name)
+    if _sheet_cache.patch(key, ops, sheet_id) is None:
+        # Ficha inexistente (ou despejada entre a carga e o patch): grava completa.
+        data = load_player_sheet(character_name)
+        sheet_patch.apply(data, ops)
+        save_player_sheet(character_name, data)
+
+async def update_player_sheet(character_name: str, fn):
+    """
+    Read-modify-write seguro: carrega a ficha, aplica fn(ficha) (que altera o
+    dict no lugar, sync ou async) e salva, tudo sob o lock da ficha.
+    Se fn levantar exceção nada é salvo. Retorna o que fn retornar.
+    """
+    from utils.storage import store
+    return await store.update_player(character_name, fn)
+
+def is_player_sheet_cached(character_name: str) -> bool:
+    return _sheet_cache.contains(player_key(character_name))
 
 def player_sheet_exists(character_name: str) -> bool:
-    return os.path.exists(get_player_sheet_path(character_name))
+    key = player_key(character_name)
+    return _sheet_cache.contains(key) or get_backend().player_exists(key)
 
 def delete_player_sheet(character_name: str) -> bool:
-    path = get_player_sheet_path(character_name)
-    if os.path.exists(path):
-        os.remove(path)
-        return True
-    return False
+    key = player_key(character_name)
+    sheet_versions.bump(sheet_versions.player_id(key))
+    return _sheet_cache.remove(key)
+
+def player_sheet_id(character_name: str) -> str:
+    return sheet_versions.player_id(player_key(character_name))
+
+def flush_sheet_cache():
+    _sheet_cache.flush()
+
+def sheet_cache_stats() -> dict:
+    return _sheet_cache.stats()
@@ -0,0 +1,175 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import os
+import re
+import random
+import threading
+from utils import dice_stream
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional; sem ela as pools rolam em Python puro.
+    np = None
+
+HAS_NUMPY = np is not None
+# Acima deste número de dados o termo sai do FastDice e vai para a pool.
+DICE_POOL_THRESHOLD = int(os.getenv("DICE_POOL_THRESHOLD", "100"))
+DICE_POOL_MAX = int(os.getenv("DICE_POOL_MAX", "1000000"))
+# Pools maiores que isso mostram um resumo em vez de cada dado.
+POOL_RENDER_LIMIT = 50
+
+_POOL_RE = re.compile(r'^(\d*)d(\d+)(?:(kh|kl|dh|dl|ph|pl)(\d+))?(?:(>=|>)(\d+))?$', re.IGNORECASE)
+_ALIASES = {"dh": "ph", "dl": "pl"}
+
+_local = threading.local()
+
+def _generator():
+    rng = getattr(_local, "rng", None)
+    if rng is None:
+        rng = _local.rng = np.random.default_rng()
+    return rng
+
+class PoolRoll:
+    """Resultado de uma pool: valores, máscara de mantidos, total e sucessos (se houver alvo)."""
+    __slots__ = ("spec", "values", "kept", "total", "successes")
+
+    def __init__(self, spec: "PoolDice", values, kept, total: int, successes: int | None = None):
+        self.spec = spec
+        self.values = values
+        self.kept = kept
+        self.total = total
+        self.successes = successes
+
+    def value_list(self) -> list[int]:
+        return self.values.tolist() if hasattr(self.values, "tolist") else list(self.values)
+
+    def kept_list(self) -> list[bool]:
+        return self.kept.tolist() if hasattr(self.kept, "tolist") else list(self.kept)
+
+    def __str__(self):
+        spec = self.spec
+        if spec.count <= POOL_RENDER_LIMIT:
+            parts = []
+            for value, kept in zip(self.value_list(), self.kept_list()):
+                text = f"**{value}**" if value == 1 or value == spec.sides else str(value)
+                parts.append(text if kept else f"~~{text}~~")
+            inside = ", ".join(parts)
+        else:
+            kept = self.kept_list().count(True)
+            inside = f"{spec.count} dados"
+            if kept != spec.count:
+                inside += f", {kept} mantidos"
+        if self.successes is not None:
+            return f"{spec} ({inside}) = `{self.successes}` sucessos"
+        return f"{spec} ({inside}) = `{self.total}`"
+
+class PoolDice:
+    """
+    Pool de dados NdX com kh/kl/ph/pl e contagem de sucessos (>=T / >T)
+    opcionais. Resultado sempre exato, para qualquer tamanho até
+    DICE_POOL_MAX: vetorizado com NumPy quando disponível, senão em lote
+    com random.choices.
+    """
+    __slots__ = ("count", "sides", "mode", "n", "op", "target")
+
+    def __init__(self, count: int, sides: int, mode: str | None = None, n: int = 0,
+                 op: str | None = None, target: int = 0):
+        self.count = count
+        self.sides = sides
+        self.mode = mode
+        self.n = n
+        self.op = op
+        self.target = target
+
+    @classmethod
+    def parse(cls, expr: str) -> "PoolDice | None":
+        match = _POOL_RE.match(expr.strip())
+        if not match:
+            return None
+        count = int(match.group(1)) if match.group(1) else 1
+        sides = int(match.group(2))
+        if not 1 <= count <= DICE_POOL_MAX or sides < 1:
+            return None
+        mode = match.group(3).lower() if match.group(3) else None
+        mode = _ALIASES.get(mode, mode)
+        return cls(count, sides, mode, int(match.group(4) or 0), match.group(5), int(match.group(6) or 0))
+
+    @property
+    def keep_count(self) -> int:
+        if self.mode is None:
+            return self.count
+        if self.mode in ("kh", "kl"):
+            return min(self.n, self.count)
+        return max(0, self.count - self.n)
+
+    def roll(self, rng=None) -> PoolRoll:
+        draw = rng or dice_stream.current()
+        if draw is not None:
+            values = draw.dice(self.count, self.sides)
+            if HAS_NUMPY and isinstance(values, np.ndarray):
+                return self._roll_numpy(values)
+            return self._roll_python(values)
+        if HAS_NUMPY:
+            return self._roll_numpy()
+        return self._roll_python()
+
+    def _roll_numpy(self, values=None) -> PoolRoll:
+        if values is None:
+            values = _generator().integers(1, self.sides + 1, size=self.count)
+        kept = np.ones(self.count, dtype=bool)
+        if self.mode is not None:
+            keep = self.keep_count
+            # kh/pl mantêm os maiores; kl/ph mantêm os menores.
+            keep_high = (self.mode == "kh") or (self.mode == "pl")
+            order = np.argsort(-values if keep_high else values, kind="stable")
+            kept[:] = False
+            kept[order[:keep]] = True
+        kept_values = values[kept]
+        successes = None
+        if self.op is not None:
+            hits = kept_values >= self.target if self.op == ">=" else kept_values > self.target
+            successes = int(np.count_nonzero(hits))
+        total = successes if successes is not None else int(kept_values.sum())
+        return PoolRoll(self, values, kept, total, successes)
+
+    def _roll_python(self, values=None) -> PoolRoll:
+        if values is None:
+            values = random.choices(range(1, self.sides + 1), k=self.count)
+        if self.mode is None:
+            kept = [True] * self.count
+        else:
+            keep_high = self.mode in ("kh", "pl")
+            order = sorted(range(self.count), key=values.__getitem__, reverse=keep_high)
+            chosen = set(order[:self.keep_count])
+            kept = [i in chosen for i in range(self.count)]
+        kept_values = [v for v, k in zip(values, kept) if k]
+        successes = None
+        if self.op is not None:
+            target = self.target
+            successes = sum(1 for v in kept_values if (v >= target if self.op == ">=" else v > target))
+        total = successes if successes is not None else sum(kept_values)
+        return PoolRoll(self, values, kept, total, successes)
+
+    def __str__(self):
+        text = f"{self.count}d{self.sides}"
+        if self.mode:
+            text += f"{self.mode}{self.n}"
+        if self.op:
+            text += f"{self.op}{self.target}"
+        return text
@@ -0,0 +1,63 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+from utils.storage import store
+
+SETTINGS_KEY = "canais_rolagem"
+
+# guild_id -> canais liberados (None = sem filtro, o listener vale no servidor todo).
+_channels: dict[int, frozenset[int] | None] = {}
+
+def _from_settings(settings: dict) -> frozenset[int] | None:
+    channels = settings.get(SETTINGS_KEY)
+    return frozenset(int(c) for c in channels) if channels else None
+
+async def allowed_channels(guild_id: int) -> frozenset[int] | None:
+    if guild_id not in _channels:
+        _channels[guild_id] = _from_settings(await store.get_guild_settings(guild_id))
+    return _channels[guild_id]
+
+async def is_enabled(guild_id: int, channel_id: int, parent_id: int | None = None) -> bool:
+    """
+    Filtro opcional por servidor. Sem canais configurados a rolagem livre
+    funciona em todo canal; com a lista, só nos canais dela (e nas threads
+    desses canais).
+    """
+    channels = await allowed_channels(guild_id)
+    return channels is None or channel_id in channels or (parent_id is not None and parent_id in channels)
+
+async def toggle_channel(guild_id: int, channel_id: int) -> bool:
+    """Liga/desliga o canal na lista do servidor. Retorna se ficou liberado."""
+    def _apply(settings: dict) -> bool:
+        channels = [int(c) for c in settings.get(SETTINGS_KEY) or []]
+        enabled = channel_id not in channels
+        if enabled:
+            channels.append(channel_id)
+        else:
+            channels.remove(channel_id)
+        settings[SETTINGS_KEY] = channels
+        _channels[guild_id] = frozenset(channels) or None
+        return enabled
+    return await store.update_guild_settings(guild_id, _apply)
+
+async def clear_channels(guild_id: int):
+    def _apply(settings: dict):
+        settings.pop(SETTINGS_KEY, None)
+        _channels[guild_id] = None
+    await store.update_guild_settings(guild_id, _apply)
@@ -0,0 +1,145 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import re
+
+# Mensagens maiores que isso nunca são tratadas como rolagem livre.
+MAX_ROLL_MESSAGE = 300
+# Teto de repetições em N#expr; acima disso a mensagem não é tratada como rolagem.
+MAX_ROLL_REPEAT = 100
+
+_TOKEN_RE = re.compile(r"""
+     (?P<ws>\s+)
+    |(?P<dice>(?P<count>\d*)[dD](?P<sides>\d+|[fF](?![^\W\d_])))
+    |(?P<num>\d+)
+    |(?P<word>[^\W\d_]+)
+    |(?P<sym>[-+*/()<>=!#%,.])
+    |(?P<other>.)
+""", re.VERBOSE)
+
+_ADV_WORDS = {"adv": "vantagem", "vantagem": "vantagem", "advantage": "vantagem",
+              "dis": "desvantagem", "desvantagem": "desvantagem", "disadvantage": "desvantagem"}
+# Operadores do d20 que aparecem como letras dentro de uma expressão.
+_ROLL_WORDS = {"kh", "kl", "ph", "pl", "dh", "dl", "k", "p", "e", "rr", "ro", "ra", "mi", "ma"}
+_ADV_DICE = {"vantagem": "2d20kh1", "desvantagem": "2d20kl1"}
+
+class ParsedRoll:
+    """Rolagem livre reconhecida: expressão já normalizada, repetições (N#) e vantagem."""
+    __slots__ = ("expr", "repeat", "advantage_state")
+
+    def __init__(self, expr: str, repeat: int = 1, advantage_state: str = "normal"):
+        self.expr = expr
+        self.repeat = repeat
+        self.advantage_state = advantage_state
+
+    def __repr__(self):
+        return f"ParsedRoll({self.expr!r}, repeat={self.repeat}, advantage_state={self.advantage_state!r})"
+
+def recognize(content: str) -> ParsedRoll | None:
+    """
+    Decide numa única varredura se a mensagem é uma rolagem livre e já
+    devolve a expressão normalizada (sem espaços, "d6" -> "1d6", d20 trocado
+    por 2d20kh1/kl1 na vantagem/desvantagem). Conversa comum é descartada
+    logo no primeiro token que não pertence a uma expressão.
+    """
+    if not content or len(content) > MAX_ROLL_MESSAGE:
+        return None
+    pieces = []
+    advantage_state = "normal"
+    repeat = 1
+    pending_num = None
+    has_dice = False
+    clean = True
+    starts_with_dice = None
+    adv_applied = False
+    prev = None
+    # Fases: 0 = início (prefixo de vantagem), 1 = após prefixo (N#), 2 = expressão.
+    phase = 0
+    for m in _TOKEN_RE.finditer(content):
+        kind = m.lastgroup
+        if kind == "ws":
+            prev = None
+            continue
+        text = m.group()
+        if phase == 0:
+            phase = 1
+            if kind == "word" and text.lower() in _ADV_WORDS:
+                advantage_state = _ADV_WORDS[text.lower()]
+                prev = "prefix"
+                continue
+        if prev == "prefix" and kind in ("sym", "other") and text in ":-":
+            continue
+        if phase == 1:
+            if pending_num is not None:
+                phase = 2
+                if kind == "sym" and text == "#":
+                    repeat = max(1, int(pending_num))
+                    if repeat > MAX_ROLL_REPEAT:
+                        return None
+                    pending_num = None
+                    prev = None
+                    continue
+                pieces.append(pending_num)
+                starts_with_dice = False
+                pending_num = None
+            elif kind == "num":
+                pending_num = text
+                prev = "num"
+                continue
+            else:
+                phase = 2
+        if starts_with_dice is None:
+            starts_with_dice = kind == "dice"
+        if kind == "dice":
+            count, sides = m.group("count"), m.group("sides")
+            if not count and prev in ("dice", "num", "word"):
+                # "4d6d1": aqui o d é o operador de descarte, não um dado novo.
+                pieces.append(text)
+            else:
+                has_dice = True
+                nxt = content[m.end():m.end() + 1]
+                if (advantage_state != "normal" and not adv_applied and sides == "20"
+                        and not (nxt.isalnum() or nxt == "_")):
+                    pieces.append(_ADV_DICE[advantage_state])
+                    adv_applied = True
+                elif sides.isdigit():
+                    pieces.append(f"{count or '1'}d{sides}")
+                else:
+                    pieces.append(text)
+        elif kind == "word":
+            lowered = text.lower()
+            if lowered in _ROLL_WORDS:
+                pieces.append(lowered)
+            else:
+                clean = False
+                pieces.append(text)
+        else:
+            if kind == "other":
+                clean = False
+            pieces.append(text)
+        if not clean and not starts_with_dice:
+            return None
+        prev = kind
+    if pending_num is not None:
+        pieces.append(pending_num)
+    if not pieces or not (has_dice or advantage_state != "normal"):
+        return None
+    if not clean and not (has_dice and starts_with_dice):
+        return None
+    return ParsedRoll("".join(pieces), repeat, advantage_state)
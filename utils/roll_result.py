@@ -0,0 +1,149 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import d20
+from utils.fast_dice import FastRoll
+from utils.pool_dice import PoolRoll
+
+class DiceGroup:
+    """Um grupo NdX rolado: valores na ordem rolada e máscara de mantidos."""
+    __slots__ = ("sides", "values", "kept")
+
+    def __init__(self, sides, values: list[int], kept: list[bool]):
+        self.sides = sides
+        self.values = values
+        self.kept = kept
+
+    @property
+    def kept_values(self) -> list[int]:
+        return [v for v, k in zip(self.values, self.kept) if k]
+
+    @property
+    def dropped_values(self) -> list[int]:
+        return [v for v, k in zip(self.values, self.kept) if not k]
+
+def _d20_groups(node, kept: bool = True) -> list[DiceGroup]:
+    kept = kept and node.kept
+    if isinstance(node, d20.Dice):
+        return [DiceGroup(node.size, [d.number for d in node.values], [kept and d.kept for d in node.values])]
+    groups = []
+    for child in node.children:
+        groups.extend(_d20_groups(child, kept))
+    return groups
+
+class RollTerm:
+    """
+    Termo de uma rolagem: modificador inteiro (roll=None) ou dado, guardando o
+    resultado original (FastRoll ou RollResult do d20) para renderizar depois.
+    """
+    __slots__ = ("expr", "sign", "total", "roll", "_groups")
+
+    def __init__(self, expr: str, sign: int, total: int, roll=None):
+        self.expr = expr
+        self.sign = sign
+        self.total = total
+        self.roll = roll
+        self._groups = None
+
+    @property
+    def is_modifier(self) -> bool:
+        return self.roll is None
+
+    @property
+    def groups(self) -> list[DiceGroup]:
+        if self._groups is None:
+            if self.roll is None:
+                self._groups = []
+            elif isinstance(self.roll, FastRoll):
+                self._groups = [DiceGroup(self.roll.spec.sides, self.roll.values, self.roll.kept)]
+            elif isinstance(self.roll, PoolRoll):
+                self._groups = [DiceGroup(self.roll.spec.sides, self.roll.value_list(), self.roll.kept_list())]
+            else:
+                self._groups = _d20_groups(self.roll.expr)
+        return self._groups
+
+class RollResult:
+    """
+    Resultado tipado de roll_dice. Campos estruturados (termos, dados,
+    d20 naturais) para a lógica de crítico/vantagem; o texto de detalhes é
+    renderizado só quando pedido. Continua desempacotável como
+    (total, breakdown) para quem ainda usa a forma antiga. `ticket` é a
+    posição no fluxo de dados do servidor (dice_stream), quando houver.
+    """
+    __slots__ = ("expression", "total", "terms", "_breakdown", "ticket")
+
+    def __init__(self, expression: str, total: int, terms: list[RollTerm] | None = None, breakdown: str | None = None,
+                 ticket: str | None = None):
+        self.expression = expression
+        self.total = total
+        self.terms = terms or []
+        self._breakdown = breakdown
+        self.ticket = ticket
+
+    def __iter__(self):
+        yield self.total
+        yield self.breakdown
+
+    def __getitem__(self, index):
+        return (self.total, self.breakdown)[index]
+
+    def __len__(self) -> int:
+        return 2
+
+    @property
+    def breakdown(self) -> str:
+        if self._breakdown is None:
+            self._breakdown = render_breakdown(self)
+        return self._breakdown
+
+    @property
+    def groups(self) -> list[DiceGroup]:
+        return [g for term in self.terms for g in term.groups]
+
+    @property
+    def modifier(self) -> int:
+        return sum(term.total for term in self.terms if term.is_modifier)
+
+    def naturals(self, sides=20, kept_only: bool = True) -> list[int]:
+        out = []
+        for group in self.groups:
+            if group.sides == sides:
+                out.extend(group.kept_values if kept_only else group.values)
+        return out
+
+    @property
+    def natural_d20s(self) -> list[int]:
+        return self.naturals(20)
+
+    def is_crit(self, crit_range: int = 20) -> bool:
+        return any(v >= crit_range for v in self.natural_d20s)
+
+    def is_fumble(self) -> bool:
+        return 1 in self.natural_d20s
+
+def render_breakdown(result: RollResult) -> str:
+    lines = []
+    for term in result.terms:
+        if term.is_modifier:
+            lines.append(f"Modificador: {term.total:+}")
+        else:
+            lines.append(f"{term.expr}: {term.roll} = {term.total}")
+    breakdown = "🎲 **Detalhes das Rolagens:**\n"
+    breakdown += "\n".join(lines)
+    breakdown += f"\n\n💥 **Total Final: {result.total}**"
+    return breakdown
@@ -0,0 +1,71 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import copy
+from utils import metrics, sheet_versions
+
+_REMOVED = object()
+
+def diff(base: dict, edited: dict, path: tuple = ()) -> list[tuple[tuple, object]]:
+    """
+    Campos que mudaram de base para edited, como (caminho, valor novo).
+    Dicts são comparados campo a campo; listas e valores simples, inteiros.
+    """
+    changes = []
+    keys = list(edited) + [k for k in base if k not in edited]
+    for key in keys:
+        if not path and key == sheet_versions.VERSION_KEY:
+            continue
+        old = base.get(key, _REMOVED)
+        new = edited.get(key, _REMOVED)
+        if isinstance(old, dict) and isinstance(new, dict):
+            changes.extend(diff(old, new, path + (key,)))
+        elif old is not new and (old is _REMOVED or new is _REMOVED or old != new):
+            changes.append((path + (key,), new))
+    return changes
+
+def apply(target: dict, changes: list[tuple[tuple, object]]):
+    for path, value in changes:
+        node = target
+        for key in path[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = node[key] = {}
+            node = child
+        if value is _REMOVED:
+            node.pop(path[-1], None)
+        else:
+            node[path[-1]] = copy.deepcopy(value)
+
+def merge_save(sheet_id: str, base: dict, edited: dict, load, save) -> dict:
+    """
+    Compare-and-swap de uma cópia editada da ficha. Se ninguém gravou desde
+    que `base` foi lida, grava `edited` inteira; senão recarrega a ficha,
+    aplica só os campos que mudaram de base para edited e grava o resultado.
+    Retorna a ficha gravada. Conflitos contam em sheet.cas.conflicts.
+    """
+    metrics.incr("sheet.cas.saves")
+    if not sheet_versions.is_stale(sheet_id, base):
+        save(edited)
+        return edited
+    metrics.incr("sheet.cas.conflicts")
+    current = load()
+    apply(current, diff(base, edited))
+    save(current)
+    return current
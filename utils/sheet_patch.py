@@ -0,0 +1,77 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+"""
+Patches de ficha: alterações pequenas descritas como operações sobre um
+caminho (tupla de chaves), para gravar só o delta em vez da ficha inteira.
+"""
+
+import copy
+
+SET = "set"
+APPEND = "append"
+REMOVE = "remove"
+
+def _path(path) -> list:
+    return [path] if isinstance(path, str) else list(path)
+
+def set_path(path, value) -> dict:
+    return {"op": SET, "path": _path(path), "value": value}
+
+def append(path, value) -> dict:
+    return {"op": APPEND, "path": _path(path), "value": value}
+
+def remove(path, value) -> dict:
+    """Remove a primeira ocorrência de value da lista em path (sem erro se não houver)."""
+    return {"op": REMOVE, "path": _path(path), "value": value}
+
+def _parent(data: dict, path: list) -> dict:
+    node = data
+    for key in path[:-1]:
+        child = node.get(key)
+        if not isinstance(child, dict):
+            child = node[key] = {}
+        node = child
+    return node
+
+def apply(data: dict, ops: list[dict]) -> dict:
+    """Aplica ops em data, no lugar. Dicts intermediários que faltarem são criados."""
+    for op in ops:
+        path = op["path"]
+        node = _parent(data, path)
+        key = path[-1]
+        kind = op["op"]
+        if kind == SET:
+            node[key] = copy.deepcopy(op["value"])
+        elif kind == APPEND:
+            items = node.get(key)
+            if not isinstance(items, list):
+                items = node[key] = []
+            items.append(copy.deepcopy(op["value"]))
+        elif kind == REMOVE:
+            items = node.get(key)
+            if isinstance(items, list) and op["value"] in items:
+                items.remove(op["value"])
+        else:
+            raise ValueError(f"operação de patch desconhecida: {kind!r}")
+    return data
+
+def touches(ops: list[dict], keys) -> bool:
+    """Alguma op mexe numa das chaves de primeiro nível em keys."""
+    return any(op["path"][0] in keys for op in ops)
@@ -0,0 +1,59 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import threading
+
+# Campo gravado em toda ficha com a versão dela; sobe a cada gravação.
+VERSION_KEY = "_versao"
+
+# id da ficha -> maior versão vista neste processo (gravada ou lida do backend).
+_versions: dict[str, int] = {}
+_lock = threading.Lock()
+
+def player_id(key: str) -> str:
+    return f"player:{key}"
+
+def npc_id(guild_id: int, mestre_id: int, npc_name: str) -> str:
+    return f"npc:{guild_id}:{mestre_id}:{npc_name}"
+
+def current(sheet_id: str) -> int:
+    return _versions.get(sheet_id, 0)
+
+def observe(sheet_id: str, version: int):
+    """Registra a versão de uma ficha lida do backend."""
+    with _lock:
+        if version > _versions.get(sheet_id, 0):
+            _versions[sheet_id] = version
+
+def bump(sheet_id: str, stored: int = 0) -> int:
+    with _lock:
+        version = _versions[sheet_id] = max(_versions.get(sheet_id, 0), stored) + 1
+    return version
+
+def stamp(sheet_id: str, data: dict) -> int:
+    """Próxima versão da ficha, já escrita em data[VERSION_KEY]; chamado em toda gravação."""
+    version = data[VERSION_KEY] = bump(sheet_id, int(data.get(VERSION_KEY, 0) or 0))
+    return version
+
+def version_of(data: dict) -> int:
+    return int(data.get(VERSION_KEY, 0) or 0)
+
+def is_stale(sheet_id: str, data: dict) -> bool:
+    """A cópia em data ficou para trás (alguém gravou a ficha depois que ela foi lida)."""
+    return current(sheet_id) != version_of(data)
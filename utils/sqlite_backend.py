@@ -0,0 +1,294 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from utils.storage_backends import StorageBackend, JsonFileBackend, SQLITE_PATH
+
+log = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    key TEXT PRIMARY KEY,
+    owner_id INTEGER,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_players_owner ON players(owner_id);
+
+CREATE TABLE IF NOT EXISTS npcs (
+    guild_id INTEGER NOT NULL,
+    owner_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    visivel_para_players INTEGER NOT NULL DEFAULT 0,
+    sistema_rpg TEXT,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (guild_id, owner_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_npcs_visible ON npcs(guild_id, visivel_para_players);
+CREATE INDEX IF NOT EXISTS idx_npcs_name ON npcs(guild_id, name);
+
+CREATE TABLE IF NOT EXISTS mestres (
+    guild_key TEXT NOT NULL,
+    user_id INTEGER NOT NULL,
+    nome TEXT,
+    position INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_key, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS guild_settings (
+    guild_id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+def _owner_from_key(key: str) -> int | None:
+    head = key.split("_", 1)[0]
+    return int(head) if head.isdigit() else None
+
+def _as_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+class SqliteBackend(StorageBackend):
+    """
+    Backend SQLite em modo WAL. Colunas indexadas para as consultas quentes
+    (dono, guild, visibilidade, nome) e a ficha completa como JSON numa coluna
+    de payload. Cada thread usa sua própria conexão.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str = SQLITE_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    def _dumps(data) -> str:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    def load_player(self, key: str) -> dict | None:
+        row = self._conn().execute("SELECT data FROM players WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_player(self, key: str, data: dict):
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO players (key, owner_id, name, data, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                (key, _owner_from_key(key), key, self._dumps(data), time.time())
+            )
+
+    def delete_player(self, key: str) -> bool:
+        with self._conn() as conn:
+            return conn.execute("DELETE FROM players WHERE key = ?", (key,)).rowcount > 0
+
+    def player_exists(self, key: str) -> bool:
+        return self._conn().execute("SELECT 1 FROM players WHERE key = ?", (key,)).fetchone() is not None
+
+    def list_players(self) -> list[str]:
+        return [r[0] for r in self._conn().execute("SELECT key FROM players")]
+
+    def load_npc(self, guild_id: int, mestre_id: int, npc_name: str) -> dict | None:
+        row = self._conn().execute(
+            "SELECT data FROM npcs WHERE guild_id = ? AND owner_id = ? AND name = ?",
+            (_as_int(guild_id), _as_int(mestre_id), npc_name)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_npc(self, guild_id: int, mestre_id: int, npc_name: str, data: dict):
+        sistema = (data.get("informacoes_basicas") or {}).get("sistema_rpg") if isinstance(data, dict) else None
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO npcs (guild_id, owner_id, name, visivel_para_players, sistema_rpg, data, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(guild_id, owner_id, name) DO UPDATE SET "
+                "visivel_para_players = excluded.visivel_para_players, sistema_rpg = excluded.sistema_rpg, "
+                "data = excluded.data, updated_at = excluded.updated_at",
+                (_as_int(guild_id), _as_int(mestre_id), npc_name,
+                 1 if data.get("visivel_para_players") else 0, sistema,
+                 self._dumps(data), time.time())
+            )
+
+    def delete_npc(self, guild_id: int, mestre_id: int, npc_name: str) -> bool:
+        with self._conn() as conn:
+            cur = conn.execute(
+                "DELETE FROM npcs WHERE guild_id = ? AND owner_id = ? AND name = ?",
+                (_as_int(guild_id), _as_int(mestre_id), npc_name)
+            )
+            return cur.rowcount > 0
+
+    def npc_exists(self, guild_id: int, mestre_id: int, npc_name: str) -> bool:
+        row = self._conn().execute(
+            "SELECT 1 FROM npcs WHERE guild_id = ? AND owner_id = ? AND name = ?",
+            (_as_int(guild_id), _as_int(mestre_id), npc_name)
+        ).fetchone()
+        return row is not None
+
+    def list_npcs(self, guild_id: int, mestre_id: int) -> list[str]:
+        rows = self._conn().execute(
+            "SELECT name FROM npcs WHERE guild_id = ? AND owner_id = ? ORDER BY name",
+            (_as_int(guild_id), _as_int(mestre_id))
+        )
+        return [r[0] for r in rows]
+
+    def list_visible_npcs(self, guild_id: int) -> list[str]:
+        rows = self._conn().execute(
+            "SELECT COALESCE(json_extract(data, '$.nome'), name) FROM npcs "
+            "WHERE guild_id = ? AND visivel_para_players = 1",
+            (_as_int(guild_id),)
+        )
+        return [r[0] for r in rows]
+
+    def list_npc_entries(self, guild_id: int, mestre_id: int | None = None, visible_only: bool = False) -> list[dict]:
+        sql = ("SELECT name, COALESCE(json_extract(data, '$.nome'), name), owner_id, visivel_para_players, "
+               "sistema_rpg, updated_at FROM npcs WHERE guild_id = ?")
+        params: list = [_as_int(guild_id)]
+        if mestre_id is not None:
+            sql += " AND owner_id = ?"
+            params.append(_as_int(mestre_id))
+        if visible_only:
+            sql += " AND visivel_para_players = 1"
+        return [
+            {"name": r[0], "nome": r[1], "owner_id": r[2], "visivel": bool(r[3]), "sistema": r[4], "mtime": r[5]}
+            for r in self._conn().execute(sql, params)
+        ]
+
+    def load_mestres(self, guild_key: str) -> list:
+        rows = self._conn().execute(
+            "SELECT user_id, nome FROM mestres WHERE guild_key = ? ORDER BY position",
+            (str(guild_key),)
+        )
+        return [{"id": r[0], "nome": r[1]} for r in rows]
+
+    def save_mestres(self, guild_key: str, mestres: list):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM mestres WHERE guild_key = ?", (str(guild_key),))
+            conn.executemany(
+                "INSERT OR REPLACE INTO mestres (guild_key, user_id, nome, position) VALUES (?, ?, ?, ?)",
+                [(str(guild_key), m["id"], m.get("nome"), i) for i, m in enumerate(mestres)]
+            )
+
+    def load_guild_settings(self, guild_id: int) -> dict:
+        row = self._conn().execute("SELECT data FROM guild_settings WHERE guild_id = ?", (_as_int(guild_id),)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def save_guild_settings(self, guild_id: int, settings: dict):
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO guild_settings (guild_id, data, updated_at) VALUES (?, ?, ?)",
+                (_as_int(guild_id), self._dumps(settings), time.time())
+            )
+
+    def close(self):
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+        self._local = threading.local()
+
+def migrate_json_to_sqlite(source: JsonFileBackend | None = None, target: SqliteBackend | None = None) -> dict:
+    """
+    Migração única da árvore JSON (data/players, data/npcs, data/servidores)
+    para o SQLite. É idempotente: rodar de novo só sobrescreve as linhas.
+    """
+    source = source or JsonFileBackend()
+    target = target or SqliteBackend()
+    counts = {"players": 0, "npcs": 0, "mestres": 0, "settings": 0, "errors": 0}
+
+    for key in source.list_players():
+        try:
+            target.save_player(key, source.load_player(key) or {})
+            counts["players"] += 1
+        except Exception:
+            counts["errors"] += 1
+            log.exception(f"[migrate] player {key}")
+
+    if os.path.isdir(source.npcs_dir):
+        for guild_id in os.listdir(source.npcs_dir):
+            guild_folder = os.path.join(source.npcs_dir, guild_id)
+            if not os.path.isdir(guild_folder):
+                continue
+            for mestre_id in os.listdir(guild_folder):
+                if not os.path.isdir(os.path.join(guild_folder, mestre_id)):
+                    continue
+                for npc_name in source.list_npcs(guild_id, mestre_id):
+                    try:
+                        data = source.load_npc(guild_id, mestre_id, npc_name) or {}
+                        target.save_npc(guild_id, mestre_id, npc_name, data)
+                        counts["npcs"] += 1
+                    except Exception:
+                        counts["errors"] += 1
+                        log.exception(f"[migrate] npc {guild_id}/{mestre_id}/{npc_name}")
+
+    if os.path.isdir(source.servers_dir):
+        for guild_key in os.listdir(source.servers_dir):
+            try:
+                mestres = source.load_mestres(guild_key)
+                if mestres:
+                    target.save_mestres(guild_key, mestres)
+                    counts["mestres"] += len(mestres)
+            except Exception:
+                counts["errors"] += 1
+                log.exception(f"[migrate] mestres {guild_key}")
+            if not guild_key.isdigit():
+                continue
+            try:
+                settings = source.load_guild_settings(guild_key)
+                if settings:
+                    target.save_guild_settings(guild_key, settings)
+                    counts["settings"] += 1
+            except Exception:
+                counts["errors"] += 1
+                log.exception(f"[migrate] config {guild_key}")
+    return counts
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(migrate_json_to_sqlite())
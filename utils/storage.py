@@ -0,0 +1,198 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import os
+import time
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from utils import player_utils, mestre_utils, metrics, npc_search, sheet_cas
+from utils.npc_utils import NPCContext
+from utils.locks import sheet_lock
+from utils.storage_backends import get_backend
+
+STORAGE_IO_WORKERS = int(os.getenv("STORAGE_IO_WORKERS", "4"))
+
+class SheetStore:
+    """
+    API assíncrona de armazenamento para fichas de players, NPCs e mestres.
+    Todo acesso bloqueante a disco roda num pool de threads dedicado, fora do
+    event loop. As funções síncronas de player_utils/NPCContext/mestre_utils
+    continuam disponíveis como shim para quem ainda não migrou.
+    """
+
+    def __init__(self, max_workers: int = STORAGE_IO_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="storage-io")
+        return self._executor
+
+    async def _run(self, op: str, fn, *args):
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            metrics.histogram(f"storage.{op}").observe(time.perf_counter() - start)
+
+    def _inline(self, op: str, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            metrics.histogram(f"storage.{op}").observe(time.perf_counter() - start)
+
+    async def get_player(self, character_name: str) -> dict:
+        if player_utils.is_player_sheet_cached(character_name):
+            return self._inline("get_player", player_utils.load_player_sheet, character_name)
+        return await self._run("get_player", player_utils.load_player_sheet, character_name)
+
+    async def put_player(self, character_name: str, data: dict):
+        # Escritas de ficha caem no cache write-back; o disco é tocado pela thread de flush.
+        async with sheet_lock(player_utils.get_player_sheet_path(character_name)):
+            self._inline("put_player", player_utils.save_player_sheet, character_name, data)
+
+    async def patch_player(self, character_name: str, ops: list[dict]):
+        async with sheet_lock(player_utils.get_player_sheet_path(character_name)):
+            if player_utils.is_player_sheet_cached(character_name):
+                self._inline("patch_player", player_utils.patch_player_sheet, character_name, ops)
+            else:
+                await self._run("patch_player", player_utils.patch_player_sheet, character_name, ops)
+
+    async def update_player(self, character_name: str, fn):
+        async with sheet_lock(player_utils.get_player_sheet_path(character_name)):
+            start = time.perf_counter()
+            data = await self.get_player(character_name)
+            result = fn(data)
+            if inspect.isawaitable(result):
+                result = await result
+            self._inline("put_player", player_utils.save_player_sheet, character_name, data)
+            metrics.histogram("storage.update_player").observe(time.perf_counter() - start)
+            return result
+
+    async def merge_player(self, character_name: str, base: dict, edited: dict) -> dict:
+        """sheet_cas.merge_save da cópia editada, sob o lock da ficha. Retorna a ficha gravada."""
+        args = (player_utils.player_sheet_id(character_name), base, edited,
+                lambda: player_utils.load_player_sheet(character_name),
+                lambda data: player_utils.save_player_sheet(character_name, data))
+        async with sheet_lock(player_utils.get_player_sheet_path(character_name)):
+            if player_utils.is_player_sheet_cached(character_name):
+                return self._inline("merge_player", sheet_cas.merge_save, *args)
+            return await self._run("merge_player", sheet_cas.merge_save, *args)
+
+    async def player_exists(self, character_name: str) -> bool:
+        if player_utils.is_player_sheet_cached(character_name):
+            return True
+        return await self._run("player_exists", player_utils.player_sheet_exists, character_name)
+
+    async def delete_player(self, character_name: str) -> bool:
+        return await self._run("delete_player", player_utils.delete_player_sheet, character_name)
+
+    async def get_npc(self, ctx: NPCContext) -> dict:
+        return await self._run("get_npc", ctx.load)
+
+    async def put_npc(self, ctx: NPCContext, data: dict):
+        async with sheet_lock(ctx.path):
+            await self._run("put_npc", ctx.save, data)
+
+    async def patch_npc(self, ctx: NPCContext, ops: list[dict]):
+        async with sheet_lock(ctx.path):
+            await self._run("patch_npc", ctx.patch, ops)
+
+    async def update_npc(self, ctx: NPCContext, fn):
+        async with sheet_lock(ctx.path):
+            start = time.perf_counter()
+            data = await self._run("get_npc", ctx.load)
+            result = fn(data)
+            if inspect.isawaitable(result):
+                result = await result
+            await self._run("put_npc", ctx.save, data)
+            metrics.histogram("storage.update_npc").observe(time.perf_counter() - start)
+            return result
+
+    async def merge_npc(self, ctx: NPCContext, base: dict, edited: dict) -> dict:
+        async with sheet_lock(ctx.path):
+            return await self._run("merge_npc", sheet_cas.merge_save, ctx.sheet_id, base, edited, ctx.load, ctx.save)
+
+    async def list_npcs(self, guild_id: int, mestre_id: int) -> list[str]:
+        return await self._run("list_npcs", NPCContext.list_npcs, guild_id, mestre_id)
+
+    async def list_visible_npcs(self, guild_id: int) -> list[str]:
+        return await self._run("list_visible_npcs", NPCContext.list_visible_npcs, guild_id)
+
+    async def list_npc_entries(self, guild_id: int, mestre_id: int | None = None, visible_only: bool = False) -> list[dict]:
+        return await self._run("list_npc_entries", NPCContext.list_entries, guild_id, mestre_id, visible_only)
+
+    async def search_npcs(self, guild_id: int, mestre_id: int | None, query: str, limit: int = npc_search.DEFAULT_LIMIT) -> list[str]:
+        # Com o índice quente a busca é em memória; só a primeira carga vai ao pool.
+        if npc_search.is_warm(guild_id, mestre_id):
+            return self._inline("search_npcs", npc_search.search, guild_id, mestre_id, query, limit)
+        return await self._run("search_npcs", npc_search.search, guild_id, mestre_id, query, limit)
+
+    async def find_visible_npc(self, guild_id: int, npc_name: str) -> NPCContext | None:
+        return await self._run("find_visible_npc", NPCContext.find_visible, guild_id, npc_name)
+
+    async def get_mestres(self, guild_id: int, guild_name: str | None = None) -> list:
+        return await self._run("get_mestres", mestre_utils.carregar_mestres, guild_id, guild_name)
+
+    async def is_mestre(self, guild_id: int, user_id: int, guild_name: str | None = None) -> bool:
+        # guild_name só é usado para migrar registros antigos, gravados pelo nome da guild.
+        if mestre_utils.registry.is_loaded(guild_id):
+            return mestre_utils.verificar_mestre(guild_id, user_id)
+        return await self._run("is_mestre", mestre_utils.verificar_mestre, guild_id, user_id, guild_name)
+
+    async def add_mestre(self, guild_id: int, mestre_id: int, mestre_nome: str, guild_name: str | None = None) -> bool:
+        if mestre_utils.registry.is_loaded(guild_id):
+            return self._inline("add_mestre", mestre_utils.adicionar_mestre, guild_id, mestre_id, mestre_nome)
+        return await self._run("add_mestre", mestre_utils.adicionar_mestre, guild_id, mestre_id, mestre_nome, guild_name)
+
+    async def get_guild_settings(self, guild_id: int) -> dict:
+        return await self._run("get_guild_settings", get_backend().load_guild_settings, guild_id)
+
+    async def update_guild_settings(self, guild_id: int, fn):
+        async with sheet_lock(f"guild-settings:{guild_id}"):
+            settings = await self._run("get_guild_settings", get_backend().load_guild_settings, guild_id)
+            result = fn(settings)
+            await self._run("put_guild_settings", get_backend().save_guild_settings, guild_id, settings)
+            return result
+
+    async def npc_exists(self, ctx: NPCContext) -> bool:
+        return await self._run("npc_exists", ctx.exists)
+
+    async def delete_npc(self, ctx: NPCContext) -> bool:
+        async with sheet_lock(ctx.path):
+            return await self._run("delete_npc", ctx.delete)
+
+    async def flush(self):
+        await self._run("flush", player_utils.flush_sheet_cache)
+
+    def shutdown(self):
+        player_utils.flush_sheet_cache()
+        mestre_utils.flush_mestres()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        get_backend().close()
+
+    def latency_report(self) -> dict:
+        return metrics.snapshot()
+
+store = SheetStore()
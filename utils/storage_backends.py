@@ -0,0 +1,341 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+import os
+import json
+import re
+import logging
+import threading
+from utils import metrics, sheet_patch
+from utils.file_utils import write_json_atomic
+from utils.npc_index import NPCIndex
+from utils.sheet_versions import VERSION_KEY
+
+DATA_DIR = os.getenv("DATA_DIR", "data")
+PLAYERS_DIR = os.path.join(DATA_DIR, "players")
+NPCS_DIR = os.path.join(DATA_DIR, "npcs")
+SERVERS_DIR = os.path.join(DATA_DIR, "servidores")
+SQLITE_PATH = os.getenv("SQLITE_PATH", os.path.join(DATA_DIR, "rpg.sqlite3"))
+# Entradas no journal de uma ficha antes de ela ser compactada no JSON base.
+JOURNAL_COMPACT_ENTRIES = int(os.getenv("JOURNAL_COMPACT_ENTRIES", "64"))
+
+# Campos que o NPCIndex lê do arquivo base; patches neles gravam a ficha inteira.
+_NPC_INDEX_FIELDS = ("nome", "visivel_para_players", "informacoes_basicas")
+
+log = logging.getLogger(__name__)
+
+def _sanitize(name: str) -> str:
+    return re.sub(r'[\\/*?:"<>|]', "_", name)
+
+class StorageBackend:
+    """
+    Interface comum de persistência para fichas de players, NPCs e o registro
+    de mestres. Os métodos são síncronos e bloqueantes; quem estiver no event
+    loop deve passar pelo utils.storage.store, que roda tudo no pool de I/O.
+    Chaves de player são o nome já sanitizado (ver player_utils.player_key).
+    """
+
+    name = "base"
+
+    def load_player(self, key: str) -> dict | None:
+        raise NotImplementedError
+
+    def save_player(self, key: str, data: dict):
+        raise NotImplementedError
+
+    def delete_player(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def player_exists(self, key: str) -> bool:
+        return self.load_player(key) is not None
+
+    def list_players(self) -> list[str]:
+        raise NotImplementedError
+
+    def patch_player(self, key: str, ops: list[dict], version: int):
+        """
+        Aplica ops (ver utils.sheet_patch) na ficha gravada. `version` é a versão
+        da ficha depois do patch. Sem suporte a journal, regrava a ficha inteira.
+        """
+        data = self.load_player(key) or {}
+        sheet_patch.apply(data, ops)
+        self.save_player(key, data)
+
+    def load_npc(self, guild_id: int, mestre_id: int, npc_name: str) -> dict | None:
+        raise NotImplementedError
+
+    def save_npc(self, guild_id: int, mestre_id: int, npc_name: str, data: dict):
+        raise NotImplementedError
+
+    def delete_npc(self, guild_id: int, mestre_id: int, npc_name: str) -> bool:
+        raise NotImplementedError
+
+    def npc_exists(self, guild_id: int, mestre_id: int, npc_name: str) -> bool:
+        return self.load_npc(guild_id, mestre_id, npc_name) is not None
+
+    def list_npcs(self, guild_id: int, mestre_id: int) -> list[str]:
+        raise NotImplementedError
+
+    def patch_npc(self, guild_id: int, mestre_id: int, npc_name: str, ops: list[dict], version: int):
+        data = self.load_npc(guild_id, mestre_id, npc_name) or {}
+        sheet_patch.apply(data, ops)
+        self.save_npc(guild_id, mestre_id, npc_name, data)
+
+    def list_visible_npcs(self, guild_id: int) -> list[str]:
+        raise NotImplementedError
+
+    def list_npc_entries(self, guild_id: int, mestre_id: int | None = None, visible_only: bool = False) -> list[dict]:
+        """
+        Metadados dos NPCs da guild (name, nome, owner_id, visivel, sistema,
+        mtime) sem carregar as fichas completas.
+        """
+        raise NotImplementedError
+
+    def load_mestres(self, guild_key: str) -> list:
+        raise NotImplementedError
+
+    def save_mestres(self, guild_key: str, mestres: list):
+        raise NotImplementedError
+
+    def load_guild_settings(self, guild_id: int) -> dict:
+        raise NotImplementedError
+
+    def save_guild_settings(self, guild_id: int, settings: dict):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class JsonFileBackend(StorageBackend):
+    """
+    Layout original: um arquivo JSON por entidade dentro de data/.
+    Patches de ficha vão para um journal append-only ao lado do JSON
+    (<nome>.journal, uma linha por patch) e são compactados no arquivo base a
+    cada JOURNAL_COMPACT_ENTRIES entradas ou na próxima gravação completa.
+    """
+
+    name = "json"
+
+    def __init__(self, players_dir: str = PLAYERS_DIR, npcs_dir: str = NPCS_DIR, servers_dir: str = SERVERS_DIR,
+                 compact_entries: int = JOURNAL_COMPACT_ENTRIES):
+        self.players_dir = players_dir
+        self.npcs_dir = npcs_dir
+        self.servers_dir = servers_dir
+        self.npc_index = NPCIndex(npcs_dir)
+        self.compact_entries = max(1, compact_entries)
+        # caminho do JSON base -> entradas no journal dele (contadas na primeira escrita).
+        self._journal_sizes: dict[str, int] = {}
+        self._journal_lock = threading.RLock()
+
+    @staticmethod
+    def _read(path: str):
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def journal_path(path: str) -> str:
+        return f"{os.path.splitext(path)[0]}.journal"
+
+    @staticmethod
+    def _read_journal(path: str) -> list[dict]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # Linha truncada por um crash no meio do append; o resto é descartado.
+                log.warning(f"[journal] entrada inválida em {path}, ignorando")
+                break
+        return entries
+
+    def _read_sheet(self, path: str) -> dict | None:
+        with self._journal_lock:
+            data = self._read(path)
+            entries = self._read_journal(self.journal_path(path))
+        if not entries:
+            return data
+        data = data if data is not None else {}
+        # Entradas com versão <= a do base já foram compactadas nele (crash entre
+        # gravar o base e apagar o journal).
+        base_version = int(data.get(VERSION_KEY, 0) or 0)
+        for entry in entries:
+            if entry.get("v", 0) > base_version:
+                sheet_patch.apply(data, entry["ops"])
+        return data
+
+    def _write_sheet(self, path: str, data: dict):
+        with self._journal_lock:
+            write_json_atomic(path, data)
+            self._drop_journal(path)
+
+    def _drop_journal(self, path: str):
+        self._journal_sizes.pop(path, None)
+        try:
+            os.remove(self.journal_path(path))
+        except FileNotFoundError:
+            pass
+
+    def _append_journal(self, path: str, ops: list[dict], version: int):
+        line = json.dumps({"v": version, "ops": ops}, ensure_ascii=False, separators=(",", ":")) + "\n"
+        journal = self.journal_path(path)
+        with self._journal_lock:
+            size = self._journal_sizes.get(path)
+            if size is None:
+                size = len(self._read_journal(journal))
+            os.makedirs(os.path.dirname(journal) or ".", exist_ok=True)
+            with open(journal, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            metrics.incr("storage.journal.appends")
+            metrics.incr("storage.journal.bytes", len(line.encode("utf-8")))
+            self._journal_sizes[path] = size + 1
+            if size + 1 >= self.compact_entries:
+                self.compact(path)
+
+    def compact(self, path: str):
+        """Funde o journal no JSON base e apaga o journal."""
+        with self._journal_lock:
+            if not os.path.exists(self.journal_path(path)):
+                return
+            data = self._read_sheet(path)
+            self._write_sheet(path, data if data is not None else {})
+            metrics.incr("storage.journal.compactions")
+
+    def player_path(self, key: str) -> str:
+        return os.path.join(self.players_dir, f"{key}.json")
+
+    def load_player(self, key: str) -> dict | None:
+        return self._read_sheet(self.player_path(key))
+
+    def save_player(self, key: str, data: dict):
+        self._write_sheet(self.player_path(key), data)
+
+    def patch_player(self, key: str, ops: list[dict], version: int):
+        path = self.player_path(key)
+        if not os.path.exists(path):
+            return super().patch_player(key, ops, version)
+        self._append_journal(path, ops, version)
+
+    def delete_player(self, key: str) -> bool:
+        path = self.player_path(key)
+        with self._journal_lock:
+            self._drop_journal(path)
+        if os.path.exists(path):
+            os.remove(path)
+            return True
+        return False
+
+    def player_exists(self, key: str) -> bool:
+        return os.path.exists(self.player_path(key))
+
+    def list_players(self) -> list[str]:
+        if not os.path.isdir(self.players_dir):
+            return []
+        return [f[:-5] for f in os.listdir(self.players_dir) if f.endswith(".json")]
+
+    def npc_folder(self, guild_id: int, mestre_id: int) -> str:
+        return os.path.join(self.npcs_dir, str(guild_id), str(mestre_id))
+
+    def npc_path(self, guild_id: int, mestre_id: int, npc_name: str) -> str:
+        return os.path.join(self.npc_folder(guild_id, mestre_id), f"{npc_name}.json")
+
+    def load_npc(self, guild_id: int, mestre_id: int, npc_name: str) -> dict | None:
+        return self._read_sheet(self.npc_path(guild_id, mestre_id, npc_name))
+
+    def save_npc(self, guild_id: int, mestre_id: int, npc_name: str, data: dict):
+        path = self.npc_path(guild_id, mestre_id, npc_name)
+        self._write_sheet(path, data)
+        self.npc_index.upsert(guild_id, mestre_id, npc_name, data, path)
+
+    def patch_npc(self, guild_id: int, mestre_id: int, npc_name: str, ops: list[dict], version: int):
+        path = self.npc_path(guild_id, mestre_id, npc_name)
+        if sheet_patch.touches(ops, _NPC_INDEX_FIELDS) or not os.path.exists(path):
+            # O índice lê só o JSON base; esses campos não podem ficar no journal.
+            return super().patch_npc(guild_id, mestre_id, npc_name, ops, version)
+        self._append_journal(path, ops, version)
+
+    def delete_npc(self, guild_id: int, mestre_id: int, npc_name: str) -> bool:
+        path = self.npc_path(guild_id, mestre_id, npc_name)
+        with self._journal_lock:
+            self._drop_journal(path)
+        if os.path.exists(path):
+            os.remove(path)
+            self.npc_index.remove(guild_id, mestre_id, npc_name, os.path.dirname(path))
+            return True
+        return False
+
+    def npc_exists(self, guild_id: int, mestre_id: int, npc_name: str) -> bool:
+        return os.path.exists(self.npc_path(guild_id, mestre_id, npc_name))
+
+    def list_npcs(self, guild_id: int, mestre_id: int) -> list[str]:
+        return [e["name"] for e in self.npc_index.entries(guild_id, mestre_id)]
+
+    def list_visible_npcs(self, guild_id: int) -> list[str]:
+        return [e["nome"] for e in self.npc_index.entries(guild_id, visible_only=True)]
+
+    def list_npc_entries(self, guild_id: int, mestre_id: int | None = None, visible_only: bool = False) -> list[dict]:
+        return self.npc_index.entries(guild_id, mestre_id, visible_only)
+
+    def mestres_path(self, guild_key: str) -> str:
+        return os.path.join(self.servers_dir, str(guild_key), "mestres.json")
+
+    def load_mestres(self, guild_key: str) -> list:
+        return self._read(self.mestres_path(guild_key)) or []
+
+    def save_mestres(self, guild_key: str, mestres: list):
+        write_json_atomic(self.mestres_path(guild_key), mestres)
+
+    def guild_settings_path(self, guild_id: int) -> str:
+        return os.path.join(self.servers_dir, str(guild_id), "config.json")
+
+    def load_guild_settings(self, guild_id: int) -> dict:
+        return self._read(self.guild_settings_path(guild_id)) or {}
+
+    def save_guild_settings(self, guild_id: int, settings: dict):
+        write_json_atomic(self.guild_settings_path(guild_id), settings)
+
+_backend: StorageBackend | None = None
+
+def create_backend(kind: str | None = None) -> StorageBackend:
+    kind = (kind or os.getenv("STORAGE_BACKEND", "json")).strip().lower()
+    if kind == "sqlite":
+        from utils.sqlite_backend import SqliteBackend
+        return SqliteBackend(SQLITE_PATH)
+    if kind == "json":
+        return JsonFileBackend()
+    raise ValueError(f"STORAGE_BACKEND desconhecido: {kind!r} (use 'json' ou 'sqlite')")
+
+def get_backend() -> StorageBackend:
+    global _backend
+    if _backend is None:
+        _backend = create_backend()
+    return _backend
+
+def set_backend(backend: StorageBackend):
+    global _backend
+    if _backend is not None and _backend is not backend:
+        _backend.close()
+    _backend = backend
@@ -0,0 +1,248 @@
+# Copyright (C) 2025 Matheus Pereira
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# TRADEMARK NOTICE: The name "Roll & Play Bot" and its logo are distinct
+# from the software and are NOT covered by the AGPL. They remain the
+# exclusive property of the author.
+
+
+import random
+from utils import dice_stream
+from utils.i18n import translate as _tr
+
+# Teto de dados por parada; acima disso a parada é cortada, nunca rolada inteira.
+MAX_SYSTEM_POOL = 30
+_D10 = range(1, 11)
+_D20 = range(1, 21)
+
+def _mark(value: int, sides: int) -> str:
+    return f"**{value}**" if value == 1 or value == sides else str(value)
+
+class SystemRoll:
+    """
+    Resultado estruturado de uma rolagem de sistema: dados rolados (com
+    máscara de mantidos), total exibido, sucessos e nível de sucesso quando o
+    sistema tem, críticos e marcações extras (ex.: crítico confuso). `ticket`
+    e `spec` vêm do fluxo do servidor quando a rolagem sai de roll_check.
+    """
+    __slots__ = ("system", "dice", "kept", "total", "successes", "level", "is_crit", "is_fumble", "flags", "breakdown",
+                 "ticket", "spec")
+
+    def __init__(self, system: str, dice: list[int], kept: list[bool], total: int, breakdown: str,
+                 successes: int | None = None, level: str | None = None, is_crit: bool = False,
+                 is_fumble: bool = False, flags: tuple = ()):
+        self.system = system
+        self.dice = dice
+        self.kept = kept
+        self.total = total
+        self.successes = successes
+        self.level = level
+        self.is_crit = is_crit
+        self.is_fumble = is_fumble
+        self.flags = flags
+        self.breakdown = breakdown
+        self.ticket = None
+        self.spec = None
+
+class VampiroEngine:
+    """
+    V5: parada de d10, 6+ é sucesso e cada par de 10 vale 4. Dados de Fome
+    entram na parada; 10 de Fome num crítico é crítico confuso e 1 de Fome
+    numa falha é falha bestial.
+    """
+    name = "vampiro"
+
+    def roll(self, pool: int, hunger: int = 0, difficulty: int = 0, rng=random, locale: str | None = None) -> SystemRoll:
+        pool = max(1, min(pool, MAX_SYSTEM_POOL))
+        hunger = max(0, min(hunger, 5, pool))
+        normal = rng.choices(_D10, k=pool - hunger)
+        hunger_dice = rng.choices(_D10, k=hunger)
+        dice = normal + hunger_dice
+        tens = dice.count(10)
+        successes = sum(1 for v in dice if v >= 6) + (tens // 2) * 2
+        is_crit = tens >= 2
+        failed = successes < max(1, difficulty)
+        flags = []
+        if is_crit and 10 in hunger_dice:
+            flags.append("critico_confuso")
+        if failed and 1 in hunger_dice:
+            flags.append("falha_bestial")
+        parts = ", ".join(_mark(v, 10) for v in normal)
+        label = _tr("roll.system.pool", locale, "Parada ({count})", count=pool - hunger)
+        breakdown = f"{label}: {parts or '—'}"
+        if hunger:
+            label = _tr("roll.system.hunger", locale, "Fome ({count})", count=hunger)
+            breakdown += f" | {label}: {', '.join(_mark(v, 10) for v in hunger_dice)}"
+        breakdown += " → " + _tr("roll.system.successes", locale, "**{count} sucesso(s)**", count=successes)
+        if difficulty:
+            breakdown += " " + _tr("roll.system.difficulty", locale, "vs Dificuldade {value}", value=difficulty)
+        if "critico_confuso" in flags:
+            breakdown += "\n" + _tr("roll.system.messy_critical", locale, "🩸 Crítico Confuso")
+        elif is_crit:
+            breakdown += "\n" + _tr("roll.system.critical", locale, "✨ Crítico")
+        if "falha_bestial" in flags:
+            breakdown += "\n" + _tr("roll.system.bestial_failure", locale, "🐺 Falha Bestial")
+        return SystemRoll(self.name, dice, [True] * len(dice), successes, breakdown, successes=successes,
+                          is_crit=is_crit, is_fumble="falha_bestial" in flags, flags=tuple(flags))
+
+class CthulhuEngine:
+    """
+    d100 percentil contra o valor da perícia. Dados de bônus/penalidade
+    rolam dezenas extras e ficam com a menor/maior. 01 é crítico; 100 (ou
+    96+ com perícia abaixo de 50) é desastre.
+    """
+    name = "cthulhu"
+
+    LEVELS = ("critico", "extremo", "bom", "regular", "falha", "desastre")
+    LABELS = {"critico": "Sucesso Crítico", "extremo": "Sucesso Extremo", "bom": "Sucesso Bom",
+              "regular": "Sucesso Regular", "falha": "Falha", "desastre": "Desastre"}
+
+    def roll(self, skill: int, bonus_dice: int = 0, penalty_dice: int = 0, rng=random,
+             locale: str | None = None) -> SystemRoll:
+        net = max(-2, min(2, bonus_dice - penalty_dice))
+        units = rng.randrange(10)
+        tens = [rng.randrange(10) for _ in range(1 + abs(net))]
+        values = [(t * 10 + units) or 100 for t in tens]
+        if net > 0:
+            chosen = min(values)
+        elif net < 0:
+            chosen = max(values)
+        else:
+            chosen = values[0]
+        kept = [False] * len(values)
+        kept[values.index(chosen)] = True
+        if chosen == 1:
+            level = "critico"
+        elif chosen == 100 or (skill < 50 and chosen >= 96):
+            level = "desastre"
+        elif chosen <= skill // 5:
+            level = "extremo"
+        elif chosen <= skill // 2:
+            level = "bom"
+        elif chosen <= skill:
+            level = "regular"
+        else:
+            level = "falha"
+        breakdown = f"d100: {chosen}"
+        if net:
+            if net > 0:
+                extra = _tr("roll.system.bonus_dice", locale, "{count} dado(s) de bônus", count=net)
+            else:
+                extra = _tr("roll.system.penalty_dice", locale, "{count} dado(s) de penalidade", count=-net)
+            rolled = ", ".join(str(v) if k else f"~~{v}~~" for v, k in zip(values, kept))
+            breakdown += f" ({rolled}; {extra})"
+        label = _tr(f"roll.system.cthulhu.{level}", locale, self.LABELS[level])
+        breakdown += f" vs {skill} → **{label}**"
+        return SystemRoll(self.name, values, kept, chosen, breakdown, level=level,
+                          is_crit=level == "critico", is_fumble=level == "desastre")
+
+class OrdemEngine:
+    """
+    Ordem Paranormal: rola um d20 por ponto do atributo e fica com o maior;
+    atributo 0 (ou menos) rola 2d20 e fica com o menor. Vantagem/desvantagem
+    somam/tiram um dado.
+    """
+    name = "ordem_paranormal"
+
+    def roll(self, attribute: int, bonus: int = 0, crit_range: int = 20, rng=random,
+             locale: str | None = None) -> SystemRoll:
+        if attribute <= 0:
+            dice = rng.choices(_D20, k=2 - attribute if attribute < 0 else 2)[:MAX_SYSTEM_POOL]
+            natural = min(dice)
+        else:
+            dice = rng.choices(_D20, k=min(attribute, MAX_SYSTEM_POOL))
+            natural = max(dice)
+        kept = [False] * len(dice)
+        kept[dice.index(natural)] = True
+        total = natural + bonus
+        rolled = ", ".join(_mark(v, 20) if k else f"~~{_mark(v, 20)}~~" for v, k in zip(dice, kept))
+        breakdown = f"{len(dice)}d20 ({rolled}) = {natural}"
+        if bonus:
+            breakdown += " + " + _tr("roll.system.bonus", locale, "Bônus ({value})", value=bonus)
+        breakdown += f" = **{total}**"
+        return SystemRoll(self.name, dice, kept, total, breakdown, is_crit=natural >= crit_range)
+
+SYSTEM_ENGINES = {
+    "vampiro": VampiroEngine(),
+    "cthulhu": CthulhuEngine(),
+    "ordem_paranormal": OrdemEngine(),
+}
+
+def get_engine(system_name: str):
+    """Motor nativo do sistema, ou None para os sistemas que rolam d20 + modificador."""
+    system_key = system_name.lower().strip().replace(" ", "_") if system_name else "dnd"
+    return SYSTEM_ENGINES.get(system_key)
+
+def _as_int(value, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+def hunger_of(ficha: dict) -> int:
+    """Fome atual (0-5) da ficha de Vampiro, gravada pelo modal de Fome em recursos.fome."""
+    return max(0, min(5, _as_int((ficha.get("recursos") or {}).get("fome"))))
+
+def spec_of(engine, args: tuple) -> str:
+    """Expressão registrada no fluxo de dados (ex.: ``vampiro:7:2``); basta para refazer a rolagem."""
+    return ":".join([engine.name, *(str(a) for a in args)])
+
+def parse_spec(expr: str):
+    """(motor, argumentos) de uma expressão de spec_of, ou None se for uma expressão de dados comum."""
+    name, sep, rest = (expr or "").strip().partition(":")
+    engine = SYSTEM_ENGINES.get(name)
+    if engine is None or not sep:
+        return None
+    try:
+        return engine, tuple(int(a) for a in rest.split(":"))
+    except ValueError:
+        return None
+
+def replay(expr: str, draw: dice_stream.Draw, locale: str | None = None) -> SystemRoll | None:
+    parsed = parse_spec(expr)
+    if parsed is None:
+        return None
+    engine, args = parsed
+    result = engine.roll(*args, rng=draw, locale=locale)
+    result.ticket, result.spec = draw.ticket, expr.strip()
+    return result
+
+def _check_args(engine, ficha: dict, attribute_score: int, skill_bonus: int, advantage_state: str, temp: int) -> tuple:
+    if engine.name == "vampiro":
+        return attribute_score + skill_bonus + temp, hunger_of(ficha)
+    if engine.name == "cthulhu":
+        target = (skill_bonus if skill_bonus > 0 else attribute_score) + temp
+        return target, int(advantage_state == "vantagem"), int(advantage_state == "desvantagem")
+    extra = 1 if advantage_state == "vantagem" else -1 if advantage_state == "desvantagem" else 0
+    return attribute_score + extra, skill_bonus + temp
+
+async def roll_check(engine, ficha: dict, attribute_score: int, skill_bonus: int, advantage_state: str,
+                     temp_modifier_str: str = "", locale: str | None = None, user_id: int | None = None,
+                     channel_id: int | None = None, guild_id: int | None = None) -> SystemRoll:
+    """
+    Teste de atributo/perícia com o motor do sistema. O modificador
+    temporário (pode ter dados) é rolado à parte e entra como dados na parada
+    (Vampiro), no valor alvo (Cthulhu) ou no bônus (Ordem). O texto do
+    resultado sai no idioma `locale`. Os ids entram nos limites por
+    usuário/canal do pool de dados (DiceRejected sobe para a view). Os dados
+    saem do fluxo do servidor (o Draw serve de `rng`), com ticket reproduzível.
+    """
+    temp = 0
+    if temp_modifier_str and temp_modifier_str.strip():
+        from utils.dice_roller import roll_dice
+        temp = (await roll_dice(temp_modifier_str, user_id=user_id, channel_id=channel_id, guild_id=guild_id)).total
+    args = _check_args(engine, ficha, attribute_score, _as_int(skill_bonus), advantage_state, temp)
+    spec = spec_of(engine, args)
+    draw = (await dice_stream.stream_for(guild_id)).draw(spec)
+    return replay(spec, draw, locale)
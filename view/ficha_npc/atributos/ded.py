@@ -20,27 +20,10 @@ import discord
 from utils.npc_utils import NPCContext
 from models.npc_modals.atributos_modais.ded_atributos.atributos_fisicos import NPCDnDAtributosFisicosModal
 from models.npc_modals.atributos_modais.ded_atributos.atributos_mentais import NPCDnDAtributosMentaisModal
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback seguro.
-    Sua i18n.t retorna a PRÓPRIA chave quando não encontra; se acontecer, usamos o fallback.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
-
 class NPCDnDAtributosView(discord.ui.View):
     def __init__(self, npc_context: NPCContext):
         super().__init__(timeout=None)
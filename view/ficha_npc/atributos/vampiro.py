@@ -21,6 +21,8 @@ from utils.npc_utils import NPCContext
 from models.npc_modals.atributos_modais.vampiro.atributos_fisicos import NPCVampiroFisicosModal
 from models.npc_modals.atributos_modais.vampiro.atributos_mentais import NPCVampiroMentaisModal
 from models.npc_modals.atributos_modais.vampiro.atributos_sociais import NPCVampiroSociaisModal
+from models.npc_modals.atributos_modais.vampiro.fome import NPCVampiroFomeModal
+from utils.locale_resolver import resolve_locale
 
 class NPCVampiroAtributosView(discord.ui.View):
   def __init__(self, npc_context: NPCContext):
@@ -39,6 +41,10 @@ class NPCVampiroAtributosView(discord.ui.View):
   async def mentais(self, interaction: discord.Interaction, button: discord.ui.Button):
     await interaction.response.send_modal(NPCVampiroMentaisModal(self.npc_context))
 
+  @discord.ui.button(label="🩸 Fome", style=discord.ButtonStyle.danger)
+  async def fome(self, interaction: discord.Interaction, button: discord.ui.Button):
+    await interaction.response.send_modal(NPCVampiroFomeModal(self.npc_context, locale=resolve_locale(interaction)))
+
   @discord.ui.button(label="🔙 Voltar", style=discord.ButtonStyle.danger)
   async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
     from view.ficha_npc.npc_attributes import NPCAtributosMenuView
@@ -46,4 +52,4 @@ class NPCVampiroAtributosView(discord.ui.View):
     await interaction.response.edit_message(
       content=f"💪 Escolha um sistema para editar os atributos de **{self.npc_context.npc_name}**:",
       view=view
-    )
\ No newline at end of file
+    )
\ No newline at end of file
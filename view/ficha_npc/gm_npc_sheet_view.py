@@ -18,22 +18,13 @@
 
 import discord
 from utils.npc_utils import NPCContext
+from utils import i18n, sheet_patch, sheet_versions
+from utils.storage import store
+from utils.embed_cache import embed_cache
 from utils.embed_utils import create_npc_summary_embed
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 class GMNPCSheetView(discord.ui.View):
   def __init__(self, npc_context: NPCContext):
     super().__init__(timeout=300)
@@ -75,41 +66,21 @@ class GMNPCSheetView(discord.ui.View):
   async def create_embed(self, interaction: discord.Interaction) -> discord.Embed:
     loc = resolve_locale(interaction, fallback="pt")
 
-    npc_data = self.npc_context.load()
-
-    title = _tr("npc.sheet.title", loc, "Ficha Completa de {name}", name=self.npc_context.npc_name)
-    embed = discord.Embed(title=title, color=discord.Color.dark_purple())
-
-    aparencia_valor = npc_data.get("extras", {}).get("aparencia") or npc_data.get("informacoes_extras", {}).get("aparencia")
-    if aparencia_valor and (aparencia_valor.startswith("http://") or aparencia_valor.startswith("https://")):
-      embed.set_image(url=aparencia_valor)
-
-    lbl_raca        = _tr("npc.sheet.fields.race",          loc, "Raça/Espécie")
-    lbl_classe      = _tr("npc.sheet.fields.class",         loc, "Classe/Profissão")
-    lbl_nivel       = _tr("npc.sheet.fields.level",         loc, "Nível/Rank")
-    lbl_visibility  = _tr("npc.sheet.fields.visibility",    loc, "Visibilidade")
-    lbl_relac       = _tr("npc.sheet.fields.relationship",  loc, "Relacionamento")
-    lbl_aparencia   = _tr("npc.sheet.fields.appearance",    loc, "Aparência")
-    lbl_attrs_desc  = _tr("npc.sheet.sections.attributes",  loc, "Atributos base do NPC.")
-    lbl_combate_desc= _tr("npc.sheet.sections.combat",      loc, "Visão geral de combate.")
-    lbl_hp          = _tr("npc.sheet.fields.hp",            loc, "❤️ Vida (PV)")
-    lbl_mp          = _tr("npc.sheet.fields.mp",            loc, "💙 Mana (PM)")
-    lbl_ca          = _tr("npc.sheet.fields.ac",            loc, "🛡️ Defesa/CA")
-    lbl_ataques     = _tr("npc.sheet.fields.attacks",       loc, "⚔️ Ataques")
-    lbl_magias      = _tr("npc.sheet.fields.spells",        loc, "🔮 Magias")
-    lbl_person      = _tr("npc.sheet.fields.personality",   loc, "Personalidade:")
-    lbl_tracos      = _tr("npc.sheet.fields.traits",        loc, "Traços")
-    lbl_inimigos    = _tr("npc.sheet.fields.enemies",       loc, "Inimigos")
-    lbl_segredos    = _tr("npc.sheet.fields.secrets",       loc, "Segredos")
-    lbl_pets_desc   = _tr("npc.sheet.sections.pets",        loc, "Pets e Companheiros do NPC.")
-    lbl_pets_none   = _tr("npc.sheet.none.pets",            loc, "Nenhum pet registrado.")
-    lbl_none        = _tr("npc.sheet.none.generic",         loc, "Nenhum")
-    lbl_none_f      = _tr("npc.sheet.none.generic_f",       loc, "Nenhuma")
-    lbl_master      = _tr("npc.sheet.footer.master",        loc, "Mestre")
-    lbl_viewing     = _tr("npc.sheet.footer.viewing",       loc, "Visualizando")
-    visivel_label   = _tr("npc.sheet.visibility.visible",   loc, "👁️ Visível")
-    oculto_label    = _tr("npc.sheet.visibility.hidden",    loc, "🔒 Oculto")
-
+    # Troca de aba numa ficha que não mudou não vai ao disco nem monta campos.
+    npc_data = None
+    if not sheet_versions.current(self.npc_context.sheet_id):
+      # Sem versão em memória a chave sairia com 0 e nunca mais seria achada; lê o NPC antes.
+      npc_data = await store.get_npc(self.npc_context)
+    key = embed_cache.key(self.npc_context.sheet_id, self.current_section, loc, "gm")
+    embed = embed_cache.get(key)
+    if embed is None:
+      if npc_data is None:
+        npc_data = await store.get_npc(self.npc_context)
+      embed = self._build_embed(npc_data, loc)
+      embed_cache.put(key, embed)
+
+    # O rodapé leva o nome de quem está vendo; fica fora do cache.
+    tr = i18n.bind(loc)
     section_display = {
       "geral":     self._lbl_geral,
       "atributos": self._lbl_atributos,
@@ -117,72 +88,89 @@ class GMNPCSheetView(discord.ui.View):
       "roleplay":  self._lbl_roleplay,
       "pets":      self._lbl_pets,
     }
+    sec_disp = section_display.get(self.current_section, self.current_section.capitalize())
+    lbl_master = tr("npc.sheet.footer.master", "Mestre")
+    lbl_viewing = tr("npc.sheet.footer.viewing", "Visualizando")
+    embed.set_footer(text=f"{lbl_master}: {interaction.user.display_name} | {lbl_viewing}: {sec_disp}")
+    return embed
+
+  def _build_embed(self, npc_data: dict, loc: str) -> discord.Embed:
+    tr = i18n.bind(loc)
+    title = tr("npc.sheet.title", "Ficha Completa de {name}", name=self.npc_context.npc_name)
+    embed = discord.Embed(title=title, color=discord.Color.dark_purple())
+
+    aparencia_valor = npc_data.get("extras", {}).get("aparencia") or npc_data.get("informacoes_extras", {}).get("aparencia")
+    if aparencia_valor and (aparencia_valor.startswith("http://") or aparencia_valor.startswith("https://")):
+      embed.set_image(url=aparencia_valor)
+
+    lbl_none = tr("npc.sheet.none.generic",   "Nenhum")
 
     if self.current_section == "geral":
       info_basicas = npc_data.get("informacoes_basicas", {})
       info_gerais  = npc_data.get("informacoes_gerais", {})
 
-      embed.description = f"**{info_basicas.get('titulo_apelido', _tr('npc.sheet.default.creature', loc, 'Criatura Misteriosa'))}**"
-      embed.add_field(name=lbl_raca,   value=info_basicas.get('raca_especie', 'N/A'), inline=True)
-      embed.add_field(name=lbl_classe, value=info_basicas.get('classe_profissao', 'N/A'), inline=True)
-      embed.add_field(name=lbl_nivel,  value=info_gerais.get('nivel_rank', 'N/A'), inline=True)
+      embed.description = f"**{info_basicas.get('titulo_apelido', tr('npc.sheet.default.creature', 'Criatura Misteriosa'))}**"
+      embed.add_field(name=tr("npc.sheet.fields.race", "Raça/Espécie"), value=info_basicas.get('raca_especie', 'N/A'), inline=True)
+      embed.add_field(name=tr("npc.sheet.fields.class", "Classe/Profissão"), value=info_basicas.get('classe_profissao', 'N/A'), inline=True)
+      embed.add_field(name=tr("npc.sheet.fields.level", "Nível/Rank"), value=info_gerais.get('nivel_rank', 'N/A'), inline=True)
 
-      vis_txt = visivel_label if npc_data.get("visivel_para_players") else oculto_label
-      embed.add_field(name=lbl_visibility, value=vis_txt, inline=True)
+      if npc_data.get("visivel_para_players"):
+        vis_txt = tr("npc.sheet.visibility.visible", "👁️ Visível")
+      else:
+        vis_txt = tr("npc.sheet.visibility.hidden", "🔒 Oculto")
+      embed.add_field(name=tr("npc.sheet.fields.visibility", "Visibilidade"), value=vis_txt, inline=True)
 
-      embed.add_field(name=lbl_relac, value=npc_data.get("relacionamento", "Neutro"), inline=True)
+      embed.add_field(name=tr("npc.sheet.fields.relationship", "Relacionamento"), value=npc_data.get("relacionamento", "Neutro"), inline=True)
 
       if aparencia_valor and not (aparencia_valor.startswith("http://") or aparencia_valor.startswith("https://")):
-        embed.add_field(name=lbl_aparencia, value=aparencia_valor, inline=False)
+        embed.add_field(name=tr("npc.sheet.fields.appearance", "Aparência"), value=aparencia_valor, inline=False)
 
     elif self.current_section == "atributos":
       attrs = npc_data.get("atributos", {})
-      embed.description = lbl_attrs_desc
+      embed.description = tr("npc.sheet.sections.attributes", "Atributos base do NPC.")
       for name, value in attrs.items():
         embed.add_field(name=str(name).capitalize(), value=f"`{value}`", inline=True)
 
     elif self.current_section == "combate":
       combate = npc_data.get("informacoes_combate", {})
-      embed.description = lbl_combate_desc
-      embed.add_field(name=lbl_hp, value=f"`{combate.get('vida_atual', 'N/A')} / {combate.get('vida_maxima', 'N/A')}`", inline=True)
-      embed.add_field(name=lbl_mp, value=f"`{combate.get('magia_atual', 'N/A')} / {combate.get('magia_maxima', 'N/A')}`", inline=True)
-      embed.add_field(name=lbl_ca, value=f"`{combate.get('defesa', 'N/A')}`", inline=True)
+      embed.description = tr("npc.sheet.sections.combat", "Visão geral de combate.")
+      embed.add_field(name=tr("npc.sheet.fields.hp", "❤️ Vida (PV)"), value=f"`{combate.get('vida_atual', 'N/A')} / {combate.get('vida_maxima', 'N/A')}`", inline=True)
+      embed.add_field(name=tr("npc.sheet.fields.mp", "💙 Mana (PM)"), value=f"`{combate.get('magia_atual', 'N/A')} / {combate.get('magia_maxima', 'N/A')}`", inline=True)
+      embed.add_field(name=tr("npc.sheet.fields.ac", "🛡️ Defesa/CA"), value=f"`{combate.get('defesa', 'N/A')}`", inline=True)
 
       ataques = npc_data.get("ataques", [])
       ataques_text = "\n".join(f"• **{a.get('nome')}** (`{a.get('dano')}`)" for a in ataques) or lbl_none
-      embed.add_field(name=lbl_ataques, value=ataques_text, inline=False)
+      embed.add_field(name=tr("npc.sheet.fields.attacks", "⚔️ Ataques"), value=ataques_text, inline=False)
 
       magias = npc_data.get("magias", [])
-      magias_text = "\n".join(f"• **{m.get('nome')}** (`{m.get('custo')}`)" for m in magias) or lbl_none_f
-      embed.add_field(name=lbl_magias, value=magias_text, inline=False)
+      magias_text = "\n".join(f"• **{m.get('nome')}** (`{m.get('custo')}`)" for m in magias) or tr("npc.sheet.none.generic_f", "Nenhuma")
+      embed.add_field(name=tr("npc.sheet.fields.spells", "🔮 Magias"), value=magias_text, inline=False)
 
     elif self.current_section == "roleplay":
       personalidade = npc_data.get("personalidade", {})
       aliancas      = npc_data.get("aliancas", {})
-      embed.description = f"**{lbl_person}** {personalidade.get('resumo', 'N/A')}"
-      embed.add_field(name=lbl_tracos,   value=personalidade.get('tracos_marcantes', 'N/A'), inline=False)
-      embed.add_field(name=lbl_inimigos, value=aliancas.get('inimigos', lbl_none), inline=False)
+      embed.description = f"**{tr('npc.sheet.fields.personality', 'Personalidade:')}** {personalidade.get('resumo', 'N/A')}"
+      embed.add_field(name=tr("npc.sheet.fields.traits", "Traços"), value=personalidade.get('tracos_marcantes', 'N/A'), inline=False)
+      embed.add_field(name=tr("npc.sheet.fields.enemies", "Inimigos"), value=aliancas.get('inimigos', lbl_none), inline=False)
 
       segredos_list = npc_data.get('roleplay', {}).get('segredos', [])
       segredos_text = "\n".join(f"• {s.get('segredo')}" for s in segredos_list) or lbl_none
-      embed.add_field(name=lbl_segredos, value=segredos_text, inline=False)
+      embed.add_field(name=tr("npc.sheet.fields.secrets", "Segredos"), value=segredos_text, inline=False)
 
     elif self.current_section == "pets":
       pets = npc_data.get("pets", [])
-      embed.description = lbl_pets_desc
+      embed.description = tr("npc.sheet.sections.pets", "Pets e Companheiros do NPC.")
       if not pets:
-        embed.description += f"\n\n{lbl_pets_none}"
+        embed.description += f"\n\n{tr('npc.sheet.none.pets', 'Nenhum pet registrado.')}"
       else:
         for pet in pets:
-          pet_title = f"🐾 {pet.get('nome', _tr('npc.sheet.default.pet_name', loc, 'Pet sem nome'))}"
+          pet_title = f"🐾 {pet.get('nome', tr('npc.sheet.default.pet_name', 'Pet sem nome'))}"
           pet_info = (
-            f"**{_tr('npc.sheet.pet.species', loc, 'Espécie')}:** {pet.get('especie', 'N/A')}\n"
-            f"**{_tr('npc.sheet.pet.skills',  loc, 'Habilidades')}:** {pet.get('habilidades', 'N/A')}"
+            f"**{tr('npc.sheet.pet.species', 'Espécie')}:** {pet.get('especie', 'N/A')}\n"
+            f"**{tr('npc.sheet.pet.skills', 'Habilidades')}:** {pet.get('habilidades', 'N/A')}"
           )
           embed.add_field(name=pet_title, value=pet_info, inline=False)
 
-    sec_disp = section_display.get(self.current_section, self.current_section.capitalize())
-    embed.set_footer(text=f"{lbl_master}: {interaction.user.display_name} | {lbl_viewing}: {sec_disp}")
     return embed
 
   async def update_message(self, interaction: discord.Interaction):
@@ -218,9 +206,11 @@ class GMNPCSheetView(discord.ui.View):
   async def reveal_npc(self, interaction: discord.Interaction, button: discord.ui.Button):
     await interaction.response.defer()
 
-    npc_data = self.npc_context.load()
-    npc_data["visivel_para_players"] = True
-    self.npc_context.save(npc_data)
+    def _reveal(npc_data: dict) -> dict:
+      npc_data["visivel_para_players"] = True
+      return npc_data
+
+    npc_data = await store.update_npc(self.npc_context, _reveal)
 
     embed = create_npc_summary_embed(npc_data)
     await interaction.channel.send(embed=embed)
@@ -233,9 +223,7 @@ class GMNPCSheetView(discord.ui.View):
   async def hide_npc(self, interaction: discord.Interaction, button: discord.ui.Button):
     await interaction.response.defer()
 
-    npc_data = self.npc_context.load()
-    npc_data["visivel_para_players"] = False
-    self.npc_context.save(npc_data)
+    await store.patch_npc(self.npc_context, [sheet_patch.set_path("visivel_para_players", False)])
 
     self.current_section = "geral"
     new_embed = await self.create_embed(interaction)
@@ -21,25 +21,9 @@ from utils.npc_utils import NPCContext
 from models.npc_modals.info_basicas.info_basicas import NPCBasicInfoModal
 from models.npc_modals.info_basicas.info_gerais import NPCGeneralInfoModal
 from models.npc_modals.info_basicas.info_extras import NPCExtraInfoModal
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback.
-    Se a chave não existir (retorna a própria key), usa o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
 
 def _loc_from_interaction(interaction: discord.Interaction, base_locale: str = "pt") -> str:
     try:
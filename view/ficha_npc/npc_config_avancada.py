@@ -17,7 +17,9 @@
 # exclusive property of the author.
 
 import discord
+from utils import sheet_patch
 from utils.npc_utils import NPCContext
+from utils.storage import store
 from models.npc_modals.config_avancada.notas import NPCNotesModal
 from models.npc_modals.config_avancada.aliados import NPCAddAllyModal
 from models.npc_modals.config_avancada.inimigos import NPCAddEnemyModal
@@ -25,22 +27,9 @@ from models.npc_modals.config_avancada.medos import NPCAddFearModal
 from models.npc_modals.config_avancada.segredos import NPCAddSecretModal
 from models.npc_modals.config_avancada.extras import NPCExtrasModal
 from models.npc_modals.config_avancada.dashboard import NPCRoleplayDashboardView
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """Wrapper para usar i18n.t com fallback."""
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
 
 def resolve_loc_safe(
     interaction: discord.Interaction,
@@ -265,9 +254,7 @@ class RelacionamentoSelect(discord.ui.Select):
         super().__init__(placeholder=placeholder, options=options, custom_id="npc:adv:rel:select")
 
     async def callback(self, interaction: discord.Interaction):
-        npc_data = self.npc_context.load()
-        npc_data["relacionamento"] = self.values[0]
-        self.npc_context.save(npc_data)
+        await store.patch_npc(self.npc_context, [sheet_patch.set_path("relacionamento", self.values[0])])
         self.npc_context.interaction = interaction
         loc = resolve_loc_safe(interaction, default_locale="pt", npc_context=self.npc_context)
 
@@ -25,25 +25,9 @@ from models.npc_modals.itens.consumivel import NPCAddItemConsumableModal
 from models.npc_modals.itens.aleatorio import NPCAddItemRandomModal
 from models.npc_modals.itens.carteira import NPCWalletModal
 from view.ficha_npc.npc_remove_item_view import NPCRemoveItemView
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback.
-    Se a chave não existir (t retorna a própria key), usa o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
 
 class NPCInventoryView(discord.ui.View):
     def __init__(self, npc_context: NPCContext):
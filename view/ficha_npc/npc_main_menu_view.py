@@ -19,26 +19,9 @@
 import discord
 from utils.npc_utils import NPCContext
 from view.ficha_npc.npc_submenu import NPCMainMenuView
-import os
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback.
-    Se a chave não existir (t retorna a própria key), usa o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
 
 class CreateNPCModal(discord.ui.Modal):
     def __init__(self, guild_id: int, mestre_id: int, locale: str = "pt"):
@@ -61,8 +44,8 @@ class CreateNPCModal(discord.ui.Modal):
         loc = resolve_locale(interaction, fallback=self._loc)
 
         npc_name = self.npc_name_input.value.strip()
-        npc_path = NPCContext.get_npc_path(self.guild_id, self.mestre_id, npc_name)
-        if os.path.exists(npc_path):
+        context = NPCContext(self.guild_id, self.mestre_id, npc_name)
+        if context.exists():
             msg = _tr(
                 "npc.select.create.duplicate",
                 loc,
@@ -72,7 +55,6 @@ class CreateNPCModal(discord.ui.Modal):
             await interaction.response.send_message(msg, ephemeral=True)
             return
 
-        context = NPCContext(self.guild_id, self.mestre_id, npc_name)
         context.save({"nome": npc_name, "visivel_para_players": False})
 
         view = NPCMainMenuView(npc_context=context)
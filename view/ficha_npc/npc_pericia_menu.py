@@ -19,25 +19,9 @@
 import discord
 from utils.npc_utils import NPCContext
 from models.npc_modals.info_combate.npc_skill_edit_modal import NPCSkillEditModal
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para usar i18n.t com fallback.
-  Se a chave não existir (t retorna a própria key), usa o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class NPCSkillManagementView(discord.ui.View):
   def __init__(self, npc_context: NPCContext):
@@ -17,26 +17,12 @@
 # exclusive property of the author.
 
 import discord
+from utils import sheet_patch
 from utils.npc_utils import NPCContext
-from utils.i18n import t as t_raw
+from utils.storage import store
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para usar i18n.t com fallback.
-  Se a chave não existir (t retorna a própria key), usa o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class NPCLinkSkillAttributeView(discord.ui.View):
   def __init__(self, npc_context: NPCContext):
@@ -114,9 +100,10 @@ class NPCLinkSkillAttributeView(discord.ui.View):
         return
 
       selected_attribute = self.values[0]
-      npc_data = self.parent_view.npc_context.load()
-      npc_data["pericias"][self.parent_view.selected_skill] = selected_attribute
-      self.parent_view.npc_context.save(npc_data)
+      await store.patch_npc(
+        self.parent_view.npc_context,
+        [sheet_patch.set_path(("pericias", self.parent_view.selected_skill), selected_attribute)]
+      )
 
       success = _tr(
         "npc.skill_attr.link.success",
@@ -18,25 +18,10 @@
 
 import discord
 from utils.npc_utils import NPCContext
-from utils.i18n import t as t_raw
+from utils.storage import store
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para usar i18n.t com fallback.
-  Se a chave não existir (t retorna a própria key), usa o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class NPCRemoveAttackView(discord.ui.View):
   def __init__(self, npc_context: NPCContext, previous_view: discord.ui.View):
@@ -100,18 +85,17 @@ class NPCRemoveAttackView(discord.ui.View):
     async def callback(self, interaction: discord.Interaction):
       skills_to_remove = self.view.children[0].values
 
-      npc_data = self.view.npc_context.load()
-
-      npc_data["ataques"] = [
-        ataque for ataque in npc_data.get("ataques", [])
-        if ataque["nome"] not in skills_to_remove
-      ]
-      npc_data["magias"] = [
-        magia for magia in npc_data.get("magias", [])
-        if magia["nome"] not in skills_to_remove
-      ]
-
-      self.view.npc_context.save(npc_data)
+      def _apply(npc_data: dict):
+        npc_data["ataques"] = [
+          ataque for ataque in npc_data.get("ataques", [])
+          if ataque["nome"] not in skills_to_remove
+        ]
+        npc_data["magias"] = [
+          magia for magia in npc_data.get("magias", [])
+          if magia["nome"] not in skills_to_remove
+        ]
+
+      await store.update_npc(self.view.npc_context, _apply)
 
       loc = resolve_locale(
         interaction,
@@ -18,25 +18,10 @@
 
 import discord
 from utils.npc_utils import NPCContext
-from utils.i18n  import t as t_raw
+from utils.storage import store
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para usar i18n.t com fallback.
-  Se a chave não existir (t retorna a própria key), usa o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 def _cat_display(cat: str, loc: str) -> str:
   mapping = {
     "combate":   _tr("npc.inv.cat.combat",     loc, "Combate"),
@@ -102,20 +87,21 @@ class NPCRemoveItemView(discord.ui.View):
     async def callback(self, interaction: discord.Interaction):
       from view.ficha_npc.npc_itens import NPCInventoryView
       items_to_remove = self.view.children[0].values
-      npc_data = self.view.npc_context.load()
-      inventario = npc_data.setdefault("inventario", {})
-      removed_count = 0
-      for item_info in items_to_remove:
-        category, name = item_info.split('|', 1)
-        if category in inventario:
-          original_len = len(inventario[category])
-          inventario[category] = [
-            item for item in inventario[category]
-            if item["nome"] != name
-          ]
-          removed_count += original_len - len(inventario[category])
-
-      self.view.npc_context.save(npc_data)
+      def _apply(npc_data: dict) -> int:
+        inventario = npc_data.setdefault("inventario", {})
+        removed_count = 0
+        for item_info in items_to_remove:
+          category, name = item_info.split('|', 1)
+          if category in inventario:
+            original_len = len(inventario[category])
+            inventario[category] = [
+              item for item in inventario[category]
+              if item["nome"] != name
+            ]
+            removed_count += original_len - len(inventario[category])
+        return removed_count
+
+      removed_count = await store.update_npc(self.view.npc_context, _apply)
       view = NPCInventoryView(npc_context=self.view.npc_context)
       loc = resolve_locale(interaction) or self._loc
 
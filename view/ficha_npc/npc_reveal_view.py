@@ -17,28 +17,14 @@
 # exclusive property of the author.
 
 import discord
+from utils import sheet_patch
 from utils.npc_utils import NPCContext
+from utils.storage import store
 from utils.embed_utils import create_npc_summary_embed
 from view.ficha_npc.gm_npc_sheet_view import GMNPCSheetView
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para usar i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class NPCRevealView(discord.ui.View):
   def __init__(self, npc_context: NPCContext):
@@ -48,9 +34,11 @@ class NPCRevealView(discord.ui.View):
   @discord.ui.button(label="👁️ Revelar no Chat", style=discord.ButtonStyle.success, custom_id="npc:reveal:reveal")
   async def reveal_npc(self, interaction: discord.Interaction, button: discord.ui.Button):
     # Atualiza visibilidade e envia o resumo no canal
-    npc_data = self.npc_context.load()
-    npc_data["visivel_para_players"] = True
-    self.npc_context.save(npc_data)
+    def _reveal(npc_data: dict) -> dict:
+      npc_data["visivel_para_players"] = True
+      return npc_data
+
+    npc_data = await store.update_npc(self.npc_context, _reveal)
 
     embed = create_npc_summary_embed(npc_data)
     await interaction.channel.send(embed=embed)
@@ -66,9 +54,7 @@ class NPCRevealView(discord.ui.View):
 
   @discord.ui.button(label="🔒 Ocultar dos Jogadores", style=discord.ButtonStyle.danger, custom_id="npc:reveal:hide")
   async def hide_npc(self, interaction: discord.Interaction, button: discord.ui.Button):
-    npc_data = self.npc_context.load()
-    npc_data["visivel_para_players"] = False
-    self.npc_context.save(npc_data)
+    await store.patch_npc(self.npc_context, [sheet_patch.set_path("visivel_para_players", False)])
 
     loc = resolve_locale(
       interaction,
@@ -18,27 +18,12 @@
 
 import re
 import discord
-from utils import npc_utils, rpg_rules
+from utils import npc_utils, rpg_rules, sheet_patch
+from utils.storage import store
 from models.npc_modals.info_combate.npc_skill_edit_modal import NPCSkillEditModal
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback seguro.
-    Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
 
 def resolve_loc_safe(
     interaction: discord.Interaction,
@@ -202,10 +187,10 @@ class NPCAttributeLinkView(discord.ui.View):
 
         async def callback(self, interaction: discord.Interaction):
             selected_attribute = self.values[0]
-            npc_data = self.view.npc_context.load()
-            pericias = npc_data.setdefault("pericias", {})
-            pericias[self.view.skill_name] = {"atributo_base": selected_attribute, "bonus": self.view.skill_bonus}
-            self.view.npc_context.save(npc_data)
+            await store.patch_npc(self.view.npc_context, [sheet_patch.set_path(
+                ("pericias", self.view.skill_name),
+                {"atributo_base": selected_attribute, "bonus": self.view.skill_bonus}
+            )])
 
             # Mensagem de sucesso traduzida (assinatura correta)
             loc = resolve_loc_safe(interaction, default_locale=self._loc, npc_context=self.view.npc_context)
@@ -255,10 +240,11 @@ class NPCRemoveSkillView(discord.ui.View):
 
         async def callback(self, interaction: discord.Interaction):
             skills_to_remove = self.view.children[0].values
-            npc_data = self.view.npc_context.load()
-            for skill in skills_to_remove:
-                npc_data["pericias"].pop(skill, None)
-            self.view.npc_context.save(npc_data)
+            def _apply(npc_data: dict):
+                for skill in skills_to_remove:
+                    npc_data.get("pericias", {}).pop(skill, None)
+
+            await store.update_npc(self.view.npc_context, _apply)
 
             view = NPCSkillManagementView(npc_context=self.view.npc_context)
             new_embed = view.create_embed()
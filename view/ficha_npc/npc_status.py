@@ -24,27 +24,10 @@ from models.npc_modals.satus_modais.alianca import NPCAllianceModal
 from models.npc_modals.satus_modais.objetivos import NPCObjectivesModal
 from models.npc_modals.satus_modais.personalidade import NPCPersonalityModal
 from models.npc_modals.satus_modais.extras import NPCExtrasModal
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback seguro.
-    Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
-
 class NPCStatusCondicoesView(discord.ui.View):
     def __init__(self, npc_context: NPCContext):
         super().__init__(timeout=None)
@@ -24,25 +24,9 @@ from view.ficha_npc.npc_itens import NPCInventoryView
 from view.ficha_npc.npc_status import NPCStatusCondicoesView
 from view.ficha_npc.npc_config_avancada import NPCConfigAvancadasView
 from view.ficha_npc.npc_skill_management_view import NPCSkillManagementView
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback seguro.
-    Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
 
 class NPCMainMenuView(discord.ui.View):
     def __init__(self, npc_context):
@@ -17,28 +17,12 @@
 # exclusive property of the author.
 
 import discord
-from utils import npc_utils, rpg_rules
-from utils.i18n import t as t_raw
+from utils import npc_utils, rpg_rules, sheet_patch
+from utils.storage import store
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback seguro.
-    Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
-
 class NPCSystemSelect(discord.ui.Select):
     def __init__(self, npc_context: npc_utils.NPCContext):
         self.npc_context = npc_context
@@ -77,9 +61,7 @@ class NPCSystemSelect(discord.ui.Select):
         )
 
         selected_system = self.values[0]
-        npc_data = self.npc_context.load()
-        npc_data.setdefault("informacoes_basicas", {})["sistema_rpg"] = selected_system
-        self.npc_context.save(npc_data)
+        await store.patch_npc(self.npc_context, [sheet_patch.set_path(("informacoes_basicas", "sistema_rpg"), selected_system)])
 
         view = NPCMainMenuView(npc_context=self.npc_context)
 
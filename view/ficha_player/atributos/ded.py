@@ -19,25 +19,9 @@
 import discord
 from models.player_modals.atributos_modais.ded_atributos.atributos_fisicos import PlayerAtributosFisicosModal
 from models.player_modals.atributos_modais.ded_atributos.atributos_mentais import PlayerAtributosMentaisModal
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para usar i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class PlayerDeAtributosView(discord.ui.View):
   def __init__(self, user: discord.User):
@@ -20,6 +20,7 @@ import discord
 from models.player_modals.atributos_modais.vampiro.atributos_fisicos import VampiroAtributosFisicosModal
 from models.player_modals.atributos_modais.vampiro.atributos_mentais import VampiroAtributosMentaisModal
 from models.player_modals.atributos_modais.vampiro.atributos_sociais import VampiroAtributosSociaisModal
+from models.player_modals.atributos_modais.vampiro.fome import VampiroFomeModal
 
 class PlayerVampiroAtributosView(discord.ui.View):
   def __init__(self, user: discord.User):
@@ -38,7 +39,11 @@ class PlayerVampiroAtributosView(discord.ui.View):
   async def mentais(self, interaction: discord.Interaction, button: discord.ui.Button):
     await interaction.response.send_modal(VampiroAtributosMentaisModal(interaction))
 
+  @discord.ui.button(label="🩸 Fome", style=discord.ButtonStyle.danger)
+  async def fome(self, interaction: discord.Interaction, button: discord.ui.Button):
+    await interaction.response.send_modal(VampiroFomeModal(interaction))
+
   @discord.ui.button(label="🔙 Voltar", style=discord.ButtonStyle.danger)
   async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
     from view.ficha_player.player_attributes_menu import PlayerAtributosMenuView
-    await interaction.response.edit_message(content="🎮 Menu Principal do Player", view=PlayerAtributosMenuView(user=self.user))
\ No newline at end of file
+    await interaction.response.edit_message(content="🎮 Menu Principal do Player", view=PlayerAtributosMenuView(user=self.user))
\ No newline at end of file
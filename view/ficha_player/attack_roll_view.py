@@ -18,26 +18,12 @@
 
 import discord
 import re
-from utils import player_utils, rpg_rules, dice_roller
-from utils.i18n import t as t_raw
+from utils import player_utils, rpg_rules, dice_roller, sheet_versions
+from utils.storage import store
+from utils.dice_executor import DiceRejected
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para usar i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class AttackRollView(discord.ui.View):
   def __init__(self, user: discord.User):
@@ -81,14 +67,22 @@ class AttackRollView(discord.ui.View):
       await interaction.followup.send(msg, ephemeral=True)
       return
 
-    self.ficha = player_utils.load_player_sheet(self.character_name)
+    if sheet_versions.is_stale(player_utils.player_sheet_id(self.character_name), self.ficha):
+      self.ficha = await store.get_player(self.character_name)
 
     try:
       roll_results = await dice_roller.execute_attack_roll(
         ficha=self.ficha,
         selected_attack=self.selected_attack,
-        advantage_state=self.advantage_state
+        advantage_state=self.advantage_state,
+        user_id=interaction.user.id,
+        channel_id=interaction.channel_id,
+        guild_id=interaction.guild_id
       )
+    except DiceRejected:
+      busy = _tr("roll.free.busy", loc, "⏳ Muitas rolagens ao mesmo tempo. Tente de novo em instantes.")
+      await interaction.followup.send(busy, ephemeral=True)
+      return
     except Exception as e:
       err = _tr("player.attack.error", loc, "❌ Ocorreu um erro crítico ao calcular a rolagem. Verifique o console.")
       await interaction.followup.send(err, ephemeral=True)
@@ -18,25 +18,9 @@
 
 import discord
 from models.player_modals.player_basic_modal import PlayerModalBase
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class LearnSkillsModal(PlayerModalBase):
   def __init__(self, interaction: discord.Interaction):
@@ -65,7 +49,7 @@ class LearnSkillsModal(PlayerModalBase):
       if pericia not in pericias_atuais:
         pericias_atuais[pericia] = "N/A"
 
-    self.save()
+    await self.save()
 
     loc = resolve_locale(interaction, fallback=self._loc)
     msg = _tr(
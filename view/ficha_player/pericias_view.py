@@ -17,26 +17,12 @@
 # exclusive property of the author.
 
 import discord
-from utils.player_utils import load_player_sheet, save_player_sheet
-from utils.i18n import t as t_raw
+from utils import sheet_patch
+from utils.player_utils import load_player_sheet
+from utils.storage import store
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class LinkSkillAttributeView(discord.ui.View):
   def __init__(self, user: discord.User):
@@ -109,9 +95,10 @@ class LinkSkillAttributeView(discord.ui.View):
         return
 
       selected_attribute = self.values[0]
-      ficha = load_player_sheet(self.parent_view.character_name)
-      ficha["pericias"][self.parent_view.selected_skill] = selected_attribute
-      save_player_sheet(self.parent_view.character_name, ficha)
+      await store.patch_player(
+        self.parent_view.character_name,
+        [sheet_patch.set_path(("pericias", self.parent_view.selected_skill), selected_attribute)]
+      )
 
       msg = _tr(
         "player.linkskill.success",
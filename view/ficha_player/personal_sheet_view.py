@@ -17,26 +17,24 @@
 # exclusive property of the author.
 
 import discord
-from utils import player_utils
-from utils.i18n import t as t_raw
+from utils import i18n, player_utils, sheet_versions
+from utils.storage import store
+from utils.embed_cache import embed_cache
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
+# custom_id do botão -> chave do rótulo; os textos padrão são registrados uma vez aqui.
+_SECTION_LABELS = {
+  "player:sheet:general": ("player.sheet.btn.general", "Geral"),
+  "player:sheet:attributes": ("player.sheet.btn.attributes", "Atributos"),
+  "player:sheet:combat": ("player.sheet.btn.combat", "Combate"),
+  "player:sheet:abilities": ("player.sheet.btn.abilities", "Habilidades"),
+  "player:sheet:inventory": ("player.sheet.btn.inventory", "Inventário"),
+  "player:sheet:roleplay": ("player.sheet.btn.roleplay", "Roleplay"),
+  "player:sheet:skills": ("player.sheet.btn.skills", "Perícias"),
+  "player:sheet:pets": ("player.sheet.btn.pets", "Pets"),
+}
+i18n.register_fallbacks(dict(_SECTION_LABELS.values()))
 
 class PersonalSheetView(discord.ui.View):
   def __init__(self, user: discord.User):
@@ -45,29 +43,31 @@ class PersonalSheetView(discord.ui.View):
     self.current_section = "geral"
     self._loc = "pt"
 
+    tr = i18n.bind(self._loc)
     for item in self.children:
-      if isinstance(item, discord.ui.Button):
-        if item.custom_id == "player:sheet:general":
-          item.label = _tr("player.sheet.btn.general", self._loc, "Geral")
-        elif item.custom_id == "player:sheet:attributes":
-          item.label = _tr("player.sheet.btn.attributes", self._loc, "Atributos")
-        elif item.custom_id == "player:sheet:combat":
-          item.label = _tr("player.sheet.btn.combat", self._loc, "Combate")
-        elif item.custom_id == "player:sheet:abilities":
-          item.label = _tr("player.sheet.btn.abilities", self._loc, "Habilidades")
-        elif item.custom_id == "player:sheet:inventory":
-          item.label = _tr("player.sheet.btn.inventory", self._loc, "Inventário")
-        elif item.custom_id == "player:sheet:roleplay":
-          item.label = _tr("player.sheet.btn.roleplay", self._loc, "Roleplay")
-        elif item.custom_id == "player:sheet:skills":
-          item.label = _tr("player.sheet.btn.skills", self._loc, "Perícias")
-        elif item.custom_id == "player:sheet:pets":
-          item.label = _tr("player.sheet.btn.pets", self._loc, "Pets")
+      label = _SECTION_LABELS.get(getattr(item, "custom_id", None))
+      if label:
+        item.label = tr(label[0])
 
   async def create_embed(self) -> discord.Embed:
     character_name = f"{self.user.id}_{self.user.name.lower()}"
-    ficha = player_utils.load_player_sheet(character_name)
+    # Troca de aba numa ficha que não mudou não lê a ficha nem monta campos.
+    sheet_id = player_utils.player_sheet_id(character_name)
+    ficha = None
+    if not sheet_versions.current(sheet_id):
+      # Versão ainda não vista neste processo: a leitura registra a gravada antes de montar a chave.
+      ficha = await store.get_player(character_name)
+    key = embed_cache.key(sheet_id, self.current_section, self._loc, "owner",
+                          self.user.display_name, str(self.user.display_avatar.url), str(getattr(self.user, "color", "")))
+    embed = embed_cache.get(key)
+    if embed is None:
+      if ficha is None:
+        ficha = await store.get_player(character_name)
+      embed = self._build_embed(ficha)
+      embed_cache.put(key, embed)
+    return embed
 
+  def _build_embed(self, ficha: dict) -> discord.Embed:
     title = _tr("player.sheet.title", self._loc, "Ficha de {name}", name=self.user.display_name)
     embed = discord.Embed(title=title, color=getattr(self.user, "color", discord.Color.blurple()))
 
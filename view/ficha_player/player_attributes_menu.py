@@ -23,25 +23,9 @@ from view.ficha_player.atributos.vampiro import PlayerVampiroAtributosView
 from view.ficha_player.atributos.ordem import OrdemMenu
 from view.ficha_player.atributos.cyberpunk import CyberpunkMenu
 from view.ficha_player.atributos.skifall import PlayerSkifallAtributosView
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class PlayerAtributosMenuView(discord.ui.View):
   def __init__(self, user: discord.User):
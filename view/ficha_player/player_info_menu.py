@@ -20,25 +20,9 @@ import discord
 from models.player_modals.info_basicas.info_basicas import PlayerBasicInfoModal
 from models.player_modals.info_basicas.info_gerais import PlayerGeneralInfoModal
 from models.player_modals.info_basicas.info_extras import PlayerExtraInfoModal
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class PlayerInfoMenuView(discord.ui.View):
     def __init__(self, user: discord.User):
@@ -23,27 +23,10 @@ from models.player_modals.info_combate.spell_builder_view import SpellBuilderVie
 from models.player_modals.info_combate.remove_attack_view import RemoveAttackView
 from models.player_modals.info_combate.info_combate_modal import PlayerCombatInfoModal
 from models.player_modals.info_combate.info_deslocamento import PlayerMovementInfoModal
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
-
 class PlayerAtaquesMenuView(discord.ui.View):
     def __init__(self, user: discord.User):
         super().__init__(timeout=None)
@@ -18,27 +18,12 @@
 
 import discord
 from utils import player_utils
+from utils.storage import store
 from models.player_modals.skills.skill_edit_modal import SkillEditModal
-from utils import rpg_rules
-from utils.i18n import t as t_raw
+from utils import rpg_rules, sheet_patch
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
 
 class SkillManagementView(discord.ui.View):
   def __init__(self, user: discord.User):
@@ -174,10 +159,11 @@ class RemoveSkillView(discord.ui.View):
         loc = resolve_locale(interaction, fallback="pt")
 
       skills_to_remove = self.view.children[0].values
-      ficha = player_utils.load_player_sheet(self.view.character_name)
-      for skill in skills_to_remove:
-        ficha["pericias"].pop(skill, None)
-      player_utils.save_player_sheet(self.view.character_name, ficha)
+      def _apply(ficha: dict):
+        for skill in skills_to_remove:
+          ficha.get("pericias", {}).pop(skill, None)
+
+      await store.update_player(self.view.character_name, _apply)
 
       view = SkillManagementView(user=self.view.user)
       view._loc = loc
@@ -230,15 +216,10 @@ class AttributeLinkView(discord.ui.View):
       selected_attribute = self.values[0]
 
       character_name = f"{self.view.user.id}_{self.view.user.name.lower()}"
-      ficha = player_utils.load_player_sheet(character_name)
-      pericias = ficha.setdefault("pericias", {})
-
-      pericias[self.view.skill_name] = {
+      await store.patch_player(character_name, [sheet_patch.set_path(("pericias", self.view.skill_name), {
         "atributo_base": selected_attribute,
         "bonus": self.view.skill_bonus
-      }
-
-      player_utils.save_player_sheet(character_name, ficha)
+      })])
 
       from view.ficha_player.precicias_intermedio_view import SkillManagementView
       view = SkillManagementView(user=self.view.user)
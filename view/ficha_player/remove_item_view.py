@@ -18,27 +18,11 @@
 
 import discord
 from utils import player_utils
-from utils.i18n import t as t_raw
+from utils.storage import store
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
-
 class RemoveItemView(discord.ui.View):
   def __init__(self, user: discord.User, category: str, category_name: str, modal_class):
     super().__init__(timeout=180)
@@ -94,15 +78,16 @@ class RemoveItemView(discord.ui.View):
       loc = resolve_locale(interaction, fallback=getattr(self.view, "_loc", "pt"))
 
       items_to_remove = self.view.children[0].values
-      ficha = player_utils.load_player_sheet(self.view.character_name)
+      category = self.view.category
 
-      if self.view.category in ficha.get("inventario", {}):
-        ficha["inventario"][self.view.category] = [
-          item for item in ficha["inventario"][self.view.category]
-          if item["nome"] not in items_to_remove
-        ]
+      def _apply(ficha: dict):
+        if category in ficha.get("inventario", {}):
+          ficha["inventario"][category] = [
+            item for item in ficha["inventario"][category]
+            if item["nome"] not in items_to_remove
+          ]
 
-      player_utils.save_player_sheet(self.view.character_name, ficha)
+      await store.update_player(self.view.character_name, _apply)
 
       view = PlayerInventarioMenuView(user=self.view.user)
       removed_msg = _tr(
@@ -17,7 +17,8 @@
 # exclusive property of the author.
 
 import discord
-from utils import player_utils, rpg_rules
+from utils import player_utils, rpg_rules, sheet_patch
+from utils.storage import store
 
 class SystemSelect(discord.ui.Select):
   def __init__(self, user: discord.User):
@@ -36,9 +37,7 @@ class SystemSelect(discord.ui.Select):
     from view.ficha_player.ficha_player_menu import PlayerMainMenuView
     await interaction.response.defer()
     selected_system = self.values[0]
-    ficha = player_utils.load_player_sheet(self.character_name)
-    ficha.setdefault("informacoes_basicas", {})["sistema_rpg"] = selected_system
-    player_utils.save_player_sheet(self.character_name, ficha)
+    await store.patch_player(self.character_name, [sheet_patch.set_path(("informacoes_basicas", "sistema_rpg"), selected_system)])
     view = PlayerMainMenuView(user=self.user)
     await interaction.edit_original_response(
       content=f"✅ Sistema da ficha alterado para **{rpg_rules.SUPPORTED_SYSTEMS[selected_system]}**!\n\n"
@@ -55,4 +54,4 @@ class SystemSelectView(discord.ui.View):
   async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
     from view.ficha_player.ficha_player_menu import PlayerMainMenuView
     view = PlayerMainMenuView(user=self.user)
-    await interaction.response.edit_message(content="🎮 Menu Principal do Player", view=view)
\ No newline at end of file
+    await interaction.response.edit_message(content="🎮 Menu Principal do Player", view=view)
\ No newline at end of file
@@ -18,26 +18,11 @@
 
 import discord
 from utils.npc_utils import NPCContext
+from utils.storage import store
 from models.shared_models.add_pet_modal import AddPetModal
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback seguro.
-    Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
 
 class NPCPetSelectorView(discord.ui.View):
     def __init__(self, guild_id: int, mestre_id: int, *, locale: str | None = None):
@@ -98,10 +83,10 @@ class NPCPetSelectorView(discord.ui.View):
                     pass
                 return
 
-            npc_data = npc_context.load()
-            pets_list = npc_data.setdefault("pets", [])
-            pets_list.append(modal.pet_data)
-            npc_context.save(npc_data)
+            await store.update_npc(
+                npc_context,
+                lambda npc_data: npc_data.setdefault("pets", []).append(modal.pet_data)
+            )
 
             msg = _tr(
                 "npc.pet.add.done",
@@ -17,26 +17,12 @@
 # exclusive property of the author.
 
 import discord
-from utils import player_utils
-from utils.i18n import t as t_raw
+from utils import player_utils, sheet_versions
+from utils.storage import store
+from utils.embed_cache import embed_cache
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback seguro.
-    Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
-
 
 class PublicSheetView(discord.ui.View):
     def __init__(self, user_to_view: discord.User):
@@ -57,8 +43,23 @@ class PublicSheetView(discord.ui.View):
 
     async def create_embed(self) -> discord.Embed:
         character_name = f"{self.user_to_view.id}_{self.user_to_view.name.lower()}"
-        ficha = player_utils.load_player_sheet(character_name)
+        user = self.user_to_view
+        sheet_id = player_utils.player_sheet_id(character_name)
+        ficha = None
+        if not sheet_versions.current(sheet_id):
+            # Primeira leitura desta ficha no processo: observa a versão antes de montar a chave.
+            ficha = await store.get_player(character_name)
+        key = embed_cache.key(sheet_id, self.current_section, self._loc, "public",
+                              user.display_name, str(user.display_avatar.url), str(getattr(user, "color", "")))
+        embed = embed_cache.get(key)
+        if embed is None:
+            if ficha is None:
+                ficha = await store.get_player(character_name)
+            embed = self._build_embed(ficha)
+            embed_cache.put(key, embed)
+        return embed
 
+    def _build_embed(self, ficha: dict) -> discord.Embed:
         title = _tr("public.sheet.title", self._loc, "Ficha de {name}", name=self.user_to_view.display_name)
         embed = discord.Embed(title=title, color=getattr(self.user_to_view, "color", discord.Color.blurple()))
         embed.set_thumbnail(url=self.user_to_view.display_avatar.url)
@@ -20,25 +20,11 @@ import discord
 import re
 from view.ficha_player.attack_roll_view import AttackRollView
 from view.rolling.attribute_check_view import AttributeCheckView
-from utils import player_utils, dice_roller
-from utils.i18n import t as t_raw
+from utils import dice_roller
+from utils.storage import store
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
-
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback seguro.
-    Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
+from utils.dice_executor import DiceRejected
 
 
 class DiceHubView(discord.ui.View):
@@ -83,7 +69,7 @@ class DiceHubView(discord.ui.View):
         loc = resolve_locale(interaction, fallback=self._loc)
 
         character_name = f"{self.user.id}_{self.user.name.lower()}"
-        ficha = player_utils.load_player_sheet(character_name)
+        ficha = await store.get_player(character_name)
         iniciativa_bonus = (ficha.get("informacoes_combate", {}).get("iniciativa") or "0").strip()
 
         def _norm_bonus(expr: str) -> str:
@@ -98,7 +84,14 @@ class DiceHubView(discord.ui.View):
             return f"1d20{suffix}"
 
         roll_string = _build_roll_string(iniciativa_bonus)
-        total, breakdown = await dice_roller.roll_dice(roll_string)
+        try:
+            result = await dice_roller.roll_dice(roll_string, user_id=interaction.user.id,
+                                                 channel_id=interaction.channel_id, guild_id=interaction.guild_id)
+        except DiceRejected:
+            busy = _tr("roll.free.busy", loc, "⏳ Muitas rolagens ao mesmo tempo. Tente de novo em instantes.")
+            await interaction.followup.send(busy, ephemeral=True)
+            return
+        total, breakdown = result
 
         title = _tr("player.initiative.title", loc, "⚡ Iniciativa de {name}", name=self.user.display_name)
         details_label = _tr("player.common.details", loc, "Detalhes")
@@ -109,6 +102,8 @@ class DiceHubView(discord.ui.View):
             color=discord.Color.green()
         )
         embed.add_field(name=details_label, value=f"`{breakdown}`", inline=False)
+        if result.ticket:
+            embed.set_footer(text=_tr("roll.free.ticket", loc, "🔁 Ticket {ticket}", ticket=result.ticket))
 
         class InitiativeAgainView(discord.ui.View):
             def __init__(self, roll_str: str, owner_name: str, locale: str):
@@ -119,7 +114,14 @@ class DiceHubView(discord.ui.View):
 
             @discord.ui.button(label="🔁 Rolar novamente", style=discord.ButtonStyle.secondary, custom_id="player:init:again")
             async def again(self, inter: discord.Interaction, btn: discord.ui.Button):
-                new_total, new_breakdown = await dice_roller.roll_dice(self.roll_str)
+                try:
+                    new_result = await dice_roller.roll_dice(self.roll_str, user_id=inter.user.id,
+                                                             channel_id=inter.channel_id, guild_id=inter.guild_id)
+                except DiceRejected:
+                    busy = _tr("roll.free.busy", self._loc, "⏳ Muitas rolagens ao mesmo tempo. Tente de novo em instantes.")
+                    await inter.response.send_message(busy, ephemeral=True)
+                    return
+                new_total, new_breakdown = new_result
                 title = _tr("player.initiative.title", self._loc, "⚡ Iniciativa de {name}", name=self.owner_name)
                 details_label = _tr("player.common.details", self._loc, "Detalhes")
 
@@ -129,6 +131,8 @@ class DiceHubView(discord.ui.View):
                     color=discord.Color.green()
                 )
                 new_embed.add_field(name=details_label, value=f"`{new_breakdown}`", inline=False)
+                if new_result.ticket:
+                    new_embed.set_footer(text=_tr("roll.free.ticket", self._loc, "🔁 Ticket {ticket}", ticket=new_result.ticket))
                 await inter.response.edit_message(embed=new_embed, view=self)
 
         await interaction.followup.send(
@@ -18,29 +18,13 @@
 
 import discord
 import re
-from utils import npc_utils, rpg_rules, dice_roller
+from utils import npc_utils, rpg_rules, dice_roller, sheet_versions
 from utils.npc_utils import NPCContext
-from utils.i18n import t as t_raw
+from utils.dice_executor import DiceRejected
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
 
 
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para usar i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
-
-
 class NPCAttackRollView(discord.ui.View):
   def __init__(self, npc_context: NPCContext):
     super().__init__(timeout=None)
@@ -87,12 +71,20 @@ class NPCAttackRollView(discord.ui.View):
       msg = _tr("npc.attack.need_selection", loc, "❌ Você precisa selecionar um ataque do NPC primeiro!")
       return await interaction.followup.send(msg, ephemeral=True)
 
-    self.npc_data = self.npc_context.load()
-    roll_results = await dice_roller.execute_attack_roll(
-      ficha=self.npc_data,
-      selected_attack=self.selected_attack,
-      advantage_state=self.advantage_state
-    )
+    if sheet_versions.is_stale(self.npc_context.sheet_id, self.npc_data):
+      self.npc_data = self.npc_context.load()
+    try:
+      roll_results = await dice_roller.execute_attack_roll(
+        ficha=self.npc_data,
+        selected_attack=self.selected_attack,
+        advantage_state=self.advantage_state,
+        user_id=interaction.user.id,
+        channel_id=interaction.channel_id,
+        guild_id=interaction.guild_id
+      )
+    except DiceRejected:
+      busy = _tr("roll.free.busy", loc, "⏳ Muitas rolagens ao mesmo tempo. Tente de novo em instantes.")
+      return await interaction.followup.send(busy, ephemeral=True)
     title_tpl = _tr(
       "npc.attack.title",
       loc,
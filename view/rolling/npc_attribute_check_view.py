@@ -18,27 +18,11 @@
 
 import discord
 import re
-from utils import npc_utils, rpg_rules, dice_roller
+from utils import npc_utils, rpg_rules, dice_roller, system_rolls
 from utils.npc_utils import NPCContext
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
-
-
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-  """
-  Wrapper para i18n.t com fallback seguro.
-  Se a chave não existir (t retorna a própria key), usa o fallback informado.
-  """
-  try:
-    text = t_raw(key, locale, **kwargs)
-  except Exception:
-    return fallback.format(**kwargs) if kwargs else fallback
-  if text == key:
-    try:
-      return fallback.format(**kwargs) if kwargs else fallback
-    except Exception:
-      return fallback
-  return text
+from utils.dice_executor import DiceRejected
 
 
 class NPCTempModifierModal(discord.ui.Modal):
@@ -212,10 +196,6 @@ class NPCAttributeCheckView(discord.ui.View):
         hit_dice_expression = "2d20kl1"
         advantage_text = _tr("npc.attr.disadv.text", resolve_locale(interaction, fallback=self._loc), "_(Desvantagem)_")
 
-      natural_roll, raw_d20_breakdown = await dice_roller.roll_dice(hit_dice_expression)
-      is_crit = (natural_roll == 20)
-      is_fumble = (natural_roll == 1)
-
       bonus_pericia = 0
       atributo_base_final = selected_name
 
@@ -239,14 +219,40 @@ class NPCAttributeCheckView(discord.ui.View):
                         or atributos_ficha.get(atributo_base_final.upper())
                         or "10")
 
-      modificador_atributo = rpg_rules.get_modifier(self.sistema, int(attr_score_str))
-
-      bonus_string = f"{modificador_atributo} + {bonus_pericia}"
-      if self.temp_modifier_str:
-        bonus_string += f" {self.temp_modifier_str}"
-
-      bonus_total, _ = await dice_roller.roll_dice(bonus_string)
-      resultado_final = natural_roll + bonus_total
+      try:
+        engine = system_rolls.get_engine(self.sistema)
+        if engine is not None:
+          rolagem = await system_rolls.roll_check(engine, self.npc_data, int(attr_score_str), bonus_pericia,
+                                                  self.advantage_state, self.temp_modifier_str,
+                                                  locale=resolve_locale(interaction, fallback=self._loc),
+                                                  user_id=interaction.user.id, channel_id=interaction.channel_id,
+                                                  guild_id=interaction.guild_id)
+          resultado_final, is_crit, is_fumble = rolagem.total, rolagem.is_crit, rolagem.is_fumble
+          details_value = rolagem.breakdown
+          ticket_text = _tr("roll.system.ticket", self._loc, "🔁 Ticket {ticket} · {spec}", ticket=rolagem.ticket, spec=rolagem.spec)
+        else:
+          natural = await dice_roller.roll_dice(hit_dice_expression, user_id=interaction.user.id,
+                                                channel_id=interaction.channel_id, guild_id=interaction.guild_id)
+          natural_roll, raw_d20_breakdown = natural
+          ticket_text = _tr("roll.free.ticket", self._loc, "🔁 Ticket {ticket}", ticket=natural.ticket) if natural.ticket else None
+          is_crit = (natural_roll == 20)
+          is_fumble = (natural_roll == 1)
+          modificador_atributo = rpg_rules.get_modifier(self.sistema, int(attr_score_str))
+
+          bonus_string = f"{modificador_atributo} + {bonus_pericia}"
+          if self.temp_modifier_str:
+            bonus_string += f" {self.temp_modifier_str}"
+
+          bonus_total, _ = await dice_roller.roll_dice(
+            bonus_string, user_id=interaction.user.id, channel_id=interaction.channel_id,
+            guild_id=interaction.guild_id)
+          resultado_final = natural_roll + bonus_total
+          details_value = _tr("npc.attr.embed.details.value", self._loc, "{breakdown} + Bônus({bonus}) = **{total}**",
+                              breakdown=raw_d20_breakdown, bonus=bonus_total, total=resultado_final)
+      except DiceRejected:
+        busy = _tr("roll.free.busy", resolve_locale(interaction, fallback=self._loc), "⏳ Muitas rolagens ao mesmo tempo. Tente de novo em instantes.")
+        await interaction.followup.send(busy, ephemeral=True)
+        return
 
       title = _tr("npc.attr.embed.title", resolve_locale(interaction, fallback=self._loc), "🛡️ Teste de {sel} para {npc}", sel=selected_name, npc=self.npc_context.npc_name)
       embed = discord.Embed(title=title, description=f"## {resultado_final}", color=discord.Color.dark_orange())
@@ -264,9 +270,9 @@ class NPCAttributeCheckView(discord.ui.View):
       )
 
       details_label = _tr("npc.attr.embed.details", self._loc, "Detalhes {adv}", adv=advantage_text)
-      details_value = _tr("npc.attr.embed.details.value", self._loc, "{breakdown} + Bônus({bonus}) = **{total}**",
-                          breakdown=raw_d20_breakdown, bonus=bonus_total, total=resultado_final)
       embed.add_field(name=details_label, value=details_value)
+      if ticket_text:
+        embed.set_footer(text=ticket_text)
 
       await interaction.followup.send(embed=embed)
 
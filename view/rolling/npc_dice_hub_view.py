@@ -23,24 +23,9 @@ from view.rolling.npc_attack_roll_view import NPCAttackRollView
 from view.rolling.npc_attribute_check_view import NPCAttributeCheckView
 from models.shared_models.simple_roll_modal import SimpleRollModal
 from utils import dice_roller
-from utils.i18n import t as t_raw
+from utils.i18n import translate as _tr
 from utils.locale_resolver import resolve_locale
-
-def _tr(key: str, locale: str, fallback: str, **kwargs) -> str:
-    """
-    Wrapper para usar i18n.t com fallback seguro.
-    Se a chave não existir (t retorna a própria key), usamos o fallback informado.
-    """
-    try:
-        text = t_raw(key, locale, **kwargs)
-    except Exception:
-        return fallback.format(**kwargs) if kwargs else fallback
-    if text == key:
-        try:
-            return fallback.format(**kwargs) if kwargs else fallback
-        except Exception:
-            return fallback
-    return text
+from utils.dice_executor import DiceRejected
 
 
 class NPCDiceHubView(discord.ui.View):
@@ -122,7 +107,14 @@ class NPCDiceHubView(discord.ui.View):
             return f"1d20{suffix}"
 
         roll_string = _build_roll_string(iniciativa_bonus)
-        total, breakdown = await dice_roller.roll_dice(roll_string)
+        try:
+            result = await dice_roller.roll_dice(roll_string, user_id=interaction.user.id,
+                                                 channel_id=interaction.channel_id, guild_id=interaction.guild_id)
+        except DiceRejected:
+            busy = _tr("roll.free.busy", loc, "⏳ Muitas rolagens ao mesmo tempo. Tente de novo em instantes.")
+            await interaction.followup.send(busy, ephemeral=True)
+            return
+        total, breakdown = result
 
         title = _tr("npc.initiative.title", loc, "⚡ Iniciativa de {name}", name=self.npc_context.npc_name)
         details_label = _tr("npc.common.details", loc, "Detalhes")
@@ -134,6 +126,8 @@ class NPCDiceHubView(discord.ui.View):
             color=discord.Color.dark_green()
         )
         embed.add_field(name=details_label, value=f"`{breakdown}`", inline=False)
+        if result.ticket:
+            embed.set_footer(text=_tr("roll.free.ticket", loc, "🔁 Ticket {ticket}", ticket=result.ticket))
         embed.set_author(name=rolled_by, icon_url=interaction.user.display_avatar.url)
 
         class NPCInitiativeAgainView(discord.ui.View):
@@ -145,7 +139,14 @@ class NPCDiceHubView(discord.ui.View):
 
             @discord.ui.button(label="🔁 Rolar novamente", style=discord.ButtonStyle.secondary, custom_id="npc:init:again")
             async def again(self, inter: discord.Interaction, btn: discord.ui.Button):
-                new_total, new_breakdown = await dice_roller.roll_dice(self.roll_str)
+                try:
+                    new_result = await dice_roller.roll_dice(self.roll_str, user_id=inter.user.id,
+                                                             channel_id=inter.channel_id, guild_id=inter.guild_id)
+                except DiceRejected:
+                    busy = _tr("roll.free.busy", self._loc, "⏳ Muitas rolagens ao mesmo tempo. Tente de novo em instantes.")
+                    await inter.response.send_message(busy, ephemeral=True)
+                    return
+                new_total, new_breakdown = new_result
                 title = _tr("npc.initiative.title", self._loc, "⚡ Iniciativa de {name}", name=self.npc_name)
                 details_label = _tr("npc.common.details", self._loc, "Detalhes")
                 rolled_by = _tr("npc.attack.rolled_by", self._loc, "Rolado por {user}", user=inter.user.display_name)
@@ -156,6 +157,8 @@ class NPCDiceHubView(discord.ui.View):
                     color=discord.Color.dark_green()
                 )
                 new_embed.add_field(name=details_label, value=f"`{new_breakdown}`", inline=False)
+                if new_result.ticket:
+                    new_embed.set_footer(text=_tr("roll.free.ticket", self._loc, "🔁 Ticket {ticket}", ticket=new_result.ticket))
                 new_embed.set_author(name=rolled_by, icon_url=inter.user.display_avatar.url)
                 await inter.response.edit_message(embed=new_embed, view=self)
 